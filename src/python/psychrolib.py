@@ -42,9 +42,23 @@ Note from the Authors
 """
 
 
+import bisect
+import hashlib
+import importlib
+import inspect
 import math
-from enum import Enum, auto
-from typing import Optional
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum, IntFlag, auto
+from functools import lru_cache
+from typing import Callable, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy is only required by the array functions, the scalar functions do not use it
+    np = None
 
 
 #######################################################################################################
@@ -146,6 +160,21 @@ PSYCHROLIB_UNITS = None
 PSYCHROLIB_TOLERANCE = 1.0
 # Tolerance of temperature calculations
 
+PSYCHROLIB_SOLVER_STATS = None
+# Solver statistics, only collected when enabled with EnableSolverStats
+
+PSYCHROLIB_SOLVER_CALLBACK = None
+# Optional callback invoked after each solve while solver statistics are collected
+
+PSYCHROLIB_ARRAY_DTYPE = 'float64'
+# Floating point type of the calculations of the array functions, set with SetArrayDataType
+
+PSYCHROLIB_VALIDATE = True
+# Whether the functions check the validity of their inputs, set with SetValidation
+
+PSYCHROLIB_VAPPRES_BOUNDS = None
+# Range of vapor pressure over which the dew-point temperature can be solved for, set with the unit system
+
 def SetUnitSystem(Units: UnitSystem) -> None:
     """
     Set the system of units to use (SI or IP).
@@ -159,6 +188,7 @@ def SetUnitSystem(Units: UnitSystem) -> None:
     """
     global PSYCHROLIB_UNITS
     global PSYCHROLIB_TOLERANCE
+    global PSYCHROLIB_VAPPRES_BOUNDS
 
     if not isinstance(Units, UnitSystem):
         raise ValueError("The system of units has to be either SI or IP.")
@@ -172,6 +202,52 @@ def SetUnitSystem(Units: UnitSystem) -> None:
     else:
         PSYCHROLIB_TOLERANCE = 0.001
 
+    # Saturation vapor pressure at the bounds of validity of the equations, checked by the dew-point solvers
+    if Units == IP:
+        PSYCHROLIB_VAPPRES_BOUNDS = (GetSatVapPres(-148), GetSatVapPres(392))
+    else:
+        PSYCHROLIB_VAPPRES_BOUNDS = (GetSatVapPres(-100), GetSatVapPres(200))
+
+def SetValidation(Validate: bool) -> None:
+    """
+    Enable or disable the validity checks of the inputs of the functions.
+
+    Args:
+        Validate: False to skip the checks, True (default) to restore them
+
+    Notes:
+        Without checks, the functions run straight through, and invalid inputs give meaningless
+        results or errors from the math functions instead of a ValueError. It is meant for inputs
+        already validated upstream, for example once at the entry point of a batch with GetArrayStatus.
+        Convergence failures of the solvers still raise.
+
+    Example
+        >>> psychrolib.SetValidation(False)
+        >>> try:
+        ...     TWetBulb = psychrolib.GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio, 101325)
+        ... finally:
+        ...     psychrolib.SetValidation(True)
+
+    """
+    global PSYCHROLIB_VALIDATE
+
+    PSYCHROLIB_VALIDATE = bool(Validate)
+
+def GetValidation() -> bool:
+    """
+    Return whether the functions check the validity of their inputs.
+
+    """
+    return PSYCHROLIB_VALIDATE
+
+def CheckNumpy_() -> None:
+    """
+    Helper function raising an error if numpy, required by the array functions, is not installed.
+
+    """
+    if np is None:
+        raise ImportError("numpy is required by this function, please install it first.")
+
 def GetUnitSystem() -> Optional[UnitSystem]:
     """
     Return system of units in use.
@@ -196,13 +272,14 @@ def isIP() -> bool:
 # Conversion between temperature units
 #######################################################################################################
 
-def GetTRankineFromTFahrenheit(TFahrenheit: float) -> float:
+def GetTRankineFromTFahrenheit(TFahrenheit: float, Out=None) -> float:
     """
     Utility function to convert temperature to degree Rankine (°R)
     given temperature in degree Fahrenheit (°F).
 
     Args:
         TRankine: Temperature in degree Fahrenheit (°F)
+        Out: Optional numpy array in which the result is stored, e.g. TFahrenheit itself to convert in place
 
     Returns:
         Temperature in degree Rankine (°R)
@@ -214,16 +291,19 @@ def GetTRankineFromTFahrenheit(TFahrenheit: float) -> float:
         Exact conversion.
 
     """
+    if Out is not None:
+        return np.add(TFahrenheit, ZERO_FAHRENHEIT_AS_RANKINE, out=Out)
     TRankine = TFahrenheit + ZERO_FAHRENHEIT_AS_RANKINE
     return TRankine
 
-def GetTFahrenheitFromTRankine(TRankine: float) -> float:
+def GetTFahrenheitFromTRankine(TRankine: float, Out=None) -> float:
     """
     Utility function to convert temperature to degree Fahrenheit (°F)
     given temperature in degree Rankine (°R).
 
     Args:
         TRankine: Temperature in degree Rankine (°R)
+        Out: Optional numpy array in which the result is stored, e.g. TRankine itself to convert in place
 
     Returns:
         Temperature in degree Fahrenheit (°F)
@@ -235,15 +315,18 @@ def GetTFahrenheitFromTRankine(TRankine: float) -> float:
         Exact conversion.
 
     """
+    if Out is not None:
+        return np.subtract(TRankine, ZERO_FAHRENHEIT_AS_RANKINE, out=Out)
     return TRankine - ZERO_FAHRENHEIT_AS_RANKINE
 
-def GetTKelvinFromTCelsius(TCelsius: float) -> float:
+def GetTKelvinFromTCelsius(TCelsius: float, Out=None) -> float:
     """
     Utility function to convert temperature to Kelvin (K)
     given temperature in degree Celsius (°C).
 
     Args:
         TCelsius: Temperature in degree Celsius (°C)
+        Out: Optional numpy array in which the result is stored, e.g. TCelsius itself to convert in place
 
     Returns:
         Temperature in Kelvin (K)
@@ -255,16 +338,19 @@ def GetTKelvinFromTCelsius(TCelsius: float) -> float:
         Exact conversion.
 
     """
+    if Out is not None:
+        return np.add(TCelsius, ZERO_CELSIUS_AS_KELVIN, out=Out)
     TKelvin = TCelsius + ZERO_CELSIUS_AS_KELVIN
     return TKelvin
 
-def GetTCelsiusFromTKelvin(TKelvin: float) -> float:
+def GetTCelsiusFromTKelvin(TKelvin: float, Out=None) -> float:
     """
     Utility function to convert temperature to degree Celsius (°C)
     given temperature in Kelvin (K).
 
     Args:
         TKelvin: Temperature in Kelvin (K)
+        Out: Optional numpy array in which the result is stored, e.g. TKelvin itself to convert in place
 
     Returns:
         Temperature in degree Celsius (°C)
@@ -276,6 +362,8 @@ def GetTCelsiusFromTKelvin(TKelvin: float) -> float:
         Exact conversion.
 
     """
+    if Out is not None:
+        return np.subtract(TKelvin, ZERO_CELSIUS_AS_KELVIN, out=Out)
     return TKelvin - ZERO_CELSIUS_AS_KELVIN
 
 
@@ -299,7 +387,7 @@ def GetTWetBulbFromTDewPoint(TDryBulb: float, TDewPoint: float, Pressure: float)
         ASHRAE Handbook - Fundamentals (2017) ch. 1
 
     """
-    if TDewPoint > TDryBulb:
+    if PSYCHROLIB_VALIDATE and TDewPoint > TDryBulb:
         raise ValueError("Dew point temperature is above dry bulb temperature")
 
     HumRatio = GetHumRatioFromTDewPoint(TDewPoint, Pressure)
@@ -322,7 +410,7 @@ def GetTWetBulbFromRelHum(TDryBulb: float, RelHum: float, Pressure: float) -> fl
         ASHRAE Handbook - Fundamentals (2017) ch. 1
 
     """
-    if RelHum < 0 or RelHum > 1:
+    if PSYCHROLIB_VALIDATE and (RelHum < 0 or RelHum > 1):
         raise ValueError("Relative humidity is outside range [0, 1]")
 
     HumRatio = GetHumRatioFromRelHum(TDryBulb, RelHum, Pressure)
@@ -344,7 +432,7 @@ def GetRelHumFromTDewPoint(TDryBulb: float, TDewPoint: float) -> float:
         ASHRAE Handbook - Fundamentals (2017) ch. 1 eqn 22
 
     """
-    if TDewPoint > TDryBulb:
+    if PSYCHROLIB_VALIDATE and TDewPoint > TDryBulb:
         raise ValueError("Dew point temperature is above dry bulb temperature")
 
     VapPres = GetSatVapPres(TDewPoint)
@@ -368,7 +456,7 @@ def GetRelHumFromTWetBulb(TDryBulb: float, TWetBulb: float, Pressure: float) ->
         ASHRAE Handbook - Fundamentals (2017) ch. 1
 
     """
-    if TWetBulb > TDryBulb:
+    if PSYCHROLIB_VALIDATE and TWetBulb > TDryBulb:
         raise ValueError("Wet bulb temperature is above dry bulb temperature")
 
     HumRatio = GetHumRatioFromTWetBulb(TDryBulb, TWetBulb, Pressure)
@@ -390,7 +478,7 @@ def GetTDewPointFromRelHum(TDryBulb: float, RelHum: float) -> float:
         ASHRAE Handbook - Fundamentals (2017) ch. 1
 
     """
-    if RelHum < 0 or RelHum > 1:
+    if PSYCHROLIB_VALIDATE and (RelHum < 0 or RelHum > 1):
         raise ValueError("Relative humidity is outside range [0, 1]")
 
     VapPres = GetVapPresFromRelHum(TDryBulb, RelHum)
@@ -413,7 +501,7 @@ def GetTDewPointFromTWetBulb(TDryBulb: float, TWetBulb: float, Pressure: float)
         ASHRAE Handbook - Fundamentals (2017) ch. 1
 
     """
-    if TWetBulb > TDryBulb:
+    if PSYCHROLIB_VALIDATE and TWetBulb > TDryBulb:
         raise ValueError("Wet bulb temperature is above dry bulb temperature")
 
     HumRatio = GetHumRatioFromTWetBulb(TDryBulb, TWetBulb, Pressure)
@@ -440,7 +528,7 @@ def GetVapPresFromRelHum(TDryBulb: float, RelHum: float) -> float:
         ASHRAE Handbook - Fundamentals (2017) ch. 1 eqn 12, 22
 
     """
-    if RelHum < 0 or RelHum > 1:
+    if PSYCHROLIB_VALIDATE and (RelHum < 0 or RelHum > 1):
         raise ValueError("Relative humidity is outside range [0, 1]")
 
     VapPres = RelHum * GetSatVapPres(TDryBulb)
@@ -461,7 +549,7 @@ def GetRelHumFromVapPres(TDryBulb: float, VapPres: float) -> float:
         ASHRAE Handbook - Fundamentals (2017) ch. 1 eqn 12, 22
 
     """
-    if VapPres < 0:
+    if PSYCHROLIB_VALIDATE and VapPres < 0:
         raise ValueError("Partial pressure of water vapor in moist air cannot be negative")
 
     RelHum = VapPres / GetSatVapPres(TDryBulb)
@@ -501,13 +589,15 @@ def dLnPws_(TDryBulb: float) -> float:
 
     return dLnPws
 
-def GetTDewPointFromVapPres(TDryBulb: float, VapPres: float) -> float:
+def GetTDewPointFromVapPres(TDryBulb: float, VapPres: float, TDewPointGuess: Optional[float] = None) -> float:
     """
     Return dew-point temperature given dry-bulb temperature and vapor pressure.
 
     Args:
         TDryBulb : Dry-bulb temperature in °F [IP] or °C [SI]
         VapPres: Partial pressure of water vapor in moist air in Psi [IP] or Pa [SI]
+        TDewPointGuess : Optional first guess of the dew-point temperature in °F [IP] or °C [SI],
+                         e.g. the solution for the previous time step (warm start)
 
     Returns:
         Dew-point temperature in °F [IP] or °C [SI]
@@ -522,23 +612,32 @@ def GetTDewPointFromVapPres(TDryBulb: float, VapPres: float) -> float:
         narrower range of validity.
         The Newton-Raphson (NR) method is used on the logarithm of water vapour
         pressure as a function of temperature, which is a very smooth function
-        Convergence is usually achieved in 3 to 5 iterations. 
-        TDryBulb is not really needed here, just used for convenience.
+        Convergence is usually achieved in 3 to 5 iterations, or 1 to 2 iterations from a
+        close TDewPointGuess.
+        TDryBulb is not really needed here, just used for convenience, as first guess when
+        TDewPointGuess is not given.
 
     """
+    # Start time of the solve when solver statistics are collected
+    Start = None if PSYCHROLIB_SOLVER_STATS is None else time.perf_counter()
+
     if isIP():
         BOUNDS = [-148, 392]
     else:
         BOUNDS = [-100, 200]
 
     # Validity check -- bounds outside which a solution cannot be found
-    if VapPres < GetSatVapPres(BOUNDS[0]) or VapPres > GetSatVapPres(BOUNDS[1]):
+    if PSYCHROLIB_VALIDATE and (VapPres < PSYCHROLIB_VAPPRES_BOUNDS[0] or VapPres > PSYCHROLIB_VAPPRES_BOUNDS[1]):
         raise ValueError("Partial pressure of water vapor is outside range of validity of equations")
 
     # We use NR to approximate the solution.
     # First guess
-    TDewPoint = TDryBulb        # Calculated value of dew point temperatures, solved for iteratively
+    if TDewPointGuess is None:
+        TDewPoint = TDryBulb    # Calculated value of dew point temperatures, solved for iteratively
+    else:
+        TDewPoint = min(max(TDewPointGuess, BOUNDS[0]), BOUNDS[1])
     lnVP = math.log(VapPres)    # Partial pressure of water vapor in moist air
+    Clamped = False
 
     index = 1
 
@@ -550,19 +649,25 @@ def GetTDewPointFromVapPres(TDryBulb: float, VapPres: float) -> float:
         d_lnVP = dLnPws_(TDewPoint_iter)
 
         # New estimate, bounded by the search domain defined above
-        TDewPoint = TDewPoint_iter - (lnVP_iter - lnVP) / d_lnVP
-        TDewPoint = max(TDewPoint, BOUNDS[0])
+        Unbounded = TDewPoint_iter - (lnVP_iter - lnVP) / d_lnVP
+        TDewPoint = max(Unbounded, BOUNDS[0])
         TDewPoint = min(TDewPoint, BOUNDS[1])
+        if Start is not None and TDewPoint != Unbounded:
+            Clamped = True
 
         if ((math.fabs(TDewPoint - TDewPoint_iter) <= PSYCHROLIB_TOLERANCE)):
             break
 
         if (index > MAX_ITER_COUNT):
+            if Start is not None:
+                RecordSolve_('GetTDewPointFromVapPres', index, Clamped, False, Start)
             raise ValueError("Convergence not reached in GetTDewPointFromVapPres. Stopping.")
 
         index = index + 1
 
     TDewPoint = min(TDewPoint, TDryBulb)
+    if Start is not None:
+        RecordSolve_('GetTDewPointFromVapPres', index, Clamped, True, Start)
     return TDewPoint
 
 def GetVapPresFromTDewPoint(TDewPoint: float) -> float:
@@ -587,7 +692,8 @@ def GetVapPresFromTDewPoint(TDewPoint: float) -> float:
 # Conversions from wet-bulb temperature, dew-point temperature, or relative humidity to humidity ratio
 #######################################################################################################
 
-def GetTWetBulbFromHumRatio(TDryBulb: float, HumRatio: float, Pressure: float) -> float:
+def GetTWetBulbFromHumRatio(TDryBulb: float, HumRatio: float, Pressure: float,
+                            TWetBulbGuess: Optional[float] = None) -> float:
     """
     Return wet-bulb temperature given dry-bulb temperature, humidity ratio, and pressure.
 
@@ -595,6 +701,8 @@ def GetTWetBulbFromHumRatio(TDryBulb: float, HumRatio: float, Pressure: float) -
         TDryBulb : Dry-bulb temperature in °F [IP] or °C [SI]
         HumRatio : Humidity ratio in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI]
         Pressure : Atmospheric pressure in Psi [IP] or Pa [SI]
+        TWetBulbGuess : Optional guess of the wet-bulb temperature in °F [IP] or °C [SI],
+                        e.g. the solution for the previous time step (warm start)
 
     Returns:
         Wet-bulb temperature in °F [IP] or °C [SI]
@@ -602,21 +710,33 @@ def GetTWetBulbFromHumRatio(TDryBulb: float, HumRatio: float, Pressure: float) -
     Reference:
         ASHRAE Handbook - Fundamentals (2017) ch. 1 eqn 33 and 35 solved for Tstar
 
+    Notes:
+        The wet-bulb temperature is solved by bisection between the dew-point and dry-bulb temperatures.
+        When TWetBulbGuess is given, a tight bracket around it is searched for first, in which case
+        the dew-point temperature is not needed. If none is found the full bracket is used.
+
     """
-    if HumRatio < 0:
+    # Start time of the solve when solver statistics are collected
+    Start = None if PSYCHROLIB_SOLVER_STATS is None else time.perf_counter()
+
+    if PSYCHROLIB_VALIDATE and HumRatio < 0:
         raise ValueError("Humidity ratio cannot be negative")
     BoundedHumRatio = max(HumRatio, MIN_HUM_RATIO)
 
-    TDewPoint = GetTDewPointFromHumRatio(TDryBulb, BoundedHumRatio, Pressure)
-
     # Initial guesses
-    TWetBulbSup = TDryBulb
-    TWetBulbInf = TDewPoint
+    Bracket = None
+    if TWetBulbGuess is not None:
+        Bracket = BracketTWetBulb_(TDryBulb, BoundedHumRatio, Pressure, TWetBulbGuess)
+    if Bracket is None:
+        TDewPoint = GetTDewPointFromHumRatio(TDryBulb, BoundedHumRatio, Pressure)
+        Bracket = (TDewPoint, TDryBulb)
+    TWetBulbInf, TWetBulbSup = Bracket
     TWetBulb = (TWetBulbInf + TWetBulbSup) / 2
 
-    index = 1
+    index = 0
     # Bisection loop
     while ((TWetBulbSup - TWetBulbInf) > PSYCHROLIB_TOLERANCE):
+        index = index + 1
 
         # Compute humidity ratio at temperature Tstar
         Wstar = GetHumRatioFromTWetBulb(TDryBulb, TWetBulb, Pressure)
@@ -631,11 +751,60 @@ def GetTWetBulbFromHumRatio(TDryBulb: float, HumRatio: float, Pressure: float) -
         TWetBulb = (TWetBulbSup + TWetBulbInf) / 2
 
         if (index >= MAX_ITER_COUNT):
+            if Start is not None:
+                RecordSolve_('GetTWetBulbFromHumRatio', index, HumRatio < MIN_HUM_RATIO, False, Start)
             raise ValueError("Convergence not reached in GetTWetBulbFromHumRatio. Stopping.")
 
-        index = index + 1
+    if Start is not None:
+        RecordSolve_('GetTWetBulbFromHumRatio', index, HumRatio < MIN_HUM_RATIO, True, Start)
     return TWetBulb
 
+def BracketTWetBulb_(TDryBulb: float, BoundedHumRatio: float, Pressure: float, TWetBulbGuess: float,
+                     HumRatioFromTWetBulb: Optional[Callable] = None):
+    """
+    Helper function searching for a tight bracket of the wet-bulb temperature around a guess.
+
+    Args:
+        TDryBulb : Dry-bulb temperature in °F [IP] or °C [SI]
+        BoundedHumRatio : Humidity ratio in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI], at least MIN_HUM_RATIO
+        Pressure : Atmospheric pressure in Psi [IP] or Pa [SI]
+        TWetBulbGuess : Guess of the wet-bulb temperature in °F [IP] or °C [SI]
+        HumRatioFromTWetBulb : Function used instead of GetHumRatioFromTWetBulb, with the same arguments
+
+    Returns:
+        Tuple of the lower and upper bounds of the wet-bulb temperature, or None if no bracket was found
+
+    Notes:
+        The bracket starts with a width of twice the tolerance around the guess and is shifted
+        towards the solution, doubling its width at each step, for up to 10 steps.
+
+    """
+    LowerBound = -148 if isIP() else -100
+    if HumRatioFromTWetBulb is None:
+        HumRatioFromTWetBulb = GetHumRatioFromTWetBulb
+
+    Step = PSYCHROLIB_TOLERANCE
+    TWetBulbSup = min(TWetBulbGuess + Step, TDryBulb)
+    TWetBulbInf = TWetBulbSup - 2 * Step
+
+    for _ in range(10):
+        if TWetBulbInf < LowerBound:
+            return None
+        if HumRatioFromTWetBulb(TDryBulb, TWetBulbInf, Pressure) > BoundedHumRatio:
+            # Solution below the bracket
+            TWetBulbSup, TWetBulbInf = TWetBulbInf, TWetBulbInf - 2 * Step
+        elif HumRatioFromTWetBulb(TDryBulb, TWetBulbSup, Pressure) <= BoundedHumRatio:
+            if TWetBulbSup >= TDryBulb:
+                # The bracket cannot be shifted above the dry-bulb temperature, e.g. where the humidity
+                # ratio is bounded at MIN_HUM_RATIO because the saturation pressure exceeds the pressure
+                return None
+            # Solution above the bracket
+            TWetBulbInf, TWetBulbSup = TWetBulbSup, min(TWetBulbSup + 2 * Step, TDryBulb)
+        else:
+            return TWetBulbInf, TWetBulbSup
+        Step = 2 * Step
+    return None
+
 def GetHumRatioFromTWetBulb(TDryBulb: float, TWetBulb: float, Pressure: float) -> float:
     """
     Return humidity ratio given dry-bulb temperature, wet-bulb temperature, and pressure.
@@ -652,7 +821,7 @@ def GetHumRatioFromTWetBulb(TDryBulb: float, TWetBulb: float, Pressure: float) -
         ASHRAE Handbook - Fundamentals (2017) ch. 1 eqn 33 and 35
 
     """
-    if TWetBulb > TDryBulb:
+    if PSYCHROLIB_VALIDATE and TWetBulb > TDryBulb:
         raise ValueError("Wet bulb temperature is above dry bulb temperature")
 
     Wsstar = GetSatHumRatio(TWetBulb, Pressure)
@@ -690,7 +859,7 @@ def GetHumRatioFromRelHum(TDryBulb: float, RelHum: float, Pressure: float) -> fl
         ASHRAE Handbook - Fundamentals (2017) ch. 1
 
     """
-    if RelHum < 0 or RelHum > 1:
+    if PSYCHROLIB_VALIDATE and (RelHum < 0 or RelHum > 1):
         raise ValueError("Relative humidity is outside range [0, 1]")
 
     VapPres = GetVapPresFromRelHum(TDryBulb, RelHum)
@@ -713,7 +882,7 @@ def GetRelHumFromHumRatio(TDryBulb: float, HumRatio: float, Pressure: float) ->
         ASHRAE Handbook - Fundamentals (2017) ch. 1
 
     """
-    if HumRatio < 0:
+    if PSYCHROLIB_VALIDATE and HumRatio < 0:
         raise ValueError("Humidity ratio cannot be negative")
 
     VapPres = GetVapPresFromHumRatio(HumRatio, Pressure)
@@ -755,7 +924,7 @@ def GetTDewPointFromHumRatio(TDryBulb: float, HumRatio: float, Pressure: float)
         ASHRAE Handbook - Fundamentals (2017) ch. 1
 
     """
-    if HumRatio < 0:
+    if PSYCHROLIB_VALIDATE and HumRatio < 0:
         raise ValueError("Humidity ratio cannot be negative")
 
     VapPres = GetVapPresFromHumRatio(HumRatio, Pressure)
@@ -782,7 +951,7 @@ def GetHumRatioFromVapPres(VapPres: float, Pressure: float) -> float:
         ASHRAE Handbook - Fundamentals (2017) ch. 1 eqn 20
 
     """
-    if VapPres < 0:
+    if PSYCHROLIB_VALIDATE and VapPres < 0:
         raise ValueError("Partial pressure of water vapor in moist air cannot be negative")
 
     HumRatio = 0.621945 * VapPres / (Pressure - VapPres)
@@ -805,7 +974,7 @@ def GetVapPresFromHumRatio(HumRatio: float, Pressure: float) -> float:
         ASHRAE Handbook - Fundamentals (2017) ch. 1 eqn 20 solved for pw
 
     """
-    if HumRatio < 0:
+    if PSYCHROLIB_VALIDATE and HumRatio < 0:
         raise ValueError("Humidity ratio is negative")
     BoundedHumRatio = max(HumRatio, MIN_HUM_RATIO)
 
@@ -831,7 +1000,7 @@ def GetSpecificHumFromHumRatio(HumRatio: float) -> float:
         ASHRAE Handbook - Fundamentals (2017) ch. 1 eqn 9b
 
     """
-    if HumRatio < 0:
+    if PSYCHROLIB_VALIDATE and HumRatio < 0:
         raise ValueError("Humidity ratio cannot be negative")
     BoundedHumRatio = max(HumRatio, MIN_HUM_RATIO)
 
@@ -852,7 +1021,7 @@ def GetHumRatioFromSpecificHum(SpecificHum: float) -> float:
         ASHRAE Handbook - Fundamentals (2017) ch. 1 eqn 9b (solved for humidity ratio)
 
     """
-    if SpecificHum < 0.0 or SpecificHum >= 1.0:
+    if PSYCHROLIB_VALIDATE and (SpecificHum < 0.0 or SpecificHum >= 1.0):
         raise ValueError("Specific humidity is outside range [0, 1[")
 
     HumRatio = SpecificHum / (1.0 - SpecificHum)
@@ -957,7 +1126,7 @@ def GetTDryBulbFromEnthalpyAndHumRatio(MoistAirEnthalpy: float, HumRatio: float)
         Based on the `GetMoistAirEnthalpy` function, rearranged for temperature.
 
     """
-    if HumRatio < 0:
+    if PSYCHROLIB_VALIDATE and HumRatio < 0:
         raise ValueError("Humidity ratio is negative")
     BoundedHumRatio = max(HumRatio, MIN_HUM_RATIO)
 
@@ -1020,7 +1189,7 @@ def GetSatVapPres(TDryBulb: float) -> float:
 
     """
     if isIP():
-        if (TDryBulb < -148 or TDryBulb > 392):
+        if PSYCHROLIB_VALIDATE and (TDryBulb < -148 or TDryBulb > 392):
             raise ValueError("Dry bulb temperature must be in range [-148, 392]°F")
 
         T = GetTRankineFromTFahrenheit(TDryBulb)
@@ -1032,7 +1201,7 @@ def GetSatVapPres(TDryBulb: float) -> float:
             LnPws = -1.0440397E+04 / T - 1.1294650E+01 - 2.7022355E-02* T + 1.2890360E-05 * T**2 \
                   - 2.4780681E-09 * math.pow(T, 3) + 6.5459673 * math.log(T)
     else:
-        if (TDryBulb < -100 or TDryBulb > 200):
+        if PSYCHROLIB_VALIDATE and (TDryBulb < -100 or TDryBulb > 200):
             raise ValueError("Dry bulb temperature must be in range [-100, 200]°C")
 
         T = GetTKelvinFromTCelsius(TDryBulb)
@@ -1108,7 +1277,7 @@ def GetVaporPressureDeficit(TDryBulb: float, HumRatio: float, Pressure: float) -
         Oke (1987) eqn 2.13a
 
     """
-    if HumRatio < 0:
+    if PSYCHROLIB_VALIDATE and HumRatio < 0:
         raise ValueError("Humidity ratio is negative")
 
     RelHum = GetRelHumFromHumRatio(TDryBulb, HumRatio, Pressure)
@@ -1135,7 +1304,7 @@ def GetDegreeOfSaturation(TDryBulb: float, HumRatio: float, Pressure: float) ->
         This definition is absent from the 2017 Handbook. Using 2009 version instead.
 
     """
-    if HumRatio < 0:
+    if PSYCHROLIB_VALIDATE and HumRatio < 0:
         raise ValueError("Humidity ratio is negative")
     BoundedHumRatio = max(HumRatio, MIN_HUM_RATIO)
 
@@ -1158,7 +1327,7 @@ def GetMoistAirEnthalpy(TDryBulb: float, HumRatio: float) -> float:
         ASHRAE Handbook - Fundamentals (2017) ch. 1 eqn 30
 
     """
-    if HumRatio < 0:
+    if PSYCHROLIB_VALIDATE and HumRatio < 0:
         raise ValueError("Humidity ratio is negative")
     BoundedHumRatio = max(HumRatio, MIN_HUM_RATIO)
 
@@ -1188,7 +1357,7 @@ def GetMoistAirVolume(TDryBulb: float, HumRatio: float, Pressure: float) -> floa
         The factor 144 is for the conversion of Psi = lb in⁻² to lb ft⁻².
 
     """
-    if HumRatio < 0:
+    if PSYCHROLIB_VALIDATE and HumRatio < 0:
         raise ValueError("Humidity ratio is negative")
     BoundedHumRatio = max(HumRatio, MIN_HUM_RATIO)
 
@@ -1219,7 +1388,7 @@ def GetTDryBulbFromMoistAirVolumeAndHumRatio(MoistAirVolume: float, HumRatio: fl
         Based on the `GetMoistAirVolume` function, rearranged for dry-bulb temperature.
 
     """
-    if HumRatio < 0:
+    if PSYCHROLIB_VALIDATE and HumRatio < 0:
         raise ValueError("Humidity ratio is negative")
     BoundedHumRatio = max(HumRatio, MIN_HUM_RATIO)
 
@@ -1247,7 +1416,7 @@ def GetMoistAirDensity(TDryBulb: float, HumRatio: float, Pressure:float) -> floa
         ASHRAE Handbook - Fundamentals (2017) ch. 1 eqn 11
 
     """
-    if HumRatio < 0:
+    if PSYCHROLIB_VALIDATE and HumRatio < 0:
         raise ValueError("Humidity ratio is negative")
     BoundedHumRatio = max(HumRatio, MIN_HUM_RATIO)
 
@@ -1459,3 +1628,4909 @@ def CalcPsychrometricsFromRelHum(TDryBulb: float, RelHum: float, Pressure: float
     MoistAirVolume = GetMoistAirVolume(TDryBulb, HumRatio, Pressure)
     DegreeOfSaturation = GetDegreeOfSaturation(TDryBulb, HumRatio, Pressure)
     return HumRatio, TWetBulb, TDewPoint, VapPres, MoistAirEnthalpy, MoistAirVolume, DegreeOfSaturation
+
+
+#######################################################################################################
+# Solver instrumentation
+#######################################################################################################
+
+SOLVER_NAMES = ('GetTDewPointFromVapPres', 'GetTWetBulbFromHumRatio', 'GetTDewPointFromVapPresArray',
+                'GetTWetBulbFromHumRatioArray')
+"""tuple: Names of the iterative solvers for which statistics can be collected.
+
+"""
+
+def EnableSolverStats(Callback: Optional[Callable[[dict], None]] = None) -> None:
+    """
+    Start collecting statistics on the iterative solvers (GetTDewPointFromVapPres, GetTWetBulbFromHumRatio
+    and their array versions).
+
+    Args:
+        Callback : Optional function called after each solve with a dict describing the solve
+                   (keys: Function, Iterations, Clamped, Converged, Time)
+
+    Notes:
+        Statistics are reset each time this function is called.
+        When statistics are disabled (the default) the only overhead is a check on entry and on exit
+        of the solvers. Iterations counts the iterations of the solver loop, whether it converged or not.
+        A call of an array solver is one solve, whose iterations are those of all its elements together,
+        and which is clamped if any element is.
+        Times are cumulative and inclusive, i.e. the time spent in GetTWetBulbFromHumRatio includes
+        the time spent solving for the dew point.
+
+    """
+    global PSYCHROLIB_SOLVER_STATS
+    global PSYCHROLIB_SOLVER_CALLBACK
+
+    PSYCHROLIB_SOLVER_CALLBACK = Callback
+    PSYCHROLIB_SOLVER_STATS = {Name: NewSolverStats_() for Name in SOLVER_NAMES}
+
+def DisableSolverStats() -> None:
+    """
+    Stop collecting statistics on the iterative solvers and discard those collected so far.
+
+    """
+    global PSYCHROLIB_SOLVER_STATS
+    global PSYCHROLIB_SOLVER_CALLBACK
+
+    PSYCHROLIB_SOLVER_STATS = None
+    PSYCHROLIB_SOLVER_CALLBACK = None
+
+def ResetSolverStats() -> None:
+    """
+    Reset the statistics collected on the iterative solvers, keeping them enabled.
+
+    """
+    if PSYCHROLIB_SOLVER_STATS is None:
+        raise ValueError("Solver statistics are not enabled.")
+
+    for Name in SOLVER_NAMES:
+        PSYCHROLIB_SOLVER_STATS[Name] = NewSolverStats_()
+
+def GetSolverStats() -> Optional[dict]:
+    """
+    Return a snapshot of the statistics collected on the iterative solvers.
+
+    Returns:
+        None if statistics are not enabled, otherwise a dict keyed by solver name, each entry
+        being a dict with the following keys:
+            Calls : number of calls
+            Iterations : total number of iterations
+            IterationHistogram : dict of number of calls keyed by number of iterations
+            BoundsClamps : number of calls for which an input or iterate was clamped to its bounds
+            ConvergenceFailures : number of calls which did not converge within MAX_ITER_COUNT iterations
+            Time : cumulative time spent in the function in seconds
+
+    """
+    if PSYCHROLIB_SOLVER_STATS is None:
+        return None
+
+    Snapshot = {}
+    for Name, Stats in PSYCHROLIB_SOLVER_STATS.items():
+        Snapshot[Name] = dict(Stats)
+        Snapshot[Name]['IterationHistogram'] = dict(Stats['IterationHistogram'])
+    return Snapshot
+
+def NewSolverStats_() -> dict:
+    """
+    Helper function returning an empty set of statistics for one solver.
+
+    """
+    return {'Calls': 0, 'Iterations': 0, 'IterationHistogram': {}, 'BoundsClamps': 0,
+            'ConvergenceFailures': 0, 'Time': 0.0}
+
+def RecordSolve_(Name: str, Iterations: int, Clamped: bool, Converged: bool, Start: float) -> None:
+    """
+    Helper function adding the outcome of one solve to the solver statistics and
+    forwarding it to the callback, if any.
+
+    """
+    Elapsed = time.perf_counter() - Start
+
+    # Statistics may have been disabled by the callback or by a nested solve
+    if PSYCHROLIB_SOLVER_STATS is not None:
+        Stats = PSYCHROLIB_SOLVER_STATS[Name]
+        Stats['Calls'] += 1
+        Stats['Iterations'] += Iterations
+        Stats['IterationHistogram'][Iterations] = Stats['IterationHistogram'].get(Iterations, 0) + 1
+        Stats['BoundsClamps'] += int(Clamped)
+        Stats['ConvergenceFailures'] += int(not Converged)
+        Stats['Time'] += Elapsed
+
+    if PSYCHROLIB_SOLVER_CALLBACK is not None:
+        PSYCHROLIB_SOLVER_CALLBACK({'Function': Name, 'Iterations': Iterations, 'Clamped': Clamped,
+                                    'Converged': Converged, 'Time': Elapsed})
+
+def MapSolverConvergence(TDryBulb=None, SatFraction=None, Altitude=None, Path: Optional[str] = None) -> dict:
+    """
+    Map the behaviour of the iterative solvers (GetTDewPointFromVapPres and GetTWetBulbFromHumRatio)
+    over a grid of dry-bulb temperature, humidity and pressure.
+
+    Args:
+        TDryBulb : Array of dry-bulb temperatures in °F [IP] or °C [SI]
+                   Default is every 1.8 °F [IP] or 1 °C [SI] over the range of validity of the equations
+        SatFraction : Array of fractions in range [0, 1] of the humidity ratio range spanning MIN_HUM_RATIO
+                      (0) to the humidity ratio at saturation (1). Default is every 0.05.
+        Altitude : Array of altitudes in ft [IP] or m [SI], converted to pressure with GetStandardAtmPressure
+                   Default is every 1500 ft [IP] or 500 m [SI] from -1500 ft [IP] or -500 m [SI]
+                   to 16500 ft [IP] or 5000 m [SI]
+        Path : Optional path of the compressed numpy (.npz) file the results are saved to
+
+    Returns:
+        Dict of arrays. The grid axes are stored as TDryBulb, SatFraction, Altitude and Pressure, and the
+        grid values (dimensions TDryBulb x SatFraction x Altitude) as HumRatio, Valid (False where
+        the humidity ratio at saturation is not above MIN_HUM_RATIO, in which case the grid point is
+        skipped), and for each solver (prefixes TDewPoint and TWetBulb):
+            Iterations : number of iterations, -1 when the solver failed or the grid point was skipped
+            Residual : residual of the solution, relative on vapor pressure for the dew point and
+                       absolute on humidity ratio for the wet bulb, NaN when the solver failed
+            Time : time spent in the solver in seconds
+
+    Notes:
+        This is an offline tool meant to judge changes to the solvers or their initial guesses on the
+        worst case over the range of validity of the equations. It is slow, since each grid point is
+        solved with the scalar functions. Use SummarizeSolverConvergence to get summary statistics.
+
+    """
+    global PSYCHROLIB_SOLVER_STATS
+    global PSYCHROLIB_SOLVER_CALLBACK
+
+    CheckNumpy_()
+
+    if isIP():
+        TDryBulb = np.linspace(-148, 392, 301) if TDryBulb is None else TDryBulb
+        Altitude = np.arange(-1500, 16501, 1500) if Altitude is None else Altitude
+    else:
+        TDryBulb = np.linspace(-100, 200, 301) if TDryBulb is None else TDryBulb
+        Altitude = np.arange(-500, 5001, 500) if Altitude is None else Altitude
+    SatFraction = np.linspace(0, 1, 21) if SatFraction is None else SatFraction
+
+    TDryBulb = np.asarray(TDryBulb, dtype=float)
+    SatFraction = np.asarray(SatFraction, dtype=float)
+    Altitude = np.asarray(Altitude, dtype=float)
+    Pressure = np.array([GetStandardAtmPressure(Alt) for Alt in Altitude])
+
+    Shape = (TDryBulb.size, SatFraction.size, Altitude.size)
+    Map = {'TDryBulb': TDryBulb, 'SatFraction': SatFraction, 'Altitude': Altitude, 'Pressure': Pressure,
+           'HumRatio': np.full(Shape, np.nan), 'Valid': np.zeros(Shape, dtype=bool)}
+    for Prefix in ('TDewPoint', 'TWetBulb'):
+        Map[Prefix + 'Iterations'] = np.full(Shape, -1, dtype=np.int16)
+        Map[Prefix + 'Residual'] = np.full(Shape, np.nan, dtype=np.float32)
+        Map[Prefix + 'Time'] = np.zeros(Shape, dtype=np.float32)
+
+    # Collect the outcome of each solve with the instrumentation callback
+    Records = {}
+    SavedStats, SavedCallback = PSYCHROLIB_SOLVER_STATS, PSYCHROLIB_SOLVER_CALLBACK
+    EnableSolverStats(lambda Record: Records.__setitem__(Record['Function'], Record))
+
+    try:
+        for i, T in enumerate(TDryBulb):
+            for k, p in enumerate(Pressure):
+                # Skip conditions where no humidity ratio above MIN_HUM_RATIO is below saturation,
+                # i.e. very cold air or water boiling at that pressure
+                SatHumRatio = GetSatHumRatio(T, p)
+                if GetSatVapPres(T) >= p or SatHumRatio <= MIN_HUM_RATIO:
+                    continue
+                for j, Fraction in enumerate(SatFraction):
+                    HumRatio = MIN_HUM_RATIO + Fraction * (SatHumRatio - MIN_HUM_RATIO)
+                    VapPres = GetVapPresFromHumRatio(HumRatio, p)
+                    Map['HumRatio'][i, j, k] = HumRatio
+                    Map['Valid'][i, j, k] = True
+
+                    Records.clear()
+                    try:
+                        TDewPoint = GetTDewPointFromVapPres(T, VapPres)
+                        Map['TDewPointResidual'][i, j, k] = abs(GetSatVapPres(TDewPoint) - VapPres) / VapPres
+                    except ValueError:
+                        pass
+                    MapSolverRecord_(Map, 'TDewPoint', Records.get('GetTDewPointFromVapPres'), (i, j, k))
+
+                    Records.clear()
+                    try:
+                        TWetBulb = GetTWetBulbFromHumRatio(T, HumRatio, p)
+                        Map['TWetBulbResidual'][i, j, k] = abs(GetHumRatioFromTWetBulb(T, TWetBulb, p) - HumRatio)
+                    except ValueError:
+                        pass
+                    MapSolverRecord_(Map, 'TWetBulb', Records.get('GetTWetBulbFromHumRatio'), (i, j, k))
+    finally:
+        PSYCHROLIB_SOLVER_STATS, PSYCHROLIB_SOLVER_CALLBACK = SavedStats, SavedCallback
+
+    if Path is not None:
+        np.savez_compressed(Path, **Map)
+    return Map
+
+def MapSolverRecord_(Map: dict, Prefix: str, Record: Optional[dict], Index: tuple) -> None:
+    """
+    Helper function storing the outcome of one solve in the arrays of MapSolverConvergence.
+
+    """
+    if Record is None:
+        # The solver failed its validity checks before iterating
+        return
+    Map[Prefix + 'Time'][Index] = Record['Time']
+    if Record['Converged']:
+        Map[Prefix + 'Iterations'][Index] = Record['Iterations']
+
+def SummarizeSolverConvergence(Map) -> dict:
+    """
+    Return summary statistics of a map of the convergence of the iterative solvers.
+
+    Args:
+        Map : Dict of arrays returned by MapSolverConvergence, or loaded from the file it saved
+
+    Returns:
+        Dict keyed by solver (TDewPoint and TWetBulb), each entry being a dict with the following keys:
+            Points : number of valid grid points
+            Failures : number of valid grid points where the solver failed
+            MeanIterations, P99Iterations, MaxIterations : mean, 99th percentile and maximum number of iterations
+            MaxResidual : maximum residual
+            TotalTime, MaxTime : total and maximum time spent in the solver in seconds
+            WorstCase : dict of TDryBulb, HumRatio and Pressure at the grid point with the most iterations
+
+    """
+    CheckNumpy_()
+
+    Summary = {}
+    for Prefix in ('TDewPoint', 'TWetBulb'):
+        Iterations = np.asarray(Map[Prefix + 'Iterations'])
+        Residual = np.asarray(Map[Prefix + 'Residual'])
+        Time = np.asarray(Map[Prefix + 'Time'])
+        Valid = np.asarray(Map['Valid'])
+        Converged = Iterations >= 0
+
+        Stats = {'Points': int(np.count_nonzero(Valid)), 'Failures': int(np.count_nonzero(Valid & ~Converged)),
+                 'TotalTime': float(Time.sum()), 'MaxTime': float(Time.max())}
+        if Converged.any():
+            i, j, k = np.unravel_index(np.argmax(Iterations), Iterations.shape)
+            Stats.update({
+                'MeanIterations': float(Iterations[Converged].mean()),
+                'P99Iterations': float(np.percentile(Iterations[Converged], 99)),
+                'MaxIterations': int(Iterations.max()),
+                'MaxResidual': float(np.nanmax(Residual)),
+                'WorstCase': {'TDryBulb': float(Map['TDryBulb'][i]), 'HumRatio': float(Map['HumRatio'][i, j, k]),
+                              'Pressure': float(Map['Pressure'][k])}})
+        Summary[Prefix] = Stats
+    return Summary
+
+
+#######################################################################################################
+# Array functions
+#######################################################################################################
+
+# The following functions are the counterparts of the scalar functions of the same name (without the
+# Array suffix) for numpy arrays. They accept arrays (or anything numpy can convert to an array) which
+# are broadcast against each other, and return arrays. They require numpy. The validity checks are
+# the same as for the scalar functions and raise if any element fails them. NaN elements pass the
+# checks and give NaN results. The iterative solvers and the functions CalcPsychrometricsFrom...Array
+# accept an error policy Errors, with which the elements failing the checks give NaN results instead
+# (see ArrayStatus).
+# The functions used by CalcPsychrometricsFromTWetBulbArray, CalcPsychrometricsFromTDewPointArray and
+# CalcPsychrometricsFromRelHumArray accept an optional Out array, in which the result is stored, and an
+# optional ArrayWorkspace, from which their temporary arrays are taken, so that repeated calls on arrays
+# of the same shape do not allocate new arrays. Out must have the shape of the result and must not
+# share memory with the other arguments.
+
+FLOAT32_MAX_ERRORS = {
+    'GetSatVapPresArray': 1e-5,
+    'GetSatHumRatioArray': 2e-5,
+    'GetVapPresFromRelHumArray': 1e-5,
+    'GetHumRatioFromRelHumArray': 2e-5,
+    'GetRelHumFromHumRatioArray': 1e-5,
+    'GetDegreeOfSaturationArray': 2e-5,
+    'GetMoistAirVolumeArray': 1e-6,
+    'GetMoistAirEnthalpyArray': 0.5,
+    'GetHumRatioFromTWetBulbArray': 1e-5,
+    'GetTDewPointFromVapPresArray': 0.001,
+    'GetTWetBulbFromHumRatioArray': 0.001,
+}
+"""dict: Largest error of the array functions calculated in float32 compared to float64, for dry-bulb
+         temperatures from -100 °C (-148 °F) to the temperature at which the saturation vapor pressure
+         is half the standard atmospheric pressure, about 81 °C (178 °F), and any relative humidity.
+         The errors are relative, except for the enthalpy in J kg⁻¹, the humidity ratio from wet-bulb
+         temperature in kg_H₂O kg_Air⁻¹ and the dew-point and wet-bulb temperatures in K, the last two
+         being those of the solvers at the tolerance PSYCHROLIB_TOLERANCE.
+         Close to the boiling point, the relative errors of the humidity ratio and the degree of
+         saturation grow as Pressure / (Pressure - VapPres).
+
+"""
+
+def SetArrayDataType(DataType) -> None:
+    """
+    Set the floating point type of the calculations of the array functions, float64 (default) or float32.
+
+    Args:
+        DataType: numpy.float64 or numpy.float32, or their names
+
+    Notes:
+        In float32, the inputs of the array functions are converted to float32, and the intermediate
+        values and the results are float32 arrays. This halves the memory used, for a small loss of
+        accuracy given in FLOAT32_MAX_ERRORS. The solvers stop at a tolerance of at least a few units in
+        the last place of the temperature. The scalar functions are not affected.
+
+    """
+    global PSYCHROLIB_ARRAY_DTYPE
+
+    CheckNumpy_()
+    DataType = np.dtype(DataType)
+    if DataType not in (np.dtype('float64'), np.dtype('float32')):
+        raise ValueError("The data type of the array functions has to be either float64 or float32.")
+    PSYCHROLIB_ARRAY_DTYPE = DataType.name
+
+def GetArrayDataType() -> str:
+    """
+    Return the name of the floating point type of the calculations of the array functions.
+
+    """
+    return PSYCHROLIB_ARRAY_DTYPE
+
+def AsArray_(Value):
+    """
+    Helper function converting a value to a numpy array of the floating point type of the array functions.
+
+    """
+    CheckNumpy_()
+    return np.asarray(Value, dtype=PSYCHROLIB_ARRAY_DTYPE)
+
+def ArrayTolerance_() -> float:
+    """
+    Helper function returning the tolerance of the temperatures of the array solvers, at least four
+    units in the last place of the largest temperature in the floating point type of the array functions.
+
+    """
+    return max(PSYCHROLIB_TOLERANCE, 4 * float(np.finfo(PSYCHROLIB_ARRAY_DTYPE).eps) * (392 if isIP() else 200))
+
+class ArrayWorkspace:
+    """
+    Pool of scratch arrays reused by the array functions, so that repeated calls on arrays of the same
+    shape do not allocate temporary arrays.
+
+    Notes:
+        A workspace is passed to the array functions with their Workspace argument. The array functions
+        take their temporary arrays from the pool and return them to it before returning, so that the
+        pool holds no more arrays than the largest number of temporary arrays used at the same time,
+        until Clear is called. A workspace must not be used by several threads at the same time.
+
+    Example
+        >>> Workspace = psychrolib.ArrayWorkspace()
+        >>> HumRatio = np.empty(TDryBulb.shape)
+        >>> for RelHum in RelHumSeries:
+        ...     psychrolib.GetHumRatioFromRelHumArray(TDryBulb, RelHum, 101325, Out=HumRatio, Workspace=Workspace)
+
+    """
+    def __init__(self):
+        CheckNumpy_()
+        self.Free_ = {}
+
+    def Get_(self, Shape: tuple, DataType=None):
+        """
+        Helper method taking an array of a given shape and data type, by default that of the array
+        functions, from the pool.
+
+        """
+        DataType = np.dtype(PSYCHROLIB_ARRAY_DTYPE if DataType is None else DataType)
+        Free = self.Free_.get((Shape, DataType))
+        if Free:
+            return Free.pop()
+        return np.empty(Shape, dtype=DataType)
+
+    def Release_(self, Arrays: tuple) -> None:
+        """
+        Helper method returning arrays taken with Get_ to the pool.
+
+        """
+        for Array in Arrays:
+            self.Free_.setdefault((Array.shape, Array.dtype), []).append(Array)
+
+    def Clear(self) -> None:
+        """
+        Release the scratch arrays.
+
+        """
+        self.Free_.clear()
+
+def Scratch_(Workspace: Optional[ArrayWorkspace], Shape: tuple, DataType=None):
+    """
+    Helper function returning a scratch array from the workspace, or a new array without workspace.
+
+    """
+    if Workspace is None:
+        return np.empty(Shape, dtype=PSYCHROLIB_ARRAY_DTYPE if DataType is None else DataType)
+    return Workspace.Get_(Shape, DataType)
+
+def Release_(Workspace: Optional[ArrayWorkspace], *Arrays) -> None:
+    """
+    Helper function returning scratch arrays to the workspace, if any.
+
+    """
+    if Workspace is not None:
+        Workspace.Release_(Arrays)
+
+def OutArray_(Out, Shape: tuple):
+    """
+    Helper function returning the array in which to store the result of an array function.
+
+    """
+    if Out is None:
+        return np.empty(Shape, dtype=PSYCHROLIB_ARRAY_DTYPE)
+    if Out.shape != Shape:
+        raise ValueError("Out has shape {} instead of {}".format(Out.shape, Shape))
+    return Out
+
+def OutOfRange_(Value, Lower: float = -math.inf, Upper: float = math.inf) -> bool:
+    """
+    Helper function returning whether any element of an array is outside a range, ignoring NaNs,
+    without temporary arrays. The bounds are rounded to the floating point type of the array,
+    as its elements are.
+
+    """
+    if Value.dtype == np.float32:
+        Lower, Upper = np.float32(Lower), np.float32(Upper)
+    return np.fmin.reduce(Value, axis=None, initial=math.inf) < Lower \
+        or np.fmax.reduce(Value, axis=None, initial=-math.inf) > Upper
+
+def OutOfRangeMask_(Value, Lower: float = -math.inf, Upper: float = math.inf):
+    """
+    Helper function returning a boolean array of the elements of an array outside a range, ignoring NaNs.
+    The bounds are rounded as in OutOfRange_.
+
+    """
+    if Value.dtype == np.float32:
+        Lower, Upper = np.float32(Lower), np.float32(Upper)
+    return (Value < Lower) | (Value > Upper)
+
+def NanWhere_(Value, Mask):
+    """
+    Helper function returning a copy of an array with NaN where a mask is true.
+
+    """
+    Value = np.array(np.broadcast_to(Value, np.broadcast(Value, Mask).shape))
+    Value[Mask] = np.nan
+    return Value
+
+class ArrayStatus(IntFlag):
+    """
+    Flags of the checks failed by the elements of arrays, combined in the status arrays returned by
+    GetArrayStatus and by the functions CalcPsychrometricsFrom...Array with Errors='mask'.
+
+    """
+    VALID = 0
+    NOT_FINITE = 1
+    TDRYBULB_OUT_OF_RANGE = 2
+    TWETBULB_OUT_OF_RANGE = 4
+    TWETBULB_ABOVE_TDRYBULB = 8
+    TDEWPOINT_OUT_OF_RANGE = 16
+    RELHUM_OUT_OF_RANGE = 32
+    HUMRATIO_NEGATIVE = 64
+    VAPPRES_NEGATIVE = 128
+    PRESSURE_NOT_POSITIVE = 256
+    NO_SOLUTION = 512
+
+def GetArrayStatus(**Properties):
+    """
+    Return the status of the elements of arrays of psychrometric values given as keyword arguments,
+    checked at once instead of raising at the first failure.
+
+    Args:
+        Properties : Arrays of TDryBulb, TWetBulb, TDewPoint, RelHum, HumRatio, VapPres or Pressure
+                     in the units of the corresponding functions
+
+    Returns:
+        Array of ArrayStatus flags of the failed checks, with the broadcast shape of the arrays,
+        which is zero (ArrayStatus.VALID) for the elements passing all the checks
+
+    Notes:
+        The checks are those of the scalar functions on their inputs, plus checks that the values
+        are finite and the pressure positive.
+
+    Example
+        >>> Status = psychrolib.GetArrayStatus(TDryBulb=[20, 250], RelHum=[0.5, 0.5])
+        >>> psychrolib.ArrayStatus(Status[1])
+        <ArrayStatus.TDRYBULB_OUT_OF_RANGE: 2>
+
+    """
+    Checks = {
+        'TDryBulb': ArrayStatus.TDRYBULB_OUT_OF_RANGE,
+        'TWetBulb': ArrayStatus.TWETBULB_OUT_OF_RANGE,
+        'TDewPoint': ArrayStatus.TDEWPOINT_OUT_OF_RANGE,
+        'RelHum': ArrayStatus.RELHUM_OUT_OF_RANGE,
+        'HumRatio': ArrayStatus.HUMRATIO_NEGATIVE,
+        'VapPres': ArrayStatus.VAPPRES_NEGATIVE,
+        'Pressure': ArrayStatus.PRESSURE_NOT_POSITIVE,
+    }
+    for Name in Properties:
+        if Name not in Checks:
+            raise ValueError("Unknown psychrometric value: {}".format(Name))
+    Arrays = {Name: AsArray_(Value) for Name, Value in Properties.items()}
+    Status = np.zeros(np.broadcast(*Arrays.values()).shape, dtype=np.uint16)
+
+    if isIP():
+        BOUNDS = [-148, 392]
+    else:
+        BOUNDS = [-100, 200]
+    Ranges = {
+        'TDryBulb': BOUNDS,
+        'TWetBulb': BOUNDS,
+        'TDewPoint': BOUNDS,
+        'RelHum': [0, 1],
+        'HumRatio': [0, math.inf],
+        'VapPres': [0, math.inf],
+    }
+    for Name, Value in Arrays.items():
+        Status[~np.isfinite(Value)] |= ArrayStatus.NOT_FINITE
+        if Name == 'Pressure':
+            Status[Value <= 0] |= Checks[Name]
+        else:
+            Status[OutOfRangeMask_(Value, *Ranges[Name])] |= Checks[Name]
+    if 'TDryBulb' in Arrays and 'TWetBulb' in Arrays:
+        Status[Arrays['TWetBulb'] > Arrays['TDryBulb']] |= ArrayStatus.TWETBULB_ABOVE_TDRYBULB
+    return Status
+
+def CheckErrors_(Errors: str, Policies: tuple = ('raise', 'nan', 'mask')) -> None:
+    """
+    Helper function checking an error policy of the array functions.
+
+    """
+    if Errors not in Policies:
+        raise ValueError("Errors must be one of {}".format(', '.join(repr(Policy) for Policy in Policies)))
+
+def MaskInputs_(Errors: str, **Inputs) -> tuple:
+    """
+    Helper function returning the status of the inputs of a function CalcPsychrometricsFrom...Array,
+    or None with Errors='raise', and the inputs with NaN for the elements failing the checks.
+
+    """
+    CheckErrors_(Errors)
+    if Errors == 'raise':
+        return None, tuple(Inputs.values())
+    Status = GetArrayStatus(**Inputs)
+    Invalid = Status != 0
+    if not Invalid.any():
+        return Status, tuple(Inputs.values())
+    return Status, tuple(NanWhere_(AsArray_(Value), Invalid) for Value in Inputs.values())
+
+def UnsolvedStatus_(Errors: str, Status, *Solutions) -> tuple:
+    """
+    Helper function flagging the valid elements without solution of a function CalcPsychrometricsFrom...Array,
+    and returning the status to append to the results with Errors='mask'.
+
+    """
+    if Errors != 'mask':
+        return ()
+    for Solution in Solutions:
+        Status[np.isnan(Solution) & (Status == 0)] = ArrayStatus.NO_SOLUTION
+    return (Status,)
+
+def LnPwsPolynomial_(T, Coefficients: tuple, Out, Work):
+    """
+    Helper function evaluating C0 / T + C1 + C2 T + C3 T² + C4 T³ + C5 T⁴ + C6 ln(T) in place.
+
+    """
+    C0, C1, C2, C3, C4, C5, C6 = Coefficients
+    np.multiply(T, C5, out=Out)
+    Out += C4
+    Out *= T
+    Out += C3
+    Out *= T
+    Out += C2
+    Out *= T
+    Out += C1
+    np.divide(C0, T, out=Work)
+    Out += Work
+    np.log(T, out=Work)
+    Work *= C6
+    Out += Work
+    return Out
+
+def dLnPwsPolynomial_(T, Coefficients: tuple, Out, Work):
+    """
+    Helper function evaluating the derivative of LnPwsPolynomial_ with respect to T in place.
+
+    """
+    C0, C1, C2, C3, C4, C5, C6 = Coefficients
+    np.multiply(T, 4 * C5, out=Out)
+    Out += 3 * C4
+    Out *= T
+    Out += 2 * C3
+    Out *= T
+    Out += C2
+    np.divide(C6, T, out=Work)
+    Out += Work
+    np.square(T, out=Work)
+    np.divide(-C0, Work, out=Work)
+    Out += Work
+    return Out
+
+def LnPwsCoefficients_() -> tuple:
+    """
+    Helper function returning the coefficients of the natural log of the saturation vapor pressure
+    over ice and over liquid water for LnPwsPolynomial_, and the triple point of water.
+
+    Reference:
+        ASHRAE Handbook - Fundamentals (2017) ch. 1 eqn 5 and 6
+
+    """
+    if isIP():
+        return ((-1.0214165E+04, -4.8932428, -5.3765794E-03, 1.9202377E-07, 3.5575832E-10, -9.0344688E-14, 4.1635019),
+                (-1.0440397E+04, -1.1294650E+01, -2.7022355E-02, 1.2890360E-05, -2.4780681E-09, 0., 6.5459673),
+                TRIPLE_POINT_WATER_IP)
+    else:
+        return ((-5.6745359E+03, 6.3925247, -9.677843E-03, 6.2215701E-07, 2.0747825E-09, -9.484024E-13, 4.1635019),
+                (-5.8002206E+03, 1.3914993, -4.8640239E-02, 4.1764768E-05, -1.4452093E-08, 0., 6.5459673),
+                TRIPLE_POINT_WATER_SI)
+
+def GetSatVapPresArray(TDryBulb, Out=None, Workspace=None):
+    """
+    Return saturation vapor pressure given dry-bulb temperature, for arrays. See GetSatVapPres.
+
+    """
+    TDryBulb = AsArray_(TDryBulb)
+    Shape = TDryBulb.shape
+
+    if isIP():
+        if PSYCHROLIB_VALIDATE and OutOfRange_(TDryBulb, -148, 392):
+            raise ValueError("Dry bulb temperature must be in range [-148, 392]°F")
+        T = GetTRankineFromTFahrenheit(TDryBulb, Out=Scratch_(Workspace, Shape))
+    else:
+        if PSYCHROLIB_VALIDATE and OutOfRange_(TDryBulb, -100, 200):
+            raise ValueError("Dry bulb temperature must be in range [-100, 200]°C")
+        T = GetTKelvinFromTCelsius(TDryBulb, Out=Scratch_(Workspace, Shape))
+
+    Ice, Liquid, TriplePoint = LnPwsCoefficients_()
+    BelowTriplePoint = np.less_equal(TDryBulb, TriplePoint,
+                                     out=Scratch_(Workspace, Shape, bool))
+    Work = Scratch_(Workspace, Shape)
+    LnPwsIce = LnPwsPolynomial_(T, Ice, Scratch_(Workspace, Shape), Work)
+    LnPws = LnPwsPolynomial_(T, Liquid, OutArray_(Out, Shape), Work)
+    np.copyto(LnPws, LnPwsIce, where=BelowTriplePoint)
+    Release_(Workspace, T, BelowTriplePoint, Work, LnPwsIce)
+    return np.exp(LnPws, out=LnPws)
+
+def dLnPwsArray_(TDryBulb, Out=None, Workspace=None):
+    """
+    Helper function returning the derivative of the natural log of the saturation vapor pressure
+    as a function of dry-bulb temperature, for arrays. See dLnPws_.
+
+    """
+    TDryBulb = AsArray_(TDryBulb)
+    Shape = TDryBulb.shape
+
+    if isIP():
+        T = GetTRankineFromTFahrenheit(TDryBulb, Out=Scratch_(Workspace, Shape))
+    else:
+        T = GetTKelvinFromTCelsius(TDryBulb, Out=Scratch_(Workspace, Shape))
+
+    Ice, Liquid, TriplePoint = LnPwsCoefficients_()
+    BelowTriplePoint = np.less_equal(TDryBulb, TriplePoint, out=Scratch_(Workspace, Shape, bool))
+    Work = Scratch_(Workspace, Shape)
+    dLnPwsIce = dLnPwsPolynomial_(T, Ice, Scratch_(Workspace, Shape), Work)
+    dLnPws = dLnPwsPolynomial_(T, Liquid, OutArray_(Out, Shape), Work)
+    np.copyto(dLnPws, dLnPwsIce, where=BelowTriplePoint)
+    Release_(Workspace, T, BelowTriplePoint, Work, dLnPwsIce)
+    return dLnPws
+
+def GetSatHumRatioArray(TDryBulb, Pressure, Out=None, Workspace=None):
+    """
+    Return humidity ratio of saturated air given dry-bulb temperature and pressure, for arrays.
+    See GetSatHumRatio.
+
+    """
+    TDryBulb = AsArray_(TDryBulb)
+    Pressure = AsArray_(Pressure)
+    Shape = np.broadcast(TDryBulb, Pressure).shape
+
+    SatVaporPres = Scratch_(Workspace, TDryBulb.shape)
+    GetSatVapPresArray(TDryBulb, Out=SatVaporPres, Workspace=Workspace)
+    SatHumRatio = np.multiply(SatVaporPres, 0.621945, out=OutArray_(Out, Shape))
+    Work = np.subtract(Pressure, SatVaporPres, out=Scratch_(Workspace, Shape))
+    SatHumRatio /= Work
+    Release_(Workspace, SatVaporPres, Work)
+    return np.maximum(SatHumRatio, MIN_HUM_RATIO, out=SatHumRatio)
+
+def GetVapPresFromRelHumArray(TDryBulb, RelHum, Out=None, Workspace=None):
+    """
+    Return partial pressure of water vapor given dry-bulb temperature and relative humidity, for arrays.
+    See GetVapPresFromRelHum.
+
+    """
+    TDryBulb = AsArray_(TDryBulb)
+    RelHum = AsArray_(RelHum)
+    if PSYCHROLIB_VALIDATE and OutOfRange_(RelHum, 0, 1):
+        raise ValueError("Relative humidity is outside range [0, 1]")
+
+    SatVapPres = Scratch_(Workspace, TDryBulb.shape)
+    GetSatVapPresArray(TDryBulb, Out=SatVapPres, Workspace=Workspace)
+    VapPres = np.multiply(RelHum, SatVapPres, out=OutArray_(Out, np.broadcast(TDryBulb, RelHum).shape))
+    Release_(Workspace, SatVapPres)
+    return VapPres
+
+def GetRelHumFromVapPresArray(TDryBulb, VapPres, Out=None, Workspace=None):
+    """
+    Return relative humidity given dry-bulb temperature and vapor pressure, for arrays.
+    See GetRelHumFromVapPres.
+
+    """
+    TDryBulb = AsArray_(TDryBulb)
+    VapPres = AsArray_(VapPres)
+    if PSYCHROLIB_VALIDATE and OutOfRange_(VapPres, 0):
+        raise ValueError("Partial pressure of water vapor in moist air cannot be negative")
+
+    SatVapPres = Scratch_(Workspace, TDryBulb.shape)
+    GetSatVapPresArray(TDryBulb, Out=SatVapPres, Workspace=Workspace)
+    RelHum = np.divide(VapPres, SatVapPres, out=OutArray_(Out, np.broadcast(TDryBulb, VapPres).shape))
+    Release_(Workspace, SatVapPres)
+    return RelHum
+
+def GetTDewPointFromVapPresArray(TDryBulb, VapPres, TDewPointGuess=None, Out=None, Workspace=None, Errors='raise'):
+    """
+    Return dew-point temperature given dry-bulb temperature and vapor pressure, for arrays.
+    See GetTDewPointFromVapPres.
+
+    Notes:
+        All the elements are iterated together with the Newton-Raphson method until they have
+        all converged. With Errors='nan', the elements whose vapor pressure is outside the range of
+        validity or which have not converged give NaN instead of raising.
+
+    """
+    if Workspace is None:
+        # Reuse the temporary arrays between iterations
+        Workspace = ArrayWorkspace()
+    TDryBulb = AsArray_(TDryBulb)
+    VapPres = AsArray_(VapPres)
+    Shape = np.broadcast(TDryBulb, VapPres).shape
+
+    if isIP():
+        BOUNDS = [-148, 392]
+    else:
+        BOUNDS = [-100, 200]
+
+    # Start time of the solve when solver statistics are collected
+    Start = None if PSYCHROLIB_SOLVER_STATS is None else time.perf_counter()
+    Clamped = False
+
+    # Validity check -- bounds outside which a solution cannot be found
+    CheckErrors_(Errors, ('raise', 'nan'))
+    # The bounds are widened by the error of the saturation vapor pressure calculated in the floating point
+    # type of the arrays, e.g. 55 float32 ulps at the lower bound, so that it is within them at the bounds
+    # of temperature
+    Margin = 256 * float(np.finfo(VapPres.dtype).eps)
+    Lower, Upper = PSYCHROLIB_VAPPRES_BOUNDS[0] * (1 - Margin), PSYCHROLIB_VAPPRES_BOUNDS[1] * (1 + Margin)
+    if PSYCHROLIB_VALIDATE and OutOfRange_(VapPres, Lower, Upper):
+        if Errors == 'raise':
+            raise ValueError("Partial pressure of water vapor is outside range of validity of equations")
+        VapPres = NanWhere_(VapPres, OutOfRangeMask_(VapPres, Lower, Upper))
+
+    # First guess
+    TDewPoint = OutArray_(Out, Shape)
+    if TDewPointGuess is None:
+        np.copyto(TDewPoint, TDryBulb)
+    else:
+        # Undefined (NaN) guesses fall back to the dry-bulb temperature
+        TDewPointGuess = AsArray_(TDewPointGuess)
+        np.copyto(TDewPoint, np.where(np.isnan(TDewPointGuess), TDryBulb, np.clip(TDewPointGuess, BOUNDS[0], BOUNDS[1])))
+    lnVP = np.log(VapPres, out=Scratch_(Workspace, VapPres.shape))
+    Tolerance = ArrayTolerance_()
+
+    TDewPoint_iter = Scratch_(Workspace, Shape)
+    lnVP_iter = Scratch_(Workspace, Shape)
+    d_lnVP = Scratch_(Workspace, Shape)
+
+    index = 1
+
+    while True:
+        np.copyto(TDewPoint_iter, TDewPoint)
+        GetSatVapPresArray(TDewPoint_iter, Out=lnVP_iter, Workspace=Workspace)
+        np.log(lnVP_iter, out=lnVP_iter)
+        dLnPwsArray_(TDewPoint_iter, Out=d_lnVP, Workspace=Workspace)
+
+        # New estimate, bounded by the search domain defined above
+        lnVP_iter -= lnVP
+        lnVP_iter /= d_lnVP
+        np.subtract(TDewPoint_iter, lnVP_iter, out=TDewPoint)
+        if Start is not None:
+            Clamped = Clamped or OutOfRange_(TDewPoint, BOUNDS[0], BOUNDS[1])
+        np.clip(TDewPoint, BOUNDS[0], BOUNDS[1], out=TDewPoint)
+
+        # Largest change, in the no longer needed lnVP_iter
+        np.subtract(TDewPoint, TDewPoint_iter, out=lnVP_iter)
+        np.abs(lnVP_iter, out=lnVP_iter)
+        if not OutOfRange_(lnVP_iter, Upper=Tolerance):
+            break
+
+        if (index > MAX_ITER_COUNT):
+            if Start is not None:
+                RecordSolve_('GetTDewPointFromVapPresArray', index, Clamped, False, Start)
+            if Errors == 'raise':
+                raise ValueError("Convergence not reached in GetTDewPointFromVapPresArray. Stopping.")
+            TDewPoint[lnVP_iter > Tolerance] = np.nan
+            Start = None
+            break
+
+        index = index + 1
+
+    if Start is not None:
+        RecordSolve_('GetTDewPointFromVapPresArray', index, Clamped, True, Start)
+    Release_(Workspace, lnVP, TDewPoint_iter, lnVP_iter, d_lnVP)
+    return np.minimum(TDewPoint, TDryBulb, out=TDewPoint)
+
+def GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio, Pressure, TWetBulbGuess=None, Out=None, Workspace=None,
+                                 Errors='raise'):
+    """
+    Return wet-bulb temperature given dry-bulb temperature, humidity ratio, and pressure, for arrays.
+    See GetTWetBulbFromHumRatio.
+
+    Notes:
+        All the elements are bisected together until they have all converged.
+        When TWetBulbGuess is given, a tight bracket around the guess of each element is searched for
+        first, as in GetTWetBulbFromHumRatio, for all the elements together. The full bracket is used
+        for the elements for which none is found or whose guess is NaN.
+        With Errors='nan', the elements with a negative humidity ratio, or which have no solution,
+        give NaN instead of raising.
+
+    """
+    if Workspace is None:
+        # Reuse the temporary arrays between iterations
+        Workspace = ArrayWorkspace()
+    TDryBulb = AsArray_(TDryBulb)
+    HumRatio = AsArray_(HumRatio)
+    Pressure = AsArray_(Pressure)
+    Shape = np.broadcast(TDryBulb, HumRatio, Pressure).shape
+
+    # Start time of the solve when solver statistics are collected
+    Start = None if PSYCHROLIB_SOLVER_STATS is None else time.perf_counter()
+
+    CheckErrors_(Errors, ('raise', 'nan'))
+    if PSYCHROLIB_VALIDATE and OutOfRange_(HumRatio, 0):
+        if Errors == 'raise':
+            raise ValueError("Humidity ratio cannot be negative")
+        HumRatio = NanWhere_(HumRatio, OutOfRangeMask_(HumRatio, 0))
+    Clamped = Start is not None and OutOfRange_(HumRatio, MIN_HUM_RATIO)
+    Bounded = Scratch_(Workspace, HumRatio.shape)
+    BoundedHumRatio = np.maximum(HumRatio, MIN_HUM_RATIO, out=Bounded)
+    Tolerance = ArrayTolerance_()
+
+    # Initial guesses
+    TWetBulbInf = Scratch_(Workspace, Shape)
+    TWetBulbSup = Scratch_(Workspace, Shape)
+    if TWetBulbGuess is None:
+        GetTDewPointFromHumRatioArray(TDryBulb, BoundedHumRatio, Pressure, Out=TWetBulbInf, Workspace=Workspace,
+                                      Errors=Errors)
+        np.copyto(TWetBulbSup, TDryBulb)
+    else:
+        TDryBulb, BoundedHumRatio, Pressure, TWetBulbGuess = \
+            np.broadcast_arrays(TDryBulb, BoundedHumRatio, Pressure, AsArray_(TWetBulbGuess))
+        Full = BracketTWetBulbArray_(TDryBulb, BoundedHumRatio, Pressure, TWetBulbGuess, Tolerance,
+                                     TWetBulbInf, TWetBulbSup)
+        if np.any(Full):
+            TWetBulbInf[Full] = GetTDewPointFromHumRatioArray(TDryBulb[Full], BoundedHumRatio[Full], Pressure[Full],
+                                                              Errors=Errors)
+            TWetBulbSup[Full] = TDryBulb[Full]
+    TWetBulb = np.add(TWetBulbInf, TWetBulbSup, out=OutArray_(Out, Shape))
+    TWetBulb /= 2
+
+    Wstar = Scratch_(Workspace, Shape)
+    Width = Scratch_(Workspace, Shape)
+    Above = Scratch_(Workspace, Shape, bool)
+
+    index = 1
+    # Bisection loop
+    while OutOfRange_(np.subtract(TWetBulbSup, TWetBulbInf, out=Width), Upper=Tolerance):
+
+        # Compute humidity ratio at temperature Tstar
+        GetHumRatioFromTWetBulbArray(TDryBulb, TWetBulb, Pressure, Out=Wstar, Workspace=Workspace)
+
+        # Get new bounds
+        np.greater(Wstar, BoundedHumRatio, out=Above)
+        np.copyto(TWetBulbSup, TWetBulb, where=Above)
+        np.logical_not(Above, out=Above)
+        np.copyto(TWetBulbInf, TWetBulb, where=Above)
+
+        # New guess of wet bulb temperature
+        np.add(TWetBulbSup, TWetBulbInf, out=TWetBulb)
+        TWetBulb /= 2
+
+        if (index >= MAX_ITER_COUNT):
+            if Start is not None:
+                RecordSolve_('GetTWetBulbFromHumRatioArray', index, Clamped, False, Start)
+            if Errors == 'raise':
+                raise ValueError("Convergence not reached in GetTWetBulbFromHumRatioArray. Stopping.")
+            TWetBulb[Width > Tolerance] = np.nan
+            Start = None
+            break
+
+        index = index + 1
+    if Start is not None:
+        RecordSolve_('GetTWetBulbFromHumRatioArray', index - 1, Clamped, True, Start)
+    Release_(Workspace, Bounded, TWetBulbInf, TWetBulbSup, Wstar, Width, Above)
+    return TWetBulb
+
+def BracketTWetBulbArray_(TDryBulb, BoundedHumRatio, Pressure, TWetBulbGuess, Tolerance: float,
+                          TWetBulbInf, TWetBulbSup):
+    """
+    Helper function searching for tight brackets of the wet-bulb temperature around guesses, for arrays.
+    See BracketTWetBulb_.
+
+    Args:
+        TDryBulb, BoundedHumRatio, Pressure, TWetBulbGuess : Arrays of the same shape, see BracketTWetBulb_
+        Tolerance : Tolerance of the temperatures of the array solvers
+        TWetBulbInf, TWetBulbSup : Arrays set to the lower and upper bounds of the brackets
+
+    Returns:
+        Boolean array of the elements for which no bracket was found
+
+    Notes:
+        Only the elements whose bracket does not contain the solution yet are evaluated at each step.
+
+    """
+    LowerBound = -148 if isIP() else -100
+
+    Step = Tolerance
+    np.minimum(TWetBulbGuess + Step, TDryBulb, out=TWetBulbSup)
+    np.subtract(TWetBulbSup, 2 * Step, out=TWetBulbInf)
+    Failed = np.isnan(TWetBulbGuess)
+    Pending = np.flatnonzero(~Failed)
+    Failed = Failed.ravel()
+    T, W, P = (np.ravel(Value) for Value in (TDryBulb, BoundedHumRatio, Pressure))
+    Inf, Sup = TWetBulbInf.reshape(-1), TWetBulbSup.reshape(-1)
+
+    for _ in range(10):
+        if not len(Pending):
+            break
+        Failed[Pending[Inf[Pending] < LowerBound]] = True
+        Pending = Pending[Inf[Pending] >= LowerBound]
+        Below = GetHumRatioFromTWetBulbArray(T[Pending], Inf[Pending], P[Pending]) > W[Pending]
+        AboveSup = GetHumRatioFromTWetBulbArray(T[Pending], Sup[Pending], P[Pending]) <= W[Pending]
+        Above = ~Below & AboveSup
+        # The bracket cannot be shifted above the dry-bulb temperature, e.g. where the humidity
+        # ratio is bounded at MIN_HUM_RATIO because the saturation pressure exceeds the pressure
+        Stuck = Above & (Sup[Pending] >= T[Pending])
+        Failed[Pending[Stuck]] = True
+        # Solution below the bracket
+        Index = Pending[Below]
+        Sup[Index] = Inf[Index]
+        Inf[Index] -= 2 * Step
+        # Solution above the bracket
+        Index = Pending[Above & ~Stuck]
+        Inf[Index] = Sup[Index]
+        Sup[Index] = np.minimum(Sup[Index] + 2 * Step, T[Index])
+        Pending = Pending[Below | (Above & ~Stuck)]
+        Step = 2 * Step
+    Failed[Pending] = True
+    return Failed.reshape(TWetBulbInf.shape)
+
+def WetBulbCoefficients_() -> tuple:
+    """
+    Helper function returning the coefficients (a, b, e, c, d) of the humidity ratio given dry-bulb and
+    wet-bulb temperatures, ((a - b Twb) Wsstar - c (Tdb - Twb)) / (a + d Tdb - e Twb), above and below
+    freezing.
+
+    Reference:
+        ASHRAE Handbook - Fundamentals (2017) ch. 1 eqn 33 and 35
+
+    """
+    if isIP():
+        return (1093, 0.556, 1.0, 0.240, 0.444), (1220, 0.04, 0.48, 0.240, 0.444)
+    else:
+        return (2501., 2.326, 4.186, 1.006, 1.86), (2830., 0.24, 2.1, 1.006, 1.86)
+
+def HumRatioFromTWetBulbBranch_(TDryBulb, TWetBulb, Wsstar, Coefficients: tuple, Out, Work, Work2):
+    """
+    Helper function evaluating ((a - b Twb) Wsstar - c (Tdb - Twb)) / (a + d Tdb - e Twb) in place.
+    See WetBulbCoefficients_.
+
+    """
+    a, b, e, c, d = Coefficients
+    np.multiply(TWetBulb, -b, out=Out)
+    Out += a
+    Out *= Wsstar
+    np.subtract(TDryBulb, TWetBulb, out=Work)
+    Work *= c
+    Out -= Work
+    np.multiply(TDryBulb, d, out=Work)
+    Work += a
+    np.multiply(TWetBulb, e, out=Work2)
+    Work -= Work2
+    Out /= Work
+    return Out
+
+def GetHumRatioFromTWetBulbArray(TDryBulb, TWetBulb, Pressure, Out=None, Workspace=None):
+    """
+    Return humidity ratio given dry-bulb temperature, wet-bulb temperature, and pressure, for arrays.
+    See GetHumRatioFromTWetBulb.
+
+    """
+    TDryBulb = AsArray_(TDryBulb)
+    TWetBulb = AsArray_(TWetBulb)
+    Pressure = AsArray_(Pressure)
+    Shape = np.broadcast(TDryBulb, TWetBulb, Pressure).shape
+
+    if PSYCHROLIB_VALIDATE:
+        Mask = Scratch_(Workspace, Shape, bool)
+        Above = np.greater(TWetBulb, TDryBulb, out=Mask).any()
+        Release_(Workspace, Mask)
+        if Above:
+            raise ValueError("Wet bulb temperature is above dry bulb temperature")
+
+    Wsstar = Scratch_(Workspace, np.broadcast(TWetBulb, Pressure).shape)
+    GetSatHumRatioArray(TWetBulb, Pressure, Out=Wsstar, Workspace=Workspace)
+    HumRatio = HumRatioFromTWetBulbWsstar_(TDryBulb, TWetBulb, Wsstar, Shape, Out, Workspace)
+    Release_(Workspace, Wsstar)
+    return HumRatio
+
+def HumRatioFromTWetBulbWsstar_(TDryBulb, TWetBulb, Wsstar, Shape: tuple, Out, Workspace):
+    """
+    Helper function returning the humidity ratio given dry-bulb and wet-bulb temperatures, and humidity
+    ratio of saturated air at the wet-bulb temperature, for arrays.
+
+    """
+    Liquid, Ice = WetBulbCoefficients_()
+    Work = Scratch_(Workspace, Shape)
+    Work2 = Scratch_(Workspace, Shape)
+    HumRatioIce = HumRatioFromTWetBulbBranch_(TDryBulb, TWetBulb, Wsstar, Ice, Scratch_(Workspace, Shape), Work, Work2)
+    HumRatio = HumRatioFromTWetBulbBranch_(TDryBulb, TWetBulb, Wsstar, Liquid, OutArray_(Out, Shape), Work, Work2)
+    Freezing = np.less(TWetBulb, FREEZING_POINT_WATER_IP if isIP() else FREEZING_POINT_WATER_SI,
+                       out=Scratch_(Workspace, TWetBulb.shape, bool))
+    np.copyto(HumRatio, HumRatioIce, where=Freezing)
+    Release_(Workspace, Work, Work2, HumRatioIce, Freezing)
+    # Validity check.
+    return np.maximum(HumRatio, MIN_HUM_RATIO, out=HumRatio)
+
+def GetHumRatioFromRelHumArray(TDryBulb, RelHum, Pressure, Out=None, Workspace=None):
+    """
+    Return humidity ratio given dry-bulb temperature, relative humidity, and pressure, for arrays.
+    See GetHumRatioFromRelHum.
+
+    """
+    Pressure = AsArray_(Pressure)
+    VapPres = GetVapPresFromRelHumArray(TDryBulb, RelHum, Workspace=Workspace,
+                                        Out=Scratch_(Workspace, np.broadcast(TDryBulb, RelHum).shape))
+    HumRatio = GetHumRatioFromVapPresArray(VapPres, Pressure, Out=Out, Workspace=Workspace)
+    Release_(Workspace, VapPres)
+    return HumRatio
+
+def GetRelHumFromHumRatioArray(TDryBulb, HumRatio, Pressure, Out=None, Workspace=None):
+    """
+    Return relative humidity given dry-bulb temperature, humidity ratio, and pressure, for arrays.
+    See GetRelHumFromHumRatio.
+
+    """
+    VapPres = GetVapPresFromHumRatioArray(HumRatio, Pressure, Workspace=Workspace,
+                                          Out=Scratch_(Workspace, np.broadcast(HumRatio, Pressure).shape))
+    RelHum = GetRelHumFromVapPresArray(TDryBulb, VapPres, Out=Out, Workspace=Workspace)
+    Release_(Workspace, VapPres)
+    return RelHum
+
+def GetHumRatioFromTDewPointArray(TDewPoint, Pressure, Out=None, Workspace=None):
+    """
+    Return humidity ratio given dew-point temperature and pressure, for arrays.
+    See GetHumRatioFromTDewPoint.
+
+    """
+    TDewPoint = AsArray_(TDewPoint)
+    VapPres = GetSatVapPresArray(TDewPoint, Workspace=Workspace,
+                                 Out=Scratch_(Workspace, TDewPoint.shape))
+    HumRatio = GetHumRatioFromVapPresArray(VapPres, Pressure, Out=Out, Workspace=Workspace)
+    Release_(Workspace, VapPres)
+    return HumRatio
+
+def GetTDewPointFromHumRatioArray(TDryBulb, HumRatio, Pressure, Out=None, Workspace=None, Errors='raise'):
+    """
+    Return dew-point temperature given dry-bulb temperature, humidity ratio, and pressure, for arrays.
+    See GetTDewPointFromHumRatio and, for Errors, GetTDewPointFromVapPresArray.
+
+    """
+    VapPres = GetVapPresFromHumRatioArray(HumRatio, Pressure, Workspace=Workspace,
+                                          Out=Scratch_(Workspace, np.broadcast(HumRatio, Pressure).shape))
+    TDewPoint = GetTDewPointFromVapPresArray(TDryBulb, VapPres, Out=Out, Workspace=Workspace, Errors=Errors)
+    Release_(Workspace, VapPres)
+    return TDewPoint
+
+def GetTWetBulbFromRelHumArray(TDryBulb, RelHum, Pressure):
+    """
+    Return wet-bulb temperature given dry-bulb temperature, relative humidity, and pressure, for arrays.
+    See GetTWetBulbFromRelHum.
+
+    """
+    HumRatio = GetHumRatioFromRelHumArray(TDryBulb, RelHum, Pressure)
+    return GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio, Pressure)
+
+def GetTDewPointFromRelHumArray(TDryBulb, RelHum):
+    """
+    Return dew-point temperature given dry-bulb temperature and relative humidity, for arrays.
+    See GetTDewPointFromRelHum.
+
+    """
+    VapPres = GetVapPresFromRelHumArray(TDryBulb, RelHum)
+    return GetTDewPointFromVapPresArray(TDryBulb, VapPres)
+
+def GetHumRatioFromVapPresArray(VapPres, Pressure, Out=None, Workspace=None):
+    """
+    Return humidity ratio given water vapor pressure and atmospheric pressure, for arrays.
+    See GetHumRatioFromVapPres.
+
+    """
+    VapPres = AsArray_(VapPres)
+    Pressure = AsArray_(Pressure)
+    Shape = np.broadcast(VapPres, Pressure).shape
+    if PSYCHROLIB_VALIDATE and OutOfRange_(VapPres, 0):
+        raise ValueError("Partial pressure of water vapor in moist air cannot be negative")
+
+    # The denominator is calculated first, so that Out can be VapPres
+    Work = np.subtract(Pressure, VapPres, out=Scratch_(Workspace, Shape))
+    HumRatio = np.multiply(VapPres, 0.621945, out=OutArray_(Out, Shape))
+    HumRatio /= Work
+    Release_(Workspace, Work)
+    return np.maximum(HumRatio, MIN_HUM_RATIO, out=HumRatio)
+
+def GetVapPresFromHumRatioArray(HumRatio, Pressure, Out=None, Workspace=None):
+    """
+    Return vapor pressure given humidity ratio and pressure, for arrays. See GetVapPresFromHumRatio.
+
+    """
+    HumRatio = AsArray_(HumRatio)
+    Pressure = AsArray_(Pressure)
+    Shape = np.broadcast(HumRatio, Pressure).shape
+    if PSYCHROLIB_VALIDATE and OutOfRange_(HumRatio, 0):
+        raise ValueError("Humidity ratio is negative")
+    BoundedHumRatio = np.maximum(HumRatio, MIN_HUM_RATIO,
+                                 out=Scratch_(Workspace, HumRatio.shape))
+
+    VapPres = np.multiply(Pressure, BoundedHumRatio, out=OutArray_(Out, Shape))
+    BoundedHumRatio += 0.621945
+    VapPres /= BoundedHumRatio
+    Release_(Workspace, BoundedHumRatio)
+    return VapPres
+
+def GetSpecificHumFromHumRatioArray(HumRatio):
+    """
+    Return the specific humidity from humidity ratio, for arrays. See GetSpecificHumFromHumRatio.
+
+    """
+    HumRatio = AsArray_(HumRatio)
+    if PSYCHROLIB_VALIDATE and np.any(HumRatio < 0):
+        raise ValueError("Humidity ratio cannot be negative")
+    BoundedHumRatio = np.maximum(HumRatio, MIN_HUM_RATIO)
+
+    return BoundedHumRatio / (1.0 + BoundedHumRatio)
+
+def GetHumRatioFromSpecificHumArray(SpecificHum):
+    """
+    Return the humidity ratio from specific humidity, for arrays. See GetHumRatioFromSpecificHum.
+
+    """
+    SpecificHum = AsArray_(SpecificHum)
+    if PSYCHROLIB_VALIDATE and np.any((SpecificHum < 0.0) | (SpecificHum >= 1.0)):
+        raise ValueError("Specific humidity is outside range [0, 1[")
+
+    HumRatio = SpecificHum / (1.0 - SpecificHum)
+    return np.maximum(HumRatio, MIN_HUM_RATIO)
+
+def GetTDryBulbFromEnthalpyAndHumRatioArray(MoistAirEnthalpy, HumRatio):
+    """
+    Return dry bulb temperature from enthalpy and humidity ratio, for arrays.
+    See GetTDryBulbFromEnthalpyAndHumRatio.
+
+    """
+    MoistAirEnthalpy = AsArray_(MoistAirEnthalpy)
+    HumRatio = AsArray_(HumRatio)
+    if PSYCHROLIB_VALIDATE and np.any(HumRatio < 0):
+        raise ValueError("Humidity ratio is negative")
+    BoundedHumRatio = np.maximum(HumRatio, MIN_HUM_RATIO)
+
+    if isIP():
+        return (MoistAirEnthalpy - 1061.0 * BoundedHumRatio) / (0.240 + 0.444 * BoundedHumRatio)
+    else:
+        return (MoistAirEnthalpy / 1000.0 - 2501.0 * BoundedHumRatio) / (1.006 + 1.86 * BoundedHumRatio)
+
+def GetHumRatioFromEnthalpyAndTDryBulbArray(MoistAirEnthalpy, TDryBulb):
+    """
+    Return humidity ratio from enthalpy and dry-bulb temperature, for arrays.
+    See GetHumRatioFromEnthalpyAndTDryBulb.
+
+    """
+    MoistAirEnthalpy = AsArray_(MoistAirEnthalpy)
+    TDryBulb = AsArray_(TDryBulb)
+
+    if isIP():
+        HumRatio = (MoistAirEnthalpy - 0.240 * TDryBulb) / (1061.0 + 0.444 * TDryBulb)
+    else:
+        HumRatio = (MoistAirEnthalpy / 1000.0 - 1.006 * TDryBulb) / (2501.0 + 1.86 * TDryBulb)
+    return np.maximum(HumRatio, MIN_HUM_RATIO)
+
+def GetVaporPressureDeficitArray(TDryBulb, HumRatio, Pressure):
+    """
+    Return vapor pressure deficit given dry-bulb temperature, humidity ratio, and pressure, for arrays.
+    See GetVaporPressureDeficit.
+
+    """
+    RelHum = GetRelHumFromHumRatioArray(TDryBulb, HumRatio, Pressure)
+    return GetSatVapPresArray(TDryBulb) * (1 - RelHum)
+
+def GetDegreeOfSaturationArray(TDryBulb, HumRatio, Pressure, Out=None, Workspace=None):
+    """
+    Return the degree of saturation given dry-bulb temperature, humidity ratio, and atmospheric pressure,
+    for arrays. See GetDegreeOfSaturation.
+
+    """
+    TDryBulb = AsArray_(TDryBulb)
+    HumRatio = AsArray_(HumRatio)
+    Pressure = AsArray_(Pressure)
+    if PSYCHROLIB_VALIDATE and OutOfRange_(HumRatio, 0):
+        raise ValueError("Humidity ratio is negative")
+    BoundedHumRatio = np.maximum(HumRatio, MIN_HUM_RATIO,
+                                 out=Scratch_(Workspace, HumRatio.shape))
+
+    SatHumRatio = Scratch_(Workspace, np.broadcast(TDryBulb, Pressure).shape)
+    GetSatHumRatioArray(TDryBulb, Pressure, Out=SatHumRatio, Workspace=Workspace)
+    DegreeOfSaturation = np.divide(BoundedHumRatio, SatHumRatio,
+                                   out=OutArray_(Out, np.broadcast(TDryBulb, HumRatio, Pressure).shape))
+    Release_(Workspace, BoundedHumRatio, SatHumRatio)
+    return DegreeOfSaturation
+
+def GetMoistAirEnthalpyArray(TDryBulb, HumRatio, Out=None, Workspace=None):
+    """
+    Return moist air enthalpy given dry-bulb temperature and humidity ratio, for arrays.
+    See GetMoistAirEnthalpy.
+
+    """
+    TDryBulb = AsArray_(TDryBulb)
+    HumRatio = AsArray_(HumRatio)
+    Shape = np.broadcast(TDryBulb, HumRatio).shape
+    if PSYCHROLIB_VALIDATE and OutOfRange_(HumRatio, 0):
+        raise ValueError("Humidity ratio is negative")
+
+    Work = Scratch_(Workspace, Shape)
+    if isIP():
+        np.multiply(TDryBulb, 0.444, out=Work)
+        Work += 1061
+    else:
+        np.multiply(TDryBulb, 1.86, out=Work)
+        Work += 2501.
+    BoundedHumRatio = np.maximum(HumRatio, MIN_HUM_RATIO, out=Scratch_(Workspace, HumRatio.shape))
+    Work *= BoundedHumRatio
+    MoistAirEnthalpy = np.multiply(TDryBulb, 0.240 if isIP() else 1.006, out=OutArray_(Out, Shape))
+    MoistAirEnthalpy += Work
+    if not isIP():
+        MoistAirEnthalpy *= 1000
+    Release_(Workspace, Work, BoundedHumRatio)
+    return MoistAirEnthalpy
+
+def GetMoistAirVolumeArray(TDryBulb, HumRatio, Pressure, Out=None, Workspace=None):
+    """
+    Return moist air specific volume given dry-bulb temperature, humidity ratio, and pressure, for arrays.
+    See GetMoistAirVolume.
+
+    """
+    TDryBulb = AsArray_(TDryBulb)
+    HumRatio = AsArray_(HumRatio)
+    Pressure = AsArray_(Pressure)
+    Shape = np.broadcast(TDryBulb, HumRatio, Pressure).shape
+    if PSYCHROLIB_VALIDATE and OutOfRange_(HumRatio, 0):
+        raise ValueError("Humidity ratio is negative")
+
+    Work = np.maximum(HumRatio, MIN_HUM_RATIO, out=Scratch_(Workspace, HumRatio.shape))
+    Work *= 1.607858
+    Work += 1
+    MoistAirVolume = OutArray_(Out, Shape)
+    if isIP():
+        GetTRankineFromTFahrenheit(TDryBulb, Out=MoistAirVolume)
+        MoistAirVolume *= R_DA_IP
+        MoistAirVolume *= Work
+        Pressure144 = np.multiply(Pressure, 144, out=Scratch_(Workspace, Pressure.shape))
+        MoistAirVolume /= Pressure144
+        Release_(Workspace, Pressure144)
+    else:
+        GetTKelvinFromTCelsius(TDryBulb, Out=MoistAirVolume)
+        MoistAirVolume *= R_DA_SI
+        MoistAirVolume *= Work
+        MoistAirVolume /= Pressure
+    Release_(Workspace, Work)
+    return MoistAirVolume
+
+def GetTDryBulbFromMoistAirVolumeAndHumRatioArray(MoistAirVolume, HumRatio, Pressure):
+    """
+    Return dry-bulb temperature given moist air specific volume, humidity ratio, and pressure, for arrays.
+    See GetTDryBulbFromMoistAirVolumeAndHumRatio.
+
+    """
+    MoistAirVolume = AsArray_(MoistAirVolume)
+    HumRatio = AsArray_(HumRatio)
+    Pressure = AsArray_(Pressure)
+    if PSYCHROLIB_VALIDATE and np.any(HumRatio < 0):
+        raise ValueError("Humidity ratio is negative")
+    BoundedHumRatio = np.maximum(HumRatio, MIN_HUM_RATIO)
+
+    if isIP():
+        return GetTFahrenheitFromTRankine(MoistAirVolume * (144 * Pressure)
+                                          / (R_DA_IP * (1 + 1.607858 * BoundedHumRatio)))
+    else:
+        return GetTCelsiusFromTKelvin(MoistAirVolume * Pressure
+                                      / (R_DA_SI * (1 + 1.607858 * BoundedHumRatio)))
+
+def GetMoistAirDensityArray(TDryBulb, HumRatio, Pressure):
+    """
+    Return moist air density given humidity ratio, dry bulb temperature, and pressure, for arrays.
+    See GetMoistAirDensity.
+
+    """
+    HumRatio = AsArray_(HumRatio)
+    if PSYCHROLIB_VALIDATE and np.any(HumRatio < 0):
+        raise ValueError("Humidity ratio is negative")
+    BoundedHumRatio = np.maximum(HumRatio, MIN_HUM_RATIO)
+
+    MoistAirVolume = GetMoistAirVolumeArray(TDryBulb, BoundedHumRatio, Pressure)
+    return (1 + BoundedHumRatio) / MoistAirVolume
+
+def GetVapPresFromTDewPointArray(TDewPoint):
+    """
+    Return vapor pressure given dew point temperature, for arrays. See GetVapPresFromTDewPoint.
+
+    """
+    return GetSatVapPresArray(TDewPoint)
+
+def GetSatAirEnthalpyArray(TDryBulb, Pressure):
+    """
+    Return saturated air enthalpy given dry-bulb temperature and pressure, for arrays.
+    See GetSatAirEnthalpy.
+
+    """
+    SatHumRatio = GetSatHumRatioArray(TDryBulb, Pressure)
+    return GetMoistAirEnthalpyArray(TDryBulb, SatHumRatio)
+
+def GetDryAirEnthalpyArray(TDryBulb):
+    """
+    Return dry-air enthalpy given dry-bulb temperature, for arrays. See GetDryAirEnthalpy.
+
+    """
+    TDryBulb = AsArray_(TDryBulb)
+    if isIP():
+        return 0.240 * TDryBulb
+    else:
+        return 1006 * TDryBulb
+
+def GetDryAirDensityArray(TDryBulb, Pressure):
+    """
+    Return dry-air density given dry-bulb temperature and pressure, for arrays. See GetDryAirDensity.
+
+    """
+    TDryBulb = AsArray_(TDryBulb)
+    Pressure = AsArray_(Pressure)
+    if isIP():
+        return (144 * Pressure) / R_DA_IP / GetTRankineFromTFahrenheit(TDryBulb)
+    else:
+        return Pressure / R_DA_SI / GetTKelvinFromTCelsius(TDryBulb)
+
+def GetDryAirVolumeArray(TDryBulb, Pressure):
+    """
+    Return dry-air volume given dry-bulb temperature and pressure, for arrays. See GetDryAirVolume.
+
+    """
+    TDryBulb = AsArray_(TDryBulb)
+    Pressure = AsArray_(Pressure)
+    if isIP():
+        return R_DA_IP * GetTRankineFromTFahrenheit(TDryBulb) / (144 * Pressure)
+    else:
+        return R_DA_SI * GetTKelvinFromTCelsius(TDryBulb) / Pressure
+
+def GetStandardAtmPressureArray(Altitude):
+    """
+    Return standard atmosphere barometric pressure given the elevation (altitude), for arrays.
+    See GetStandardAtmPressure.
+
+    """
+    Altitude = AsArray_(Altitude)
+    if isIP():
+        return 14.696 * np.power(1 - 6.8754e-06 * Altitude, 5.2559)
+    else:
+        return 101325 * np.power(1 - 2.25577e-05 * Altitude, 5.2559)
+
+def OutArrays_(Out, Count: int, Shape: tuple) -> tuple:
+    """
+    Helper function returning the arrays in which to store the results of an array function.
+
+    """
+    if Out is None:
+        return tuple(np.empty(Shape, dtype=PSYCHROLIB_ARRAY_DTYPE) for _ in range(Count))
+    if len(Out) != Count:
+        raise ValueError("Out must be a tuple of {} arrays".format(Count))
+    return tuple(OutArray_(Array, Shape) for Array in Out)
+
+def CalcPsychrometricsFromTWetBulbArray(TDryBulb, TWetBulb, Pressure, Out=None, Workspace=None, Errors='raise') -> tuple:
+    """
+    Utility function to calculate humidity ratio, dew-point temperature, relative humidity,
+    vapour pressure, moist air enthalpy, moist air volume, and degree of saturation of air given
+    dry-bulb temperature, wet-bulb temperature, and pressure, for arrays. See CalcPsychrometricsFromTWetBulb.
+
+    Notes:
+        Out is an optional tuple of the seven arrays in which the results are stored.
+        Errors is the policy for the elements failing the validity checks or without solution:
+        'raise' raises a ValueError, 'nan' gives NaN results for these elements, and 'mask' also
+        appends to the results an array of ArrayStatus flags of the checks which failed. The inputs
+        are checked at once with GetArrayStatus, so that a few invalid elements do not abort the batch.
+
+    """
+    if Workspace is None:
+        Workspace = ArrayWorkspace()
+    Status, (TDryBulb, TWetBulb, Pressure) = MaskInputs_(Errors, TDryBulb=TDryBulb, TWetBulb=TWetBulb, Pressure=Pressure)
+    SolverErrors = 'raise' if Errors == 'raise' else 'nan'
+    Shape = np.broadcast(AsArray_(TDryBulb), AsArray_(TWetBulb), AsArray_(Pressure)).shape
+    HumRatio, TDewPoint, RelHum, VapPres, MoistAirEnthalpy, MoistAirVolume, DegreeOfSaturation = Out = \
+        OutArrays_(Out, 7, Shape)
+
+    GetHumRatioFromTWetBulbArray(TDryBulb, TWetBulb, Pressure, Out=HumRatio, Workspace=Workspace)
+    GetTDewPointFromHumRatioArray(TDryBulb, HumRatio, Pressure, Out=TDewPoint, Workspace=Workspace,
+                                  Errors=SolverErrors)
+    GetRelHumFromHumRatioArray(TDryBulb, HumRatio, Pressure, Out=RelHum, Workspace=Workspace)
+    GetVapPresFromHumRatioArray(HumRatio, Pressure, Out=VapPres, Workspace=Workspace)
+    GetMoistAirEnthalpyArray(TDryBulb, HumRatio, Out=MoistAirEnthalpy, Workspace=Workspace)
+    GetMoistAirVolumeArray(TDryBulb, HumRatio, Pressure, Out=MoistAirVolume, Workspace=Workspace)
+    GetDegreeOfSaturationArray(TDryBulb, HumRatio, Pressure, Out=DegreeOfSaturation, Workspace=Workspace)
+    return Out + UnsolvedStatus_(Errors, Status, TDewPoint)
+
+def CalcPsychrometricsFromTDewPointArray(TDryBulb, TDewPoint, Pressure, Out=None, Workspace=None, Errors='raise') -> tuple:
+    """
+    Utility function to calculate humidity ratio, wet-bulb temperature, relative humidity,
+    vapour pressure, moist air enthalpy, moist air volume, and degree of saturation of air given
+    dry-bulb temperature, dew-point temperature, and pressure, for arrays. See CalcPsychrometricsFromTDewPoint.
+
+    Notes:
+        Out is an optional tuple of the seven arrays in which the results are stored.
+        Errors is the policy for the elements failing the validity checks or without solution:
+        'raise' raises a ValueError, 'nan' gives NaN results for these elements, and 'mask' also
+        appends to the results an array of ArrayStatus flags of the checks which failed. The inputs
+        are checked at once with GetArrayStatus, so that a few invalid elements do not abort the batch.
+
+    """
+    if Workspace is None:
+        Workspace = ArrayWorkspace()
+    Status, (TDryBulb, TDewPoint, Pressure) = MaskInputs_(Errors, TDryBulb=TDryBulb, TDewPoint=TDewPoint, Pressure=Pressure)
+    SolverErrors = 'raise' if Errors == 'raise' else 'nan'
+    Shape = np.broadcast(AsArray_(TDryBulb), AsArray_(TDewPoint), AsArray_(Pressure)).shape
+    HumRatio, TWetBulb, RelHum, VapPres, MoistAirEnthalpy, MoistAirVolume, DegreeOfSaturation = Out = \
+        OutArrays_(Out, 7, Shape)
+
+    GetHumRatioFromTDewPointArray(TDewPoint, Pressure, Out=HumRatio, Workspace=Workspace)
+    GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio, Pressure, Out=TWetBulb, Workspace=Workspace,
+                                 Errors=SolverErrors)
+    GetRelHumFromHumRatioArray(TDryBulb, HumRatio, Pressure, Out=RelHum, Workspace=Workspace)
+    GetVapPresFromHumRatioArray(HumRatio, Pressure, Out=VapPres, Workspace=Workspace)
+    GetMoistAirEnthalpyArray(TDryBulb, HumRatio, Out=MoistAirEnthalpy, Workspace=Workspace)
+    GetMoistAirVolumeArray(TDryBulb, HumRatio, Pressure, Out=MoistAirVolume, Workspace=Workspace)
+    GetDegreeOfSaturationArray(TDryBulb, HumRatio, Pressure, Out=DegreeOfSaturation, Workspace=Workspace)
+    return Out + UnsolvedStatus_(Errors, Status, TWetBulb)
+
+def CalcPsychrometricsFromRelHumArray(TDryBulb, RelHum, Pressure, Out=None, Workspace=None, Errors='raise') -> tuple:
+    """
+    Utility function to calculate humidity ratio, wet-bulb temperature, dew-point temperature,
+    vapour pressure, moist air enthalpy, moist air volume, and degree of saturation of air given
+    dry-bulb temperature, relative humidity and pressure, for arrays. See CalcPsychrometricsFromRelHum.
+
+    Notes:
+        Out is an optional tuple of the seven arrays in which the results are stored.
+        Errors is the policy for the elements failing the validity checks or without solution:
+        'raise' raises a ValueError, 'nan' gives NaN results for these elements, and 'mask' also
+        appends to the results an array of ArrayStatus flags of the checks which failed. The inputs
+        are checked at once with GetArrayStatus, so that a few invalid elements do not abort the batch.
+
+    Example
+        >>> Workspace = psychrolib.ArrayWorkspace()
+        >>> Out = tuple(np.empty(TDryBulb.shape) for _ in range(7))
+        >>> for RelHum in RelHumSeries:    # No new arrays after the first iteration
+        ...     psychrolib.CalcPsychrometricsFromRelHumArray(TDryBulb, RelHum, 101325, Out, Workspace)
+
+    """
+    if Workspace is None:
+        Workspace = ArrayWorkspace()
+    Status, (TDryBulb, RelHum, Pressure) = MaskInputs_(Errors, TDryBulb=TDryBulb, RelHum=RelHum, Pressure=Pressure)
+    SolverErrors = 'raise' if Errors == 'raise' else 'nan'
+    Shape = np.broadcast(AsArray_(TDryBulb), AsArray_(RelHum), AsArray_(Pressure)).shape
+    HumRatio, TWetBulb, TDewPoint, VapPres, MoistAirEnthalpy, MoistAirVolume, DegreeOfSaturation = Out = \
+        OutArrays_(Out, 7, Shape)
+
+    GetHumRatioFromRelHumArray(TDryBulb, RelHum, Pressure, Out=HumRatio, Workspace=Workspace)
+    GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio, Pressure, Out=TWetBulb, Workspace=Workspace,
+                                 Errors=SolverErrors)
+    GetTDewPointFromHumRatioArray(TDryBulb, HumRatio, Pressure, Out=TDewPoint, Workspace=Workspace,
+                                  Errors=SolverErrors)
+    GetVapPresFromHumRatioArray(HumRatio, Pressure, Out=VapPres, Workspace=Workspace)
+    GetMoistAirEnthalpyArray(TDryBulb, HumRatio, Out=MoistAirEnthalpy, Workspace=Workspace)
+    GetMoistAirVolumeArray(TDryBulb, HumRatio, Pressure, Out=MoistAirVolume, Workspace=Workspace)
+    GetDegreeOfSaturationArray(TDryBulb, HumRatio, Pressure, Out=DegreeOfSaturation, Workspace=Workspace)
+    return Out + UnsolvedStatus_(Errors, Status, TWetBulb, TDewPoint)
+
+def SolveSeries_(Solver: Callable, Inputs: tuple, Guess):
+    """
+    Helper function solving time series with an array solver, using the solution at each time step as guess
+    for the next one.
+
+    Notes:
+        The series are folded into about √N segments of about √N time steps, which are solved together time step
+        by time step, so that the array solver is called about √N times for N time steps. The first time step
+        of the first segment is solved with Guess, if given, and that of the other segments without guess,
+        as is the time step after a NaN solution: the array solvers ignore NaN guesses.
+
+    """
+    Inputs = np.broadcast_arrays(*(AsArray_(Input) for Input in Inputs))
+    Shape = Inputs[0].shape
+    Length = Shape[0]
+    Rows = max(1, int(math.ceil(math.sqrt(Length))))
+    Segments = max(1, int(math.ceil(Length / Rows)))
+    Padding = Segments * Rows - Length
+
+    def Fold(Input):
+        # Time steps padded with the last one, to (time step in the segment, segment and other dimensions)
+        Input = Input.reshape(Length, -1)
+        Input = np.concatenate([Input, np.repeat(Input[-1:], Padding, axis=0)])
+        return Input.reshape(Segments, Rows, -1).transpose(1, 0, 2).reshape(Rows, -1)
+
+    Folded = [Fold(Input) for Input in Inputs]
+    Result = np.empty(Folded[0].shape, dtype=PSYCHROLIB_ARRAY_DTYPE)
+    if Guess is not None:
+        # Guess of the first segment only, the others start at other time steps
+        Guess = np.concatenate([np.broadcast_to(AsArray_(Guess), Shape[1:]).ravel(),
+                                np.full(Result.shape[1] - Result.shape[1] // Segments, np.nan)])
+    Workspace = ArrayWorkspace()
+    for Row in range(Rows):
+        Solver(*(Input[Row] for Input in Folded), Guess, Out=Result[Row], Workspace=Workspace)
+        Guess = Result[Row]
+    Result = Result.reshape(Rows, Segments, -1).transpose(1, 0, 2).reshape(Segments * Rows, -1)
+    return Result[:Length].reshape(Shape)
+
+def GetTDewPointFromVapPresSeries(TDryBulb, VapPres, TDewPointGuess=None):
+    """
+    Return dew-point temperature given time series of dry-bulb temperature and vapor pressure, using the
+    solution at each time step as first guess for the next one.
+
+    Args:
+        TDryBulb : Array of dry-bulb temperature in °F [IP] or °C [SI], with time along the first axis
+        VapPres: Array of partial pressure of water vapor in moist air in Psi [IP] or Pa [SI],
+                 with time along the first axis
+        TDewPointGuess : Optional first guess of the dew-point temperature at the first time step
+                         in °F [IP] or °C [SI], e.g. the last solution of the previous batch
+
+    Returns:
+        Array of dew-point temperature in °F [IP] or °C [SI]
+
+    Notes:
+        The series are solved with GetTDewPointFromVapPresArray, in segments of about √N time steps which
+        are solved together, so that N time steps take about √N calls of the array function.
+
+    """
+    CheckNumpy_()
+    return SolveSeries_(GetTDewPointFromVapPresArray, (TDryBulb, VapPres), TDewPointGuess)
+
+def GetTWetBulbFromHumRatioSeries(TDryBulb, HumRatio, Pressure, TWetBulbGuess=None):
+    """
+    Return wet-bulb temperature given time series of dry-bulb temperature, humidity ratio, and pressure,
+    using the solution at each time step as guess for the next one.
+
+    Args:
+        TDryBulb : Array of dry-bulb temperature in °F [IP] or °C [SI], with time along the first axis
+        HumRatio : Array of humidity ratio in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI],
+                   with time along the first axis
+        Pressure : Atmospheric pressure in Psi [IP] or Pa [SI], scalar or array with time along the first axis
+        TWetBulbGuess : Optional guess of the wet-bulb temperature at the first time step
+                        in °F [IP] or °C [SI], e.g. the last solution of the previous batch
+
+    Returns:
+        Array of wet-bulb temperature in °F [IP] or °C [SI]
+
+    Notes:
+        The series are solved with GetTWetBulbFromHumRatioArray, in segments of about √N time steps which
+        are solved together, so that N time steps take about √N calls of the array function.
+
+    """
+    CheckNumpy_()
+    return SolveSeries_(GetTWetBulbFromHumRatioArray, (TDryBulb, HumRatio, Pressure), TWetBulbGuess)
+
+
+#######################################################################################################
+# Moist air state
+#######################################################################################################
+
+class MoistAirState:
+    """
+    State of moist air, defined by pressure and two independent properties, whose other properties are
+    calculated on first access and cached.
+
+    Args:
+        Pressure : Atmospheric pressure in Psi [IP] or Pa [SI]
+        TDryBulb : Dry-bulb temperature in °F [IP] or °C [SI]
+        HumRatio : Humidity ratio in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI]
+        RelHum : Relative humidity in range [0, 1]
+        TWetBulb : Wet-bulb temperature in °F [IP] or °C [SI]
+        TDewPoint : Dew-point temperature in °F [IP] or °C [SI]
+        VapPres : Partial pressure of water vapor in moist air in Psi [IP] or Pa [SI]
+        SpecificHum : Specific humidity in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI]
+        MoistAirEnthalpy : Moist air enthalpy in Btu lb⁻¹ [IP] or J kg⁻¹ [SI]
+        MoistAirVolume : Specific volume of moist air in ft³ lb⁻¹ of dry air [IP] or in m³ kg⁻¹ of dry air [SI]
+
+    Notes:
+        Exactly two properties must be given, which can be:
+            - TDryBulb and one of HumRatio, RelHum, TWetBulb, TDewPoint, VapPres, SpecificHum or MoistAirEnthalpy
+            - one of HumRatio, TDewPoint, VapPres or SpecificHum, and one of MoistAirEnthalpy or MoistAirVolume
+        The properties are calculated with the functions of the library, and any error they raise is
+        raised when the property is first accessed. The unit system must not be changed during the
+        lifetime of the object.
+
+    Example
+        >>> State = psychrolib.MoistAirState(101325, TDryBulb=25.0, RelHum=0.5)
+        >>> State.MoistAirEnthalpy   # The wet-bulb temperature is never calculated
+        50321.958802184665
+
+    """
+    __slots__ = ('Pressure', '_TDryBulb', '_HumRatio', '_RelHum', '_TWetBulb', '_TDewPoint', '_VapPres',
+                 '_SpecificHum', '_MoistAirEnthalpy', '_MoistAirVolume', '_MoistAirDensity',
+                 '_DegreeOfSaturation', '_VaporPressureDeficit')
+
+    # Suffix of the functions of the library used to calculate the properties
+    FUNCTION_SUFFIX = ''
+
+    # Properties from which the humidity ratio can be calculated without the dry-bulb temperature
+    HUMIDITY_INPUTS = ('HumRatio', 'TDewPoint', 'VapPres', 'SpecificHum')
+
+    def __init__(self, Pressure, TDryBulb=None, HumRatio=None, RelHum=None, TWetBulb=None, TDewPoint=None,
+                 VapPres=None, SpecificHum=None, MoistAirEnthalpy=None, MoistAirVolume=None):
+        Inputs = {'TDryBulb': TDryBulb, 'HumRatio': HumRatio, 'RelHum': RelHum, 'TWetBulb': TWetBulb,
+                  'TDewPoint': TDewPoint, 'VapPres': VapPres, 'SpecificHum': SpecificHum,
+                  'MoistAirEnthalpy': MoistAirEnthalpy, 'MoistAirVolume': MoistAirVolume}
+        Given = [Name for Name, Value in Inputs.items() if Value is not None]
+
+        if len(Given) != 2:
+            raise ValueError("Exactly two properties are required to define the state of moist air.")
+        if 'TDryBulb' in Given:
+            if 'MoistAirVolume' in Given:
+                raise ValueError("The state of moist air cannot be defined from TDryBulb and MoistAirVolume.")
+        elif not (set(Given) & set(self.HUMIDITY_INPUTS) and set(Given) & {'MoistAirEnthalpy', 'MoistAirVolume'}):
+            raise ValueError("The state of moist air cannot be defined from {} and {}.".format(*Given))
+
+        self.Pressure = self.Input_(Pressure)
+        for Slot in MoistAirState.__slots__[1:]:
+            setattr(self, Slot, None)
+        for Name in Given:
+            setattr(self, '_' + Name, self.Input_(Inputs[Name]))
+
+    def __repr__(self) -> str:
+        Known = ', '.join('{}={!r}'.format(Slot[1:], getattr(self, Slot)) for Slot in MoistAirState.__slots__[1:]
+                          if getattr(self, Slot) is not None)
+        return '{}(Pressure={!r}, {})'.format(type(self).__name__, self.Pressure, Known)
+
+    def Input_(self, Value):
+        """
+        Helper method converting an input value before it is stored.
+
+        """
+        return Value
+
+    def Function_(self, Name: str):
+        """
+        Helper method returning the function of the library used to calculate a property.
+
+        """
+        return globals()[Name + self.FUNCTION_SUFFIX]
+
+    @property
+    def TDryBulb(self):
+        """Dry-bulb temperature in °F [IP] or °C [SI]"""
+        if self._TDryBulb is None:
+            if self._MoistAirEnthalpy is not None:
+                self._TDryBulb = self.Function_('GetTDryBulbFromEnthalpyAndHumRatio')(
+                    self._MoistAirEnthalpy, self.HumRatio)
+            else:
+                self._TDryBulb = self.Function_('GetTDryBulbFromMoistAirVolumeAndHumRatio')(
+                    self._MoistAirVolume, self.HumRatio, self.Pressure)
+        return self._TDryBulb
+
+    @property
+    def HumRatio(self):
+        """Humidity ratio in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI]"""
+        if self._HumRatio is None:
+            if self._SpecificHum is not None:
+                self._HumRatio = self.Function_('GetHumRatioFromSpecificHum')(self._SpecificHum)
+            elif self._VapPres is not None:
+                self._HumRatio = self.Function_('GetHumRatioFromVapPres')(self._VapPres, self.Pressure)
+            elif self._TDewPoint is not None:
+                self._HumRatio = self.Function_('GetHumRatioFromTDewPoint')(self._TDewPoint, self.Pressure)
+            elif self._RelHum is not None:
+                self._HumRatio = self.Function_('GetHumRatioFromRelHum')(self._TDryBulb, self._RelHum, self.Pressure)
+            elif self._TWetBulb is not None:
+                self._HumRatio = self.Function_('GetHumRatioFromTWetBulb')(self._TDryBulb, self._TWetBulb, self.Pressure)
+            else:
+                self._HumRatio = self.Function_('GetHumRatioFromEnthalpyAndTDryBulb')(
+                    self._MoistAirEnthalpy, self._TDryBulb)
+        return self._HumRatio
+
+    @property
+    def RelHum(self):
+        """Relative humidity in range [0, 1]"""
+        if self._RelHum is None:
+            self._RelHum = self.Function_('GetRelHumFromHumRatio')(self.TDryBulb, self.HumRatio, self.Pressure)
+        return self._RelHum
+
+    @property
+    def TWetBulb(self):
+        """Wet-bulb temperature in °F [IP] or °C [SI]"""
+        if self._TWetBulb is None:
+            self._TWetBulb = self.Function_('GetTWetBulbFromHumRatio')(self.TDryBulb, self.HumRatio, self.Pressure)
+        return self._TWetBulb
+
+    @property
+    def TDewPoint(self):
+        """Dew-point temperature in °F [IP] or °C [SI]"""
+        if self._TDewPoint is None:
+            self._TDewPoint = self.Function_('GetTDewPointFromHumRatio')(self.TDryBulb, self.HumRatio, self.Pressure)
+        return self._TDewPoint
+
+    @property
+    def VapPres(self):
+        """Partial pressure of water vapor in moist air in Psi [IP] or Pa [SI]"""
+        if self._VapPres is None:
+            self._VapPres = self.Function_('GetVapPresFromHumRatio')(self.HumRatio, self.Pressure)
+        return self._VapPres
+
+    @property
+    def SpecificHum(self):
+        """Specific humidity in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI]"""
+        if self._SpecificHum is None:
+            self._SpecificHum = self.Function_('GetSpecificHumFromHumRatio')(self.HumRatio)
+        return self._SpecificHum
+
+    @property
+    def MoistAirEnthalpy(self):
+        """Moist air enthalpy in Btu lb⁻¹ [IP] or J kg⁻¹ [SI]"""
+        if self._MoistAirEnthalpy is None:
+            self._MoistAirEnthalpy = self.Function_('GetMoistAirEnthalpy')(self.TDryBulb, self.HumRatio)
+        return self._MoistAirEnthalpy
+
+    @property
+    def MoistAirVolume(self):
+        """Specific volume of moist air in ft³ lb⁻¹ of dry air [IP] or in m³ kg⁻¹ of dry air [SI]"""
+        if self._MoistAirVolume is None:
+            self._MoistAirVolume = self.Function_('GetMoistAirVolume')(self.TDryBulb, self.HumRatio, self.Pressure)
+        return self._MoistAirVolume
+
+    @property
+    def MoistAirDensity(self):
+        """Moist air density in lb ft⁻³ [IP] or kg m⁻³ [SI]"""
+        if self._MoistAirDensity is None:
+            self._MoistAirDensity = self.Function_('GetMoistAirDensity')(self.TDryBulb, self.HumRatio, self.Pressure)
+        return self._MoistAirDensity
+
+    @property
+    def DegreeOfSaturation(self):
+        """Degree of saturation [unitless]"""
+        if self._DegreeOfSaturation is None:
+            self._DegreeOfSaturation = self.Function_('GetDegreeOfSaturation')(
+                self.TDryBulb, self.HumRatio, self.Pressure)
+        return self._DegreeOfSaturation
+
+    @property
+    def VaporPressureDeficit(self):
+        """Vapor pressure deficit in Psi [IP] or Pa [SI]"""
+        if self._VaporPressureDeficit is None:
+            self._VaporPressureDeficit = self.Function_('GetSatVapPres')(self.TDryBulb) - self.VapPres
+        return self._VaporPressureDeficit
+
+class MoistAirStateArray(MoistAirState):
+    """
+    State of moist air for arrays of properties, calculated on first access with the array functions
+    and cached. See MoistAirState.
+
+    """
+    __slots__ = ()
+
+    FUNCTION_SUFFIX = 'Array'
+
+    def Input_(self, Value):
+        return AsArray_(Value)
+
+
+#######################################################################################################
+# Calculation of selected psychrometric values
+#######################################################################################################
+
+PSYCHROMETRIC_RELATIONSHIPS = (
+    # Calculated value, function, arguments, relative cost
+    ('Pressure', 'GetStandardAtmPressure', ('Altitude',), 1),
+    ('VapPres', 'GetVapPresFromRelHum', ('TDryBulb', 'RelHum'), 2),
+    ('RelHum', 'GetRelHumFromVapPres', ('TDryBulb', 'VapPres'), 2),
+    ('VapPres', 'GetVapPresFromTDewPoint', ('TDewPoint',), 2),
+    ('TDewPoint', 'GetTDewPointFromVapPres', ('TDryBulb', 'VapPres'), 10),
+    ('HumRatio', 'GetHumRatioFromVapPres', ('VapPres', 'Pressure'), 1),
+    ('VapPres', 'GetVapPresFromHumRatio', ('HumRatio', 'Pressure'), 1),
+    ('HumRatio', 'GetHumRatioFromTWetBulb', ('TDryBulb', 'TWetBulb', 'Pressure'), 3),
+    ('TWetBulb', 'GetTWetBulbFromHumRatio', ('TDryBulb', 'HumRatio', 'Pressure'), 60),
+    ('HumRatio', 'GetHumRatioFromSpecificHum', ('SpecificHum',), 1),
+    ('SpecificHum', 'GetSpecificHumFromHumRatio', ('HumRatio',), 1),
+    ('HumRatio', 'GetHumRatioFromEnthalpyAndTDryBulb', ('MoistAirEnthalpy', 'TDryBulb'), 1),
+    ('TDryBulb', 'GetTDryBulbFromEnthalpyAndHumRatio', ('MoistAirEnthalpy', 'HumRatio'), 1),
+    ('TDryBulb', 'GetTDryBulbFromMoistAirVolumeAndHumRatio', ('MoistAirVolume', 'HumRatio', 'Pressure'), 1),
+    ('MoistAirEnthalpy', 'GetMoistAirEnthalpy', ('TDryBulb', 'HumRatio'), 1),
+    ('MoistAirVolume', 'GetMoistAirVolume', ('TDryBulb', 'HumRatio', 'Pressure'), 1),
+    ('MoistAirDensity', 'GetMoistAirDensity', ('TDryBulb', 'HumRatio', 'Pressure'), 1),
+    ('DegreeOfSaturation', 'GetDegreeOfSaturation', ('TDryBulb', 'HumRatio', 'Pressure'), 3),
+    ('VaporPressureDeficit', 'GetVaporPressureDeficit', ('TDryBulb', 'HumRatio', 'Pressure'), 4),
+    ('SatVapPres', 'GetSatVapPres', ('TDryBulb',), 2),
+    ('SatHumRatio', 'GetSatHumRatio', ('TDryBulb', 'Pressure'), 2),
+    ('SatAirEnthalpy', 'GetSatAirEnthalpy', ('TDryBulb', 'Pressure'), 3),
+    ('DryAirEnthalpy', 'GetDryAirEnthalpy', ('TDryBulb',), 1),
+    ('DryAirVolume', 'GetDryAirVolume', ('TDryBulb', 'Pressure'), 1),
+    ('DryAirDensity', 'GetDryAirDensity', ('TDryBulb', 'Pressure'), 1),
+)
+"""tuple: Relationships between psychrometric values used by CalcPsychrometrics.
+
+    Each relationship is a tuple of the name of the calculated value, the name of the function
+    calculating it, the names of its arguments, and its relative cost. The costs are rough estimates
+    of the relative calculation times, the iterative solvers being the most expensive by far.
+
+"""
+
+PSYCHROMETRIC_VALUES = frozenset(Name for Relationship in PSYCHROMETRIC_RELATIONSHIPS
+                                 for Name in (Relationship[0],) + Relationship[2])
+"""frozenset: Names of the psychrometric values known to CalcPsychrometrics.
+
+"""
+
+def GetPsychrometricsPlan(Inputs, Outputs) -> list:
+    """
+    Return the cheapest sequence of functions calculating some psychrometric values from others.
+
+    Args:
+        Inputs : Names of the known values, e.g. ('TDryBulb', 'RelHum', 'Pressure')
+        Outputs : Names of the values to calculate, e.g. ('TWetBulb', 'MoistAirEnthalpy')
+
+    Returns:
+        List of relationships (see PSYCHROMETRIC_RELATIONSHIPS) to apply in order. Intermediate
+        values are calculated only once, even if they are needed by several outputs.
+
+    Notes:
+        The plan is cached, since it only depends on the names of the inputs and outputs.
+
+    """
+    return list(GetPsychrometricsPlanCached_(frozenset(Inputs), tuple(Outputs)))
+
+@lru_cache(maxsize=256)
+def GetPsychrometricsPlanCached_(Inputs: frozenset, Outputs: tuple) -> tuple:
+    """
+    Helper function implementing GetPsychrometricsPlan.
+
+    """
+    for Name in Inputs.union(Outputs):
+        if Name not in PSYCHROMETRIC_VALUES:
+            raise ValueError("Unknown psychrometric value: {}".format(Name))
+
+    # Cheapest cost of each value, and the relationship giving it, found by relaxing all relationships
+    # until no cost improves. The costs of the arguments are summed, which overestimates the cost when
+    # they share intermediate values, but is good enough to choose between alternative routes.
+    Cost = {Name: 0 for Name in Inputs}
+    Via = {}
+    Updated = True
+    while Updated:
+        Updated = False
+        for Relationship in PSYCHROMETRIC_RELATIONSHIPS:
+            Output, _, Arguments, RelationshipCost = Relationship
+            if Output in Inputs or not all(Argument in Cost for Argument in Arguments):
+                continue
+            NewCost = RelationshipCost + sum(Cost[Argument] for Argument in Arguments)
+            if NewCost < Cost.get(Output, math.inf):
+                Cost[Output] = NewCost
+                Via[Output] = Relationship
+                Updated = True
+
+    Plan = []
+    Planned = set(Inputs)
+
+    def AddToPlan(Name):
+        if Name in Planned:
+            return
+        if Name not in Via:
+            raise ValueError("{} cannot be calculated from {}".format(Name, ', '.join(sorted(Inputs))))
+        for Argument in Via[Name][2]:
+            AddToPlan(Argument)
+        Plan.append(Via[Name])
+        Planned.add(Name)
+
+    for Name in Outputs:
+        AddToPlan(Name)
+    return tuple(Plan)
+
+def CalcPsychrometrics(Inputs: dict, Outputs) -> dict:
+    """
+    Utility function to calculate only the requested psychrometric values, given any set of known values
+    from which they can be calculated.
+
+    Args:
+        Inputs : Dict of known values keyed by name, e.g. {'TDryBulb': 25, 'RelHum': 0.5, 'Pressure': 101325}
+        Outputs : Names of the values to calculate, e.g. ('TWetBulb', 'MoistAirEnthalpy')
+
+    Returns:
+        Dict of the requested values keyed by name
+
+    Notes:
+        The names and units of the values are those of the arguments and results of the functions
+        of the library, see PSYCHROMETRIC_RELATIONSHIPS for the relationships between them.
+        The values are calculated with the cheapest sequence of functions, avoiding the iterative
+        solvers whenever possible, and calculating shared intermediate values only once.
+        If any input is an array the array functions are used, otherwise the scalar functions are.
+
+    Example
+        >>> psychrolib.CalcPsychrometrics({'TDryBulb': 25, 'RelHum': 0.5, 'Pressure': 101325},
+        ...                               ['HumRatio', 'MoistAirEnthalpy'])
+        {'HumRatio': 0.009881043690749623, 'MoistAirEnthalpy': 50321.958802184665}
+
+    """
+    Plan = GetPsychrometricsPlanCached_(frozenset(Inputs), tuple(Outputs))
+
+    if np is not None and any(np.ndim(Value) > 0 for Value in Inputs.values()):
+        Suffix = 'Array'
+    else:
+        Suffix = ''
+
+    Values = dict(Inputs)
+    for Output, Function, Arguments, _ in Plan:
+        Values[Output] = globals()[Function + Suffix](*(Values[Argument] for Argument in Arguments))
+    return {Name: Values[Name] for Name in Outputs}
+
+
+#######################################################################################################
+# State of moist air from any two properties
+#######################################################################################################
+
+STATE_DRIVERS = ('HumRatio', 'SpecificHum', 'VapPres', 'TDewPoint', 'RelHum', 'TWetBulb', 'MoistAirEnthalpy')
+"""tuple: Properties which, with dry-bulb temperature and pressure, define the humidity ratio.
+
+"""
+
+def GetMoistAirState(Pressure, TDryBulbGuess=None, **Properties) -> MoistAirState:
+    """
+    Return the state of moist air given pressure and any two independent properties.
+
+    Args:
+        Pressure : Atmospheric pressure in Psi [IP] or Pa [SI]
+        TDryBulbGuess : Optional guess of the dry-bulb temperature in °F [IP] or °C [SI], e.g. the
+                        solution for the previous time step, used to narrow the search range
+        Properties : The two known properties, keyed by name (see PSYCHROMETRIC_VALUES), e.g.
+                     MoistAirEnthalpy=50000, RelHum=0.5. At least one of them must be TDryBulb or
+                     one of STATE_DRIVERS.
+
+    Returns:
+        MoistAirState if all the arguments are scalars, otherwise MoistAirStateArray
+
+    Reference:
+        ASHRAE Handbook - Fundamentals (2017) ch. 1
+
+    Notes:
+        When the state cannot be defined directly by MoistAirState, the dry-bulb temperature is solved
+        for by bisection. For a trial dry-bulb temperature, one property (the driver, one of STATE_DRIVERS)
+        gives the humidity ratio, from which the other property is calculated with the functions of the
+        library and compared to its known value. All the elements of arrays are bisected together.
+        The search range is the range of validity of the equations, bounded below by the driver if it
+        is a temperature and, when the driver is RelHum, above by the boiling point of water at the
+        pressure. A ValueError is raised if no solution is found in that range.
+
+    Example
+        >>> State = psychrolib.GetMoistAirState(101325, MoistAirEnthalpy=50000, RelHum=0.5)
+        >>> State.TDryBulb
+        24.87...
+
+    """
+    if len(Properties) != 2:
+        raise ValueError("Exactly two properties are required to define the state of moist air.")
+
+    IsArray = np is not None and any(np.ndim(Value) > 0 for Value in (Pressure, *Properties.values()))
+    StateClass = MoistAirStateArray if IsArray else MoistAirState
+
+    Names = set(Properties)
+    if 'TDryBulb' in Names or (Names & set(MoistAirState.HUMIDITY_INPUTS)
+                               and Names & {'MoistAirEnthalpy', 'MoistAirVolume'}):
+        return StateClass(Pressure, **Properties)
+
+    # Choose the driver for which the other property is the cheapest to calculate
+    Candidates = []
+    for Driver in Names.intersection(STATE_DRIVERS):
+        Target = (Names - {Driver}).pop()
+        try:
+            Plan = GetPsychrometricsPlanCached_(frozenset(('TDryBulb', Driver, 'Pressure')), (Target,))
+        except ValueError:
+            continue
+        Candidates.append((sum(Relationship[3] for Relationship in Plan), Driver, Target))
+    if not Candidates:
+        raise ValueError("The state of moist air cannot be defined from {} and {}.".format(*sorted(Names)))
+    _, Driver, Target = min(Candidates)
+
+    Pressure = AsArray_(Pressure)
+    DriverValue = AsArray_(Properties[Driver])
+    TargetValue = AsArray_(Properties[Target])
+    Shape = np.broadcast(Pressure, DriverValue, TargetValue).shape
+
+    def Residual(TDryBulb):
+        Values = CalcPsychrometrics({'TDryBulb': TDryBulb, Driver: DriverValue, 'Pressure': Pressure}, (Target,))
+        return Values[Target] - TargetValue
+
+    # Search range
+    if isIP():
+        BOUNDS = [-148, 392]
+    else:
+        BOUNDS = [-100, 200]
+    Lo = np.full(Shape, BOUNDS[0], dtype=PSYCHROLIB_ARRAY_DTYPE)
+    Hi = np.full(Shape, BOUNDS[1], dtype=PSYCHROLIB_ARRAY_DTYPE)
+    if Driver in ('TDewPoint', 'TWetBulb'):
+        Lo = np.maximum(Lo, DriverValue)
+    elif Driver == 'RelHum':
+        # Boiling point of water, slightly reduced so that the vapor pressure remains below the pressure
+        Hi = np.minimum(Hi, GetTDewPointFromVapPresArray(BOUNDS[1], np.minimum(Pressure, GetSatVapPres(BOUNDS[1])))
+                            - PSYCHROLIB_TOLERANCE)
+    FLo = Residual(Lo)
+    FHi = Residual(Hi)
+
+    # Narrow the search range around the guess, where it brackets the solution
+    if TDryBulbGuess is not None:
+        Span = 1000 * PSYCHROLIB_TOLERANCE
+        Guess = np.broadcast_to(AsArray_(TDryBulbGuess), Shape)
+        NarrowLo = np.clip(Guess - Span, Lo, Hi)
+        NarrowHi = np.clip(Guess + Span, Lo, Hi)
+        FNarrowLo = Residual(NarrowLo)
+        FNarrowHi = Residual(NarrowHi)
+        Bracketed = np.sign(FNarrowLo) != np.sign(FNarrowHi)
+        Lo, FLo = np.where(Bracketed, NarrowLo, Lo), np.where(Bracketed, FNarrowLo, FLo)
+        Hi, FHi = np.where(Bracketed, NarrowHi, Hi), np.where(Bracketed, FNarrowHi, FHi)
+
+    if np.any(np.sign(FLo) == np.sign(FHi)):
+        raise ValueError("No state of moist air found for the given {} and {}.".format(Driver, Target))
+
+    index = 1
+    # Bisection loop
+    while np.any((Hi - Lo) > ArrayTolerance_()):
+        Mid = (Lo + Hi) / 2
+        FMid = Residual(Mid)
+
+        # Get new bounds
+        SameSign = np.sign(FMid) == np.sign(FLo)
+        Lo, FLo = np.where(SameSign, Mid, Lo), np.where(SameSign, FMid, FLo)
+        Hi = np.where(SameSign, Hi, Mid)
+
+        if (index >= MAX_ITER_COUNT):
+            raise ValueError("Convergence not reached in GetMoistAirState. Stopping.")
+
+        index = index + 1
+
+    TDryBulb = (Lo + Hi) / 2
+    if not IsArray:
+        return MoistAirState(float(Pressure), TDryBulb=float(TDryBulb), **{Driver: float(DriverValue)})
+    return MoistAirStateArray(Pressure, TDryBulb=TDryBulb, **{Driver: DriverValue})
+
+
+#######################################################################################################
+# Calculations at a fixed pressure
+#######################################################################################################
+
+class PsychrometricSite:
+    """
+    Psychrometric calculations at a fixed pressure, e.g. at the station pressure of a site, with the
+    pressure-dependent constants calculated once.
+
+    Args:
+        Pressure : Atmospheric pressure in Psi [IP] or Pa [SI]
+        Altitude : Altitude in ft [IP] or m [SI], used to calculate the standard atmosphere pressure
+                   when Pressure is not given
+        TableStep : Optional step of dry-bulb temperature in °F [IP] or °C [SI] of the tables of
+                    humidity ratio and enthalpy of saturated air, e.g. 0.1
+        TWetBulbMaxError : Optional maximum error in °F [IP] or °C [SI] of the wet-bulb temperature
+                           interpolated in a table, e.g. 0.005. Requires numpy.
+        CacheDir : Optional directory where the table of wet-bulb temperature is saved, and loaded
+                   from when it was built before for the same pressure, unit system, table step,
+                   maximum error and tolerance
+
+    Notes:
+        Exactly one of Pressure or Altitude must be given. The methods are the counterparts of the
+        functions of the library of the same name without the Pressure argument. The unit system
+        must not be changed during the lifetime of the object.
+        When TableStep is given, the humidity ratio and enthalpy of saturated air are tabulated
+        from the lower bound of the range of validity up to the temperature at which the saturation
+        vapor pressure is half the pressure, and linearly interpolated in the table. TableError is
+        the maximum relative error of the interpolated humidity ratio where it is above MIN_HUM_RATIO,
+        estimated at the midpoints of the table and at the triple point of water. The tables are used by GetSatHumRatio, GetSatAirEnthalpy, GetHumRatioFromTWetBulb
+        and the wet-bulb solver, and to find the first guess of the dew-point solver. Outside the
+        tables the functions of the library are used.
+        When TWetBulbMaxError is given, the wet-bulb temperature is tabulated with GetTWetBulbFromHumRatio
+        over the same range of dry-bulb temperature and the whole range of the ratio of humidity ratio to
+        humidity ratio of saturated air, and bilinearly interpolated in the table. The cells in which the
+        equations can have two solutions, on either side of the freezing point, are solved for instead,
+        as are the cells in which the error exceeds TWetBulbMaxError, e.g. for high temperatures. The
+        error is checked at the center and the middle of the edges of the cells, where the error of bilinear
+        interpolation is the largest, against GetTWetBulbFromHumRatio, plus PSYCHROLIB_TOLERANCE for the
+        error of the solutions. TWetBulbTableError is the largest error of the cells interpolated, and
+        TWetBulbExactFraction the fraction of the cells solved for.
+
+    Example
+        >>> Site = psychrolib.PsychrometricSite(Altitude=500, TableStep=0.1)
+        >>> Site.GetTWetBulbFromHumRatio(25.0, 0.01)
+        17.35...
+
+    """
+    def __init__(self, Pressure: Optional[float] = None, Altitude: Optional[float] = None,
+                 TableStep: Optional[float] = None, TWetBulbMaxError: Optional[float] = None,
+                 CacheDir: Optional[str] = None):
+        if (Pressure is None) == (Altitude is None):
+            raise ValueError("Exactly one of Pressure or Altitude is required.")
+        if Pressure is None:
+            Pressure = GetStandardAtmPressure(Altitude)
+        self.Pressure = Pressure
+
+        # Coefficients of ch. 1 eqn 26 (volume) and eqn 33 and 35 (humidity ratio from wet bulb)
+        self.WetBulbCoefficients_ = WetBulbCoefficients_()
+        if isIP():
+            self.Bounds_ = (-148, 392)
+            self.VolumeFactor_ = R_DA_IP / (144 * Pressure)
+            self.ZeroAbsolute_ = ZERO_FAHRENHEIT_AS_RANKINE
+            self.FreezingPoint_ = FREEZING_POINT_WATER_IP
+        else:
+            self.Bounds_ = (-100, 200)
+            self.VolumeFactor_ = R_DA_SI / Pressure
+            self.ZeroAbsolute_ = ZERO_CELSIUS_AS_KELVIN
+            self.FreezingPoint_ = FREEZING_POINT_WATER_SI
+
+        # Range of the tables, up to the temperature at which the saturation vapor pressure is half the pressure
+        self.TableEnd_ = GetTDewPointFromVapPres(self.Bounds_[1], min(Pressure / 2, GetSatVapPres(self.Bounds_[1])))
+
+        self.TableStep = TableStep
+        self.TableError = None
+        if TableStep is not None:
+            self.BuildTables_()
+
+        self.TWetBulbMaxError = TWetBulbMaxError
+        self.TWetBulbTableError = None
+        self.TWetBulbExactFraction = None
+        self.TWetBulbTable_ = None
+        if TWetBulbMaxError is not None:
+            self.BuildTWetBulbTable_(CacheDir)
+
+    def __repr__(self) -> str:
+        return 'PsychrometricSite(Pressure={!r}, TableStep={!r}, TWetBulbMaxError={!r})'.format(
+            self.Pressure, self.TableStep, self.TWetBulbMaxError)
+
+    def BuildTables_(self) -> None:
+        """
+        Helper method calculating the tables of humidity ratio and enthalpy of saturated air.
+
+        """
+        if self.TableStep <= 0:
+            raise ValueError("The step of the tables must be positive")
+        Length = int((self.TableEnd_ - self.Bounds_[0]) / self.TableStep) + 1
+        if Length < 2:
+            raise ValueError("The step of the tables is larger than their range")
+
+        self.TableTDryBulb_ = [self.Bounds_[0] + Index * self.TableStep for Index in range(Length)]
+        self.TableSatHumRatio_ = [GetSatHumRatio(T, self.Pressure) for T in self.TableTDryBulb_]
+        self.TableSatAirEnthalpy_ = [GetMoistAirEnthalpy(T, W) for T, W in
+                                     zip(self.TableTDryBulb_, self.TableSatHumRatio_)]
+
+        # Interpolation error at the midpoints, where it is the largest between smooth nodes, and on
+        # either side of the triple point, where the saturation vapor pressure is discontinuous.
+        # The intervals where the humidity ratio is bounded by MIN_HUM_RATIO are excluded.
+        TriplePoint = TRIPLE_POINT_WATER_IP if isIP() else TRIPLE_POINT_WATER_SI
+        Points = [T + self.TableStep / 2 for T in self.TableTDryBulb_[:-1]] \
+            + [TriplePoint, TriplePoint + 1e-6 * self.TableStep]
+        self.TableError = max(
+            abs(self.Interpolate_(self.TableSatHumRatio_, T) / GetSatHumRatio(T, self.Pressure) - 1)
+            for T in Points if self.TableSatHumRatio_[int((T - self.Bounds_[0]) / self.TableStep)] > MIN_HUM_RATIO)
+
+        if np is not None:
+            self.TableTDryBulbArray_ = np.array(self.TableTDryBulb_)
+            self.TableSatHumRatioArray_ = np.array(self.TableSatHumRatio_)
+            self.TableSatAirEnthalpyArray_ = np.array(self.TableSatAirEnthalpy_)
+
+    def Interpolate_(self, Table: list, TDryBulb: float) -> Optional[float]:
+        """
+        Helper method interpolating linearly in a table, returning None outside the table.
+
+        """
+        Position = (TDryBulb - self.Bounds_[0]) / self.TableStep
+        if 0 <= Position < len(Table) - 1:
+            Index = int(Position)
+            return Table[Index] + (Position - Index) * (Table[Index + 1] - Table[Index])
+        return None
+
+    def InterpolateArray_(self, Table, TDryBulb, Function):
+        """
+        Helper method interpolating linearly in a table for arrays, using Function outside the table.
+
+        """
+        TDryBulb = AsArray_(TDryBulb)
+        Values = np.asarray(np.interp(TDryBulb, self.TableTDryBulbArray_, Table))
+        Outside = (TDryBulb < self.TableTDryBulb_[0]) | (TDryBulb > self.TableTDryBulb_[-1])
+        if np.any(Outside):
+            Values[Outside] = Function(TDryBulb[Outside], self.Pressure)
+        return Values
+
+    def BuildTWetBulbTable_(self, CacheDir: Optional[str]) -> None:
+        """
+        Helper method calculating, or loading from the cache, the table of wet-bulb temperature.
+
+        """
+        CheckNumpy_()
+        if self.TWetBulbMaxError <= PSYCHROLIB_TOLERANCE:
+            raise ValueError("The maximum error of the wet-bulb temperature must be larger than PSYCHROLIB_TOLERANCE")
+
+        # Steps giving an error below 0.005 °C in most cells, scaled as the error of bilinear
+        # interpolation with the square of the step
+        Scale = math.sqrt(self.TWetBulbMaxError / 0.005)
+        TDryBulbStep = (0.45 if isIP() else 0.25) * Scale
+        LengthTDryBulb = int((self.TableEnd_ - self.Bounds_[0]) / TDryBulbStep) + 1
+        LengthSatFraction = max(int(round(100 / Scale)), 1) + 1
+        Grid = (float(self.Bounds_[0]), TDryBulbStep, LengthTDryBulb, 1 / (LengthSatFraction - 1), LengthSatFraction)
+
+        # The table depends on the table step through the humidity ratio of saturated air used to interpolate it
+        Key = 'TWetBulb {} {!r} {!r} {!r} {!r} {!r} {!r} {}'.format(
+            GetUnitSystem().name, self.Pressure, self.TWetBulbMaxError, self.TableStep, Grid,
+            PSYCHROLIB_TOLERANCE, MIN_HUM_RATIO, PSYCHROLIB_ARRAY_DTYPE)
+        if CacheDir is not None:
+            Path = os.path.join(CacheDir, 'psychrolib_twetbulb_{}.npz'.format(hashlib.sha1(Key.encode()).hexdigest()[:16]))
+            if os.path.exists(Path):
+                with np.load(Path) as Cache:
+                    if str(Cache['Key']) == Key:
+                        self.TWetBulbGrid_ = tuple(Cache['Grid'])
+                        self.TWetBulbTable_ = Cache['Table']
+                        self.TWetBulbExact_ = Cache['Exact']
+                        self.TWetBulbTableError = float(Cache['TableError'])
+                        self.TWetBulbExactFraction = float(np.mean(self.TWetBulbExact_))
+                        return
+
+        self.TWetBulbGrid_ = Grid
+
+        def Exact(TDryBulb, SatFraction):
+            TDryBulb, SatFraction = np.meshgrid(TDryBulb, SatFraction, indexing='ij')
+            HumRatio = SatFraction * GetSatHumRatioArray(TDryBulb, self.Pressure)
+            return TDryBulb, HumRatio, GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio, self.Pressure)
+
+        # Solutions on the grid of half steps, of which the table is every other point, so that the errors of
+        # the interpolation are checked at the center and the middle of the edges of the cells, where the error
+        # of bilinear interpolation is the largest for smooth functions
+        TDryBulb, HumRatio, TWetBulb = Exact(self.Bounds_[0] + TDryBulbStep / 2 * np.arange(2 * LengthTDryBulb - 1),
+                                             np.linspace(0, 1, 2 * LengthSatFraction - 1))
+        self.TWetBulbTable_ = np.ascontiguousarray(TWetBulb[::2, ::2])
+        self.TWetBulbExact_ = np.zeros((LengthTDryBulb - 1, LengthSatFraction - 1), dtype=bool)
+        Error = np.abs(self.InterpolateTWetBulbArray_(TDryBulb, HumRatio)[0] - TWetBulb)
+        # Largest error of each cell
+        Error = np.maximum.reduce([Error[Offset:Offset + 2 * LengthTDryBulb - 2:2] for Offset in range(3)])
+        Error = np.maximum.reduce([Error[:, Offset:Offset + 2 * LengthSatFraction - 2:2] for Offset in range(3)])
+
+        # The humidity ratio from wet-bulb temperature is discontinuous at the freezing point, higher over ice,
+        # so that the equations have a solution on either side of it for the humidity ratios between those
+        # at the freezing point over water and over ice, and the wet-bulb temperature found jumps across it.
+        # The cells which intersect this band, or whose corners are on both sides of the freezing point,
+        # are solved for whatever their errors. The humidity ratios of the band and of the cells decrease
+        # and increase with the dry-bulb temperature respectively, hence the bounds at the edges of the cells.
+        Table = self.TWetBulbTable_
+        Corners = (Table[:-1, :-1], Table[:-1, 1:], Table[1:, :-1], Table[1:, 1:])
+        Freezing = (np.minimum.reduce(Corners) <= self.FreezingPoint_) & (np.maximum.reduce(Corners) >= self.FreezingPoint_)
+        TDryBulb = np.maximum(TDryBulb[::2, 0], self.FreezingPoint_)
+        Water = GetHumRatioFromTWetBulbArray(TDryBulb, self.FreezingPoint_, self.Pressure)
+        Ice = GetHumRatioFromTWetBulbArray(TDryBulb, np.nextafter(self.FreezingPoint_, -np.inf), self.Pressure)
+        SatHumRatio = self.GetSatHumRatioArray(self.Bounds_[0] + TDryBulbStep * np.arange(LengthTDryBulb))
+        SatFraction = np.linspace(0, 1, LengthSatFraction)
+        Lower = SatFraction[np.newaxis, :-1] * SatHumRatio[:-1, np.newaxis]
+        Upper = SatFraction[np.newaxis, 1:] * SatHumRatio[1:, np.newaxis]
+        Freezing |= (Lower <= Ice[:-1, np.newaxis]) & (Upper >= Water[1:, np.newaxis]) \
+            & (TDryBulb[1:, np.newaxis] > self.FreezingPoint_)
+
+        # The values of the table and the solutions they are compared with are within half the tolerance
+        Error += PSYCHROLIB_TOLERANCE
+        self.TWetBulbExact_ = Freezing | ~(Error <= self.TWetBulbMaxError)
+        self.TWetBulbTableError = float(np.max(Error[~self.TWetBulbExact_], initial=0))
+        self.TWetBulbExactFraction = float(np.mean(self.TWetBulbExact_))
+
+        if CacheDir is not None:
+            os.makedirs(CacheDir, exist_ok=True)
+            TemporaryPath = Path + '.{}.tmp.npz'.format(os.getpid())
+            np.savez(TemporaryPath, Key=Key, Grid=np.array(self.TWetBulbGrid_), Table=self.TWetBulbTable_,
+                     Exact=self.TWetBulbExact_, TableError=self.TWetBulbTableError)
+            os.replace(TemporaryPath, Path)
+
+    def InterpolateTWetBulb_(self, TDryBulb: float, HumRatio: float) -> Optional[float]:
+        """
+        Helper method interpolating the wet-bulb temperature in its table, returning None outside the
+        table or in the cells which are solved for.
+
+        """
+        Start, TDryBulbStep, LengthTDryBulb, SatFractionStep, LengthSatFraction = self.TWetBulbGrid_
+        X = (TDryBulb - Start) / TDryBulbStep
+        Y = HumRatio / self.GetSatHumRatio(TDryBulb) / SatFractionStep
+        if not (0 <= X <= LengthTDryBulb - 1 and 0 <= Y <= LengthSatFraction - 1):
+            return None
+        I = min(int(X), int(LengthTDryBulb) - 2)
+        J = min(int(Y), int(LengthSatFraction) - 2)
+        if self.TWetBulbExact_[I, J]:
+            return None
+        X = X - I
+        Y = Y - J
+        Table = self.TWetBulbTable_
+        return (1 - X) * ((1 - Y) * Table[I, J] + Y * Table[I, J + 1]) \
+               + X * ((1 - Y) * Table[I + 1, J] + Y * Table[I + 1, J + 1])
+
+    def InterpolateTWetBulbArray_(self, TDryBulb, HumRatio):
+        """
+        Helper method interpolating the wet-bulb temperature in its table for arrays, returning the
+        interpolated values and whether they are valid, i.e. inside the table and not in the cells
+        which are solved for.
+
+        """
+        Start, TDryBulbStep, LengthTDryBulb, SatFractionStep, LengthSatFraction = self.TWetBulbGrid_
+        X = (TDryBulb - Start) / TDryBulbStep
+        Y = HumRatio / self.GetSatHumRatioArray(TDryBulb) / SatFractionStep
+        Inside = (X >= 0) & (X <= LengthTDryBulb - 1) & (Y >= 0) & (Y <= LengthSatFraction - 1)
+        I = np.clip(X, 0, LengthTDryBulb - 2).astype(int)
+        J = np.clip(Y, 0, LengthSatFraction - 2).astype(int)
+        Inside &= ~self.TWetBulbExact_[I, J]
+        X = X - I
+        Y = Y - J
+        Table = self.TWetBulbTable_
+        Values = (1 - X) * ((1 - Y) * Table[I, J] + Y * Table[I, J + 1]) \
+                 + X * ((1 - Y) * Table[I + 1, J] + Y * Table[I + 1, J + 1])
+        return Values, Inside
+
+    def GetSatHumRatio(self, TDryBulb: float) -> float:
+        """
+        Return humidity ratio of saturated air given dry-bulb temperature. See GetSatHumRatio.
+
+        """
+        if self.TableStep is not None:
+            SatHumRatio = self.Interpolate_(self.TableSatHumRatio_, TDryBulb)
+            if SatHumRatio is not None:
+                return SatHumRatio
+        return GetSatHumRatio(TDryBulb, self.Pressure)
+
+    def GetSatAirEnthalpy(self, TDryBulb: float) -> float:
+        """
+        Return saturated air enthalpy given dry-bulb temperature. See GetSatAirEnthalpy.
+
+        """
+        if self.TableStep is not None:
+            SatAirEnthalpy = self.Interpolate_(self.TableSatAirEnthalpy_, TDryBulb)
+            if SatAirEnthalpy is not None:
+                return SatAirEnthalpy
+        return GetSatAirEnthalpy(TDryBulb, self.Pressure)
+
+    def GetHumRatioFromVapPres(self, VapPres: float) -> float:
+        """
+        Return humidity ratio given water vapor pressure. See GetHumRatioFromVapPres.
+
+        """
+        if PSYCHROLIB_VALIDATE and VapPres < 0:
+            raise ValueError("Partial pressure of water vapor in moist air cannot be negative")
+        return max(0.621945 * VapPres / (self.Pressure - VapPres), MIN_HUM_RATIO)
+
+    def GetVapPresFromHumRatio(self, HumRatio: float) -> float:
+        """
+        Return vapor pressure given humidity ratio. See GetVapPresFromHumRatio.
+
+        """
+        if PSYCHROLIB_VALIDATE and HumRatio < 0:
+            raise ValueError("Humidity ratio is negative")
+        BoundedHumRatio = max(HumRatio, MIN_HUM_RATIO)
+        return self.Pressure * BoundedHumRatio / (0.621945 + BoundedHumRatio)
+
+    def GetHumRatioFromRelHum(self, TDryBulb: float, RelHum: float) -> float:
+        """
+        Return humidity ratio given dry-bulb temperature and relative humidity. See GetHumRatioFromRelHum.
+
+        """
+        return self.GetHumRatioFromVapPres(GetVapPresFromRelHum(TDryBulb, RelHum))
+
+    def GetRelHumFromHumRatio(self, TDryBulb: float, HumRatio: float) -> float:
+        """
+        Return relative humidity given dry-bulb temperature and humidity ratio. See GetRelHumFromHumRatio.
+
+        """
+        return GetRelHumFromVapPres(TDryBulb, self.GetVapPresFromHumRatio(HumRatio))
+
+    def GetTDewPointFromHumRatio(self, TDryBulb: float, HumRatio: float) -> float:
+        """
+        Return dew-point temperature given dry-bulb temperature and humidity ratio.
+        See GetTDewPointFromHumRatio.
+
+        Notes:
+            With the tables, the first guess of the solver is interpolated in the table of humidity
+            ratio of saturated air, and the solver usually converges in 1 or 2 iterations.
+
+        """
+        VapPres = self.GetVapPresFromHumRatio(HumRatio)
+        TDewPointGuess = None
+        if self.TableStep is not None:
+            Index = bisect.bisect_left(self.TableSatHumRatio_, HumRatio)
+            if 0 < Index < len(self.TableSatHumRatio_):
+                Lower = self.TableSatHumRatio_[Index - 1]
+                TDewPointGuess = self.TableTDryBulb_[Index - 1] \
+                    + self.TableStep * (HumRatio - Lower) / (self.TableSatHumRatio_[Index] - Lower)
+        return GetTDewPointFromVapPres(TDryBulb, VapPres, TDewPointGuess)
+
+    def GetHumRatioFromTWetBulb(self, TDryBulb: float, TWetBulb: float) -> float:
+        """
+        Return humidity ratio given dry-bulb and wet-bulb temperatures. See GetHumRatioFromTWetBulb.
+
+        """
+        if PSYCHROLIB_VALIDATE and TWetBulb > TDryBulb:
+            raise ValueError("Wet bulb temperature is above dry bulb temperature")
+
+        Wsstar = self.GetSatHumRatio(TWetBulb)
+        a, b, e, c, d = self.WetBulbCoefficients_[0 if TWetBulb >= self.FreezingPoint_ else 1]
+        HumRatio = ((a - b * TWetBulb) * Wsstar - c * (TDryBulb - TWetBulb)) / (a + d * TDryBulb - e * TWetBulb)
+        return max(HumRatio, MIN_HUM_RATIO)
+
+    def GetTWetBulbFromHumRatio(self, TDryBulb: float, HumRatio: float,
+                                TWetBulbGuess: Optional[float] = None) -> float:
+        """
+        Return wet-bulb temperature given dry-bulb temperature and humidity ratio.
+        See GetTWetBulbFromHumRatio.
+
+        Notes:
+            With the table of wet-bulb temperature, the wet-bulb temperature is interpolated in it where
+            possible. Otherwise, with the tables of saturated air, the lower bound of the bisection is
+            the node of the table of humidity ratio of saturated air just below the humidity ratio,
+            rather than the dew-point temperature.
+
+        """
+        if PSYCHROLIB_VALIDATE and HumRatio < 0:
+            raise ValueError("Humidity ratio cannot be negative")
+        BoundedHumRatio = max(HumRatio, MIN_HUM_RATIO)
+
+        if self.TWetBulbTable_ is not None:
+            TWetBulb = self.InterpolateTWetBulb_(TDryBulb, BoundedHumRatio)
+            if TWetBulb is not None:
+                return TWetBulb
+
+        # Initial guesses
+        Bracket = None
+        if TWetBulbGuess is not None:
+            Bracket = BracketTWetBulb_(TDryBulb, BoundedHumRatio, self.Pressure, TWetBulbGuess,
+                                       lambda TDryBulb, TWetBulb, Pressure: self.GetHumRatioFromTWetBulb(TDryBulb, TWetBulb))
+        if Bracket is None:
+            Bracket = (min(self.TWetBulbLowerBound_(TDryBulb, BoundedHumRatio), TDryBulb), TDryBulb)
+        TWetBulbInf, TWetBulbSup = Bracket
+        TWetBulb = (TWetBulbInf + TWetBulbSup) / 2
+
+        index = 1
+        # Bisection loop
+        while ((TWetBulbSup - TWetBulbInf) > PSYCHROLIB_TOLERANCE):
+
+            # Compute humidity ratio at temperature Tstar
+            Wstar = self.GetHumRatioFromTWetBulb(TDryBulb, TWetBulb)
+
+            # Get new bounds
+            if Wstar > BoundedHumRatio:
+                TWetBulbSup = TWetBulb
+            else:
+                TWetBulbInf = TWetBulb
+
+            # New guess of wet bulb temperature
+            TWetBulb = (TWetBulbSup + TWetBulbInf) / 2
+
+            if (index >= MAX_ITER_COUNT):
+                raise ValueError("Convergence not reached in PsychrometricSite.GetTWetBulbFromHumRatio. Stopping.")
+
+            index = index + 1
+        return TWetBulb
+
+    def TWetBulbLowerBound_(self, TDryBulb: float, BoundedHumRatio: float) -> float:
+        """
+        Helper method returning a lower bound of the wet-bulb temperature given dry-bulb temperature
+        and humidity ratio, the node of the table just below the dew-point temperature if possible.
+
+        """
+        if self.TableStep is not None:
+            Index = bisect.bisect_left(self.TableSatHumRatio_, BoundedHumRatio)
+            if Index < len(self.TableSatHumRatio_):
+                return self.TableTDryBulb_[max(Index - 1, 0)]
+        return GetTDewPointFromHumRatio(TDryBulb, BoundedHumRatio, self.Pressure)
+
+    def GetMoistAirVolume(self, TDryBulb: float, HumRatio: float) -> float:
+        """
+        Return moist air specific volume given dry-bulb temperature and humidity ratio. See GetMoistAirVolume.
+
+        """
+        if PSYCHROLIB_VALIDATE and HumRatio < 0:
+            raise ValueError("Humidity ratio is negative")
+        return self.VolumeFactor_ * (TDryBulb + self.ZeroAbsolute_) * (1 + 1.607858 * max(HumRatio, MIN_HUM_RATIO))
+
+    def GetMoistAirDensity(self, TDryBulb: float, HumRatio: float) -> float:
+        """
+        Return moist air density given dry-bulb temperature and humidity ratio. See GetMoistAirDensity.
+
+        """
+        BoundedHumRatio = max(HumRatio, MIN_HUM_RATIO)
+        return (1 + BoundedHumRatio) / self.GetMoistAirVolume(TDryBulb, BoundedHumRatio)
+
+    def GetSatHumRatioArray(self, TDryBulb):
+        """
+        Return humidity ratio of saturated air given dry-bulb temperature, for arrays. See GetSatHumRatio.
+
+        """
+        if self.TableStep is None:
+            return GetSatHumRatioArray(TDryBulb, self.Pressure)
+        return self.InterpolateArray_(self.TableSatHumRatioArray_, TDryBulb, GetSatHumRatioArray)
+
+    def GetSatAirEnthalpyArray(self, TDryBulb):
+        """
+        Return saturated air enthalpy given dry-bulb temperature, for arrays. See GetSatAirEnthalpy.
+
+        """
+        if self.TableStep is None:
+            return GetSatAirEnthalpyArray(TDryBulb, self.Pressure)
+        return self.InterpolateArray_(self.TableSatAirEnthalpyArray_, TDryBulb, GetSatAirEnthalpyArray)
+
+    def GetHumRatioFromTWetBulbArray(self, TDryBulb, TWetBulb):
+        """
+        Return humidity ratio given dry-bulb and wet-bulb temperatures, for arrays. See GetHumRatioFromTWetBulb.
+
+        """
+        TDryBulb = AsArray_(TDryBulb)
+        TWetBulb = AsArray_(TWetBulb)
+
+        if PSYCHROLIB_VALIDATE and np.any(TWetBulb > TDryBulb):
+            raise ValueError("Wet bulb temperature is above dry bulb temperature")
+
+        Wsstar = self.GetSatHumRatioArray(TWetBulb)
+        return HumRatioFromTWetBulbWsstar_(TDryBulb, TWetBulb, Wsstar, np.broadcast(TDryBulb, TWetBulb).shape, None, None)
+
+    def GetTWetBulbFromHumRatioArray(self, TDryBulb, HumRatio):
+        """
+        Return wet-bulb temperature given dry-bulb temperature and humidity ratio, for arrays.
+        See GetTWetBulbFromHumRatio.
+
+        """
+        TDryBulb = AsArray_(TDryBulb)
+        HumRatio = AsArray_(HumRatio)
+
+        if PSYCHROLIB_VALIDATE and np.any(HumRatio < 0):
+            raise ValueError("Humidity ratio cannot be negative")
+        TDryBulb, BoundedHumRatio = np.broadcast_arrays(TDryBulb, np.maximum(HumRatio, MIN_HUM_RATIO))
+
+        if self.TWetBulbTable_ is None:
+            return self.SolveTWetBulbArray_(TDryBulb, BoundedHumRatio)
+        TWetBulb, Inside = self.InterpolateTWetBulbArray_(TDryBulb, BoundedHumRatio)
+        TWetBulb = np.asarray(TWetBulb)
+        if not np.all(Inside):
+            TWetBulb[~Inside] = self.SolveTWetBulbArray_(TDryBulb[~Inside], BoundedHumRatio[~Inside])
+        return TWetBulb
+
+    def SolveTWetBulbArray_(self, TDryBulb, BoundedHumRatio):
+        """
+        Helper method solving for the wet-bulb temperature given dry-bulb temperature and humidity
+        ratio, for arrays of the same shape.
+
+        """
+        # Initial guesses
+        if self.TableStep is None:
+            TWetBulbInf = GetTDewPointFromHumRatioArray(TDryBulb, BoundedHumRatio, self.Pressure)
+        else:
+            Index = np.searchsorted(self.TableSatHumRatioArray_, BoundedHumRatio)
+            TWetBulbInf = np.asarray(self.TableTDryBulbArray_[np.clip(Index - 1, 0, len(self.TableTDryBulb_) - 1)])
+            Outside = Index >= len(self.TableTDryBulb_)
+            if np.any(Outside):
+                TWetBulbInf[Outside] = GetTDewPointFromHumRatioArray(TDryBulb[Outside], BoundedHumRatio[Outside],
+                                                                     self.Pressure)
+        TWetBulbInf = np.minimum(TWetBulbInf, TDryBulb)
+        TWetBulbSup = TDryBulb
+        TWetBulb = (TWetBulbInf + TWetBulbSup) / 2
+
+        index = 1
+        # Bisection loop
+        while np.any((TWetBulbSup - TWetBulbInf) > ArrayTolerance_()):
+
+            # Compute humidity ratio at temperature Tstar
+            Wstar = self.GetHumRatioFromTWetBulbArray(TDryBulb, TWetBulb)
+
+            # Get new bounds
+            Above = Wstar > BoundedHumRatio
+            TWetBulbSup = np.where(Above, TWetBulb, TWetBulbSup)
+            TWetBulbInf = np.where(Above, TWetBulbInf, TWetBulb)
+
+            # New guess of wet bulb temperature
+            TWetBulb = (TWetBulbSup + TWetBulbInf) / 2
+
+            if (index >= MAX_ITER_COUNT):
+                raise ValueError("Convergence not reached in PsychrometricSite.GetTWetBulbFromHumRatioArray. Stopping.")
+
+            index = index + 1
+        return TWetBulb
+
+    def GetMoistAirVolumeArray(self, TDryBulb, HumRatio):
+        """
+        Return moist air specific volume given dry-bulb temperature and humidity ratio, for arrays.
+        See GetMoistAirVolume.
+
+        """
+        TDryBulb = AsArray_(TDryBulb)
+        HumRatio = AsArray_(HumRatio)
+        if PSYCHROLIB_VALIDATE and np.any(HumRatio < 0):
+            raise ValueError("Humidity ratio is negative")
+        return self.VolumeFactor_ * (TDryBulb + self.ZeroAbsolute_) * (1 + 1.607858 * np.maximum(HumRatio, MIN_HUM_RATIO))
+
+
+#######################################################################################################
+# Out-of-core calculations on memory-mapped files
+#######################################################################################################
+
+def CalcPsychrometricsMemmap(Inputs: dict, Outputs: dict, ChunkSize: int = 65536,
+                             ProgressPath: Optional[str] = None) -> int:
+    """
+    Utility function to calculate psychrometric values from raw binary files or memory-mapped arrays,
+    chunk by chunk, into memory-mapped output files, resuming from the last completed chunk.
+
+    Args:
+        Inputs : Dict of known values keyed by name (see CalcPsychrometrics), each being the path of a raw
+                 binary file of float64, a one dimensional numpy array (e.g. np.memmap) or a scalar
+        Outputs : Dict of the values to calculate keyed by name, each being the path of the raw binary file
+                  of float64 to write or a one dimensional numpy array (e.g. np.memmap opened with mode 'r+')
+        ChunkSize : Number of elements calculated at a time
+        ProgressPath : Path of the file recording the number of elements completed, by default the path of the
+                       first output file with the extension .progress
+
+    Returns:
+        Number of elements calculated by this call, zero if the calculation was already completed
+
+    Notes:
+        The inputs are read and the outputs written sequentially, one chunk at a time, the files being
+        mapped in memory one chunk at a time, so that the memory used is a few times ChunkSize elements
+        per value whatever the size of the files. Arrays given instead of paths remain mapped as given. The outputs are
+        flushed and synchronized to the disk before the progress is recorded after each chunk, so that an
+        interrupted calculation resumes from the last completed chunk when called again with the same arguments.
+        The progress file records the names of the outputs, which must be the same to resume, and a digest of the
+        inputs (the paths, sizes and modification times of the files, the contents of the other arrays and
+        the scalars), of the calculation and of the unit system. The calculation restarts from the start if
+        they changed, or if an output file is missing or has another size. The progress file is kept at the end,
+        so that calling again does nothing; delete it to calculate again.
+
+    Example
+        >>> psychrolib.CalcPsychrometricsMemmap({'TDryBulb': 'tdb.f64', 'RelHum': 'rh.f64', 'Pressure': 101325},
+        ...                                     {'TWetBulb': 'twb.f64', 'HumRatio': 'w.f64'})
+
+    """
+    CheckNumpy_()
+    if ChunkSize <= 0:
+        raise ValueError("The size of the chunks must be positive")
+    Plan = GetPsychrometricsPlanCached_(frozenset(Inputs), tuple(Outputs))
+
+    for Value in Inputs.values():
+        if isinstance(Value, (str, os.PathLike)) and os.path.getsize(Value) % 8:
+            raise ValueError("The size of the input file {} is not a multiple of 8 bytes".format(Value))
+    Lengths = set(os.path.getsize(Value) // 8 if isinstance(Value, (str, os.PathLike)) else len(Value)
+                  for Value in Inputs.values() if isinstance(Value, (str, os.PathLike)) or np.ndim(Value) > 0)
+    if len(Lengths) != 1:
+        raise ValueError("The input arrays must have the same length, and at least one input must be an array")
+    Length = Lengths.pop()
+
+    Paths = [Value for Value in Outputs.values() if isinstance(Value, (str, os.PathLike))]
+    if ProgressPath is None:
+        if not Paths:
+            raise ValueError("ProgressPath is required when no output is a path")
+        ProgressPath = os.fspath(Paths[0]) + '.progress'
+    def InputKey(Value):
+        # Identity of an input: path, size and modification time of files, contents of other arrays
+        Path = Value if isinstance(Value, (str, os.PathLike)) else getattr(Value, 'filename', None)
+        if Path is not None:
+            Stat = os.stat(Path)
+            return '{} {} {} {}'.format(os.path.abspath(Path), getattr(Value, 'offset', 0), Stat.st_size,
+                                        Stat.st_mtime_ns)
+        if np.ndim(Value) > 0:
+            return hashlib.sha1(np.ascontiguousarray(Value, dtype=np.float64)).hexdigest()
+        return repr(float(Value))
+
+    Key = '{} {!r} {}'.format(GetUnitSystem(), Plan,
+                              ' '.join('{}={}'.format(Name, InputKey(Value)) for Name, Value in sorted(Inputs.items())))
+    Identity = hashlib.sha1(Key.encode()).hexdigest()[:16]
+
+    Completed = 0
+    if os.path.exists(ProgressPath):
+        with open(ProgressPath) as File:
+            Fields = File.read().split()
+        Completed, ProgressLength = int(Fields[0]), int(Fields[1])
+        if ProgressLength != Length:
+            raise ValueError("The progress file {} is for inputs of another length".format(ProgressPath))
+        if len(Fields) < 3 or set(Fields[2].split(',')) != set(Outputs):
+            raise ValueError("The progress file {} is for other outputs".format(ProgressPath))
+        # The calculation restarts from the start when the inputs, the calculation or the unit system changed
+        if len(Fields) != 4 or Fields[3] != Identity:
+            Completed = 0
+
+    # The calculation restarts from the start when an output file is missing or has another size
+    if any(not os.path.exists(Path) or os.path.getsize(Path) != 8 * Length for Path in Paths):
+        Completed = 0
+    for Name, Value in Outputs.items():
+        if isinstance(Value, (str, os.PathLike)):
+            if not Completed:
+                with open(Value, 'wb') as File:
+                    File.truncate(8 * Length)
+        elif Value.shape != (Length,):
+            raise ValueError("Output {} has shape {} instead of {}".format(Name, Value.shape, (Length,)))
+
+    def Chunk(Value, Mode, Begin, End):
+        # Chunk of an array, or of a file mapped in memory until the chunk is released
+        if isinstance(Value, (str, os.PathLike)):
+            return np.memmap(Value, dtype=np.float64, mode=Mode, offset=8 * Begin, shape=(End - Begin,))
+        return Value[Begin:End] if np.ndim(Value) > 0 else Value
+
+    def Sync(Value):
+        # Write the data of an output file, flushed from memory, to the disk
+        Path = Value if isinstance(Value, (str, os.PathLike)) else getattr(Value, 'filename', None)
+        if Path is not None:
+            with open(Path, 'rb+') as File:
+                os.fsync(File.fileno())
+
+    Start = Completed
+    while Completed < Length:
+        End = min(Completed + ChunkSize, Length)
+        Values = CalcPsychrometrics({Name: Chunk(Value, 'r', Completed, End) for Name, Value in Inputs.items()},
+                                    tuple(Outputs))
+        for Name, Value in Outputs.items():
+            Output = Chunk(Value, 'r+', Completed, End)
+            Output[:] = Values[Name]
+            if isinstance(Output, np.memmap):
+                Output.flush()
+            del Output
+            Sync(Value)
+        del Values
+        Completed = End
+
+        # Record the progress atomically, once the outputs are on disk
+        with open(ProgressPath + '.tmp', 'w') as File:
+            File.write('{} {} {} {}'.format(Completed, Length, ','.join(Outputs), Identity))
+            File.flush()
+            os.fsync(File.fileno())
+        os.replace(ProgressPath + '.tmp', ProgressPath)
+    return Completed - Start
+
+
+#######################################################################################################
+# pandas DataFrame accessor
+#######################################################################################################
+
+CALC_PSYCHROMETRICS_OUTPUTS = {
+    'TWetBulb': ('HumRatio', 'TDewPoint', 'RelHum', 'VapPres', 'MoistAirEnthalpy', 'MoistAirVolume',
+                 'DegreeOfSaturation'),
+    'TDewPoint': ('HumRatio', 'TWetBulb', 'RelHum', 'VapPres', 'MoistAirEnthalpy', 'MoistAirVolume',
+                  'DegreeOfSaturation'),
+    'RelHum': ('HumRatio', 'TWetBulb', 'TDewPoint', 'VapPres', 'MoistAirEnthalpy', 'MoistAirVolume',
+               'DegreeOfSaturation'),
+}
+"""dict: Names of the values calculated by the functions CalcPsychrometricsFrom..., keyed by the name of their
+         second argument.
+
+"""
+
+class PsychrometricsAccessor:
+    """
+    Accessor of pandas DataFrames, registered as DataFrame.psychro by RegisterPandasAccessor, calculating
+    psychrometric values from columns with the array functions.
+
+    Args:
+        DataFrame : DataFrame whose columns hold psychrometric values
+
+    Notes:
+        The inputs are given as names of columns, or as values (scalars or arrays) for those which are
+        not columns, e.g. a constant pressure. The columns are passed to the array functions as the
+        underlying numpy arrays, without copy for float columns. NaN rows give NaN results.
+        The results are returned as a new DataFrame with the index of the DataFrame, and can be
+        joined to it with DataFrame.join.
+
+    Example
+        >>> psychrolib.SetUnitSystem(psychrolib.SI)
+        >>> psychrolib.RegisterPandasAccessor()
+        >>> df = pd.DataFrame({'T': [20, 25, np.nan], 'RH': [0.5, 0.6, 0.7]})
+        >>> df.join(df.psychro.FromRelHum(TDryBulb='T', RelHum='RH', Pressure=101325,
+        ...                               Outputs=['TWetBulb', 'MoistAirEnthalpy']))
+
+    """
+    def __init__(self, DataFrame):
+        self.DataFrame_ = DataFrame
+
+    def Column_(self, Value):
+        """
+        Helper method returning the numpy array of a column given its name, or the value itself.
+
+        """
+        if isinstance(Value, str):
+            return self.DataFrame_[Value].to_numpy(dtype=PSYCHROLIB_ARRAY_DTYPE, copy=False)
+        return Value
+
+    def Calc(self, Outputs, **Inputs):
+        """
+        Return the requested psychrometric values given any set of known values, see CalcPsychrometrics.
+
+        Args:
+            Outputs : Names of the values to calculate, e.g. ('TWetBulb', 'MoistAirEnthalpy')
+            Inputs : Names of the columns, or values, of the known values as keyword arguments,
+                     e.g. TDryBulb='T', RelHum='RH', Pressure=101325
+
+        Returns:
+            DataFrame of the requested values, in columns named after them, with the index of the DataFrame
+
+        """
+        Values = CalcPsychrometrics({Name: self.Column_(Value) for Name, Value in Inputs.items()}, Outputs)
+        Length = len(self.DataFrame_.index)
+        return ImportOptional_('pandas').DataFrame({Name: np.broadcast_to(Value, (Length,)) if np.ndim(Value) == 0 else Value
+                             for Name, Value in Values.items()}, index=self.DataFrame_.index)
+
+    def FromTWetBulb(self, TDryBulb, TWetBulb, Pressure, Outputs=None):
+        """
+        Return the values of CalcPsychrometricsFromTWetBulb, or those requested, given dry-bulb temperature,
+        wet-bulb temperature, and pressure, as names of columns or values. See Calc.
+
+        """
+        return self.Calc(Outputs or CALC_PSYCHROMETRICS_OUTPUTS['TWetBulb'],
+                         TDryBulb=TDryBulb, TWetBulb=TWetBulb, Pressure=Pressure)
+
+    def FromTDewPoint(self, TDryBulb, TDewPoint, Pressure, Outputs=None):
+        """
+        Return the values of CalcPsychrometricsFromTDewPoint, or those requested, given dry-bulb temperature,
+        dew-point temperature, and pressure, as names of columns or values. See Calc.
+
+        """
+        return self.Calc(Outputs or CALC_PSYCHROMETRICS_OUTPUTS['TDewPoint'],
+                         TDryBulb=TDryBulb, TDewPoint=TDewPoint, Pressure=Pressure)
+
+    def FromRelHum(self, TDryBulb, RelHum, Pressure, Outputs=None):
+        """
+        Return the values of CalcPsychrometricsFromRelHum, or those requested, given dry-bulb temperature,
+        relative humidity, and pressure, as names of columns or values. See Calc.
+
+        """
+        return self.Calc(Outputs or CALC_PSYCHROMETRICS_OUTPUTS['RelHum'],
+                         TDryBulb=TDryBulb, RelHum=RelHum, Pressure=Pressure)
+
+def RegisterPandasAccessor() -> None:
+    """
+    Register PsychrometricsAccessor as the accessor DataFrame.psychro of pandas DataFrames.
+
+    Notes:
+        pandas is only imported by this function, so that importing psychrolib does not import it.
+        Registering the accessor again has no effect.
+
+    """
+    pd = ImportOptional_('pandas')
+    if getattr(pd.DataFrame, 'psychro', None) is not PsychrometricsAccessor:
+        pd.api.extensions.register_dataframe_accessor('psychro')(PsychrometricsAccessor)
+
+
+#######################################################################################################
+# Apache Arrow and Polars
+#######################################################################################################
+
+def ImportOptional_(Name: str):
+    """
+    Helper function importing an optional package, raising an error if it is not installed.
+
+    """
+    try:
+        return importlib.import_module(Name)
+    except ImportError:
+        raise ImportError("{} is required by this function, please install it first.".format(Name)) from None
+
+def ArrayFunction_(Function):
+    """
+    Helper function returning the array function given the name of a function, with or without
+    the Array suffix, or the array function itself.
+
+    """
+    if callable(Function):
+        return Function
+    ArrayFunction = globals().get(Function if Function.endswith('Array') else Function + 'Array')
+    if ArrayFunction is None:
+        raise ValueError("No array function for {}".format(Function))
+    return ArrayFunction
+
+def IsArrow_(Value, *Classes) -> bool:
+    """
+    Helper function returning whether a value is an instance of one of the given pyarrow classes,
+    without importing pyarrow.
+
+    """
+    return any(Class.__module__.startswith('pyarrow') and Class.__name__ in Classes for Class in type(Value).__mro__)
+
+def ColumnAsArray_(Value):
+    """
+    Helper function returning the numpy array of a pyarrow Array or a Polars Series, without copy when
+    they have no nulls and the floating point type of the array functions, with NaN for the nulls.
+
+    """
+    if IsArrow_(Value, 'Array'):
+        return AsArray_(Value.to_numpy(zero_copy_only=False))
+    if type(Value).__module__.startswith('polars') and type(Value).__name__ == 'Series':
+        return AsArray_(Value.to_numpy())
+    return Value
+
+def ArrowChunks_(Args: tuple):
+    """
+    Helper generator yielding the arguments of CalcArrow chunk by chunk, as numpy arrays. The chunks
+    are delimited by the boundaries of the chunks of all the ChunkedArrays, which are sliced without copy.
+
+    """
+    Chunked = [Arg for Arg in Args if IsArrow_(Arg, 'ChunkedArray')]
+    if not Chunked:
+        yield tuple(ColumnAsArray_(Arg) for Arg in Args)
+        return
+
+    Length = len(Chunked[0])
+    Offsets = {}
+    for Arg in Chunked:
+        if len(Arg) != Length:
+            raise ValueError("The chunked arrays have different lengths")
+        Offsets[id(Arg)] = [0]
+        for Chunk in Arg.chunks:
+            Offsets[id(Arg)].append(Offsets[id(Arg)][-1] + len(Chunk))
+    Boundaries = sorted(set(Offset for ArgOffsets in Offsets.values() for Offset in ArgOffsets))
+
+    Args = [Arg if id(Arg) in Offsets else ColumnAsArray_(Arg) for Arg in Args]
+    for Start, End in zip(Boundaries[:-1], Boundaries[1:]):
+        Values = []
+        for Arg in Args:
+            if id(Arg) in Offsets:
+                Index = bisect.bisect_right(Offsets[id(Arg)], Start) - 1
+                Values.append(ColumnAsArray_(Arg.chunk(Index).slice(Start - Offsets[id(Arg)][Index], End - Start)))
+            elif np.ndim(Arg) > 0:
+                Values.append(Arg[Start:End])
+            else:
+                Values.append(Arg)
+        yield tuple(Values)
+
+def CalcArrow(Function, *Args):
+    """
+    Apply an array function to pyarrow Arrays or ChunkedArrays, Polars Series, numpy arrays or scalars,
+    returning a pyarrow array.
+
+    Args:
+        Function : Name of the function, e.g. 'GetTWetBulbFromRelHum', or the array function itself
+        Args : Arguments of the function
+
+    Returns:
+        pyarrow ChunkedArray if any argument is one, otherwise pyarrow Array, with nulls for NaN results
+
+    Notes:
+        The ChunkedArrays are processed chunk by chunk and never concatenated; the chunks of the result are
+        delimited by the boundaries of the chunks of all the arguments. The Arrow and Polars columns
+        are passed to the array functions without copy when they have no nulls and the floating point
+        type of the array functions, and nulls are read as NaN. Requires pyarrow.
+
+    Example
+        >>> TWetBulb = psychrolib.CalcArrow('GetTWetBulbFromRelHum', Table['T'], Table['RH'], 101325)
+
+    """
+    pa = ImportOptional_('pyarrow')
+    CheckNumpy_()
+    ArrayFunction = ArrayFunction_(Function)
+
+    Chunks = [pa.array(ArrayFunction(*Values), from_pandas=True) for Values in ArrowChunks_(Args)]
+    if any(IsArrow_(Arg, 'ChunkedArray') for Arg in Args):
+        return pa.chunked_array(Chunks, type=pa.from_numpy_dtype(np.dtype(PSYCHROLIB_ARRAY_DTYPE)))
+    return Chunks[0]
+
+def PolarsExpr(Function, *Args):
+    """
+    Return a Polars expression applying an array function to columns, for use in lazy queries.
+
+    Args:
+        Function : Name of the function, e.g. 'GetTWetBulbFromRelHum', or the array function itself
+        Args : Arguments of the function, as names of columns, Polars expressions or constant values
+
+    Returns:
+        Polars expression of the result, with nulls for NaN results
+
+    Notes:
+        The columns are passed batch by batch to the array function with Expr.map_batches, without copy
+        when they have no nulls, and nulls are read as NaN. The function is elementwise, so that the
+        expression can be used in streaming queries. Requires polars.
+
+    Example
+        >>> Frame.lazy().with_columns(
+        ...     TWetBulb=psychrolib.PolarsExpr('GetTWetBulbFromRelHum', 'T', 'RH', 101325),
+        ...     Enthalpy=psychrolib.PolarsExpr('GetMoistAirEnthalpy', 'T', pl.col('W'))).collect()
+
+    """
+    pl = ImportOptional_('polars')
+    CheckNumpy_()
+    ArrayFunction = ArrayFunction_(Function)
+
+    Columns = {}
+    for Index, Arg in enumerate(Args):
+        if isinstance(Arg, str):
+            Columns[Index] = pl.col(Arg)
+        elif isinstance(Arg, pl.Expr):
+            Columns[Index] = Arg
+    if not Columns:
+        raise ValueError("At least one argument must be a column")
+
+    def Batch(Struct):
+        Values = [ColumnAsArray_(Struct.struct.field(str(Index))) if Index in Columns else Arg
+                  for Index, Arg in enumerate(Args)]
+        return pl.Series(ArrayFunction(*Values), nan_to_null=True)
+
+    return pl.struct(*(Column.alias(str(Index)) for Index, Column in Columns.items())) \
+        .map_batches(Batch, return_dtype=pl.Float32 if PSYCHROLIB_ARRAY_DTYPE == 'float32' else pl.Float64,
+                     is_elementwise=True)
+
+
+#######################################################################################################
+# Parquet output
+#######################################################################################################
+
+PSYCHROMETRIC_UNITS = {
+    # Name: (IP unit, SI unit)
+    'Altitude': ('ft', 'm'),
+    'Pressure': ('psi', 'Pa'),
+    'TDryBulb': ('°F', '°C'),
+    'TWetBulb': ('°F', '°C'),
+    'TDewPoint': ('°F', '°C'),
+    'RelHum': ('1', '1'),
+    'VapPres': ('psi', 'Pa'),
+    'HumRatio': ('lb_H₂O lb_Air⁻¹', 'kg_H₂O kg_Air⁻¹'),
+    'SpecificHum': ('lb_H₂O lb_Air⁻¹', 'kg_H₂O kg_Air⁻¹'),
+    'MoistAirEnthalpy': ('Btu lb⁻¹', 'J kg⁻¹'),
+    'MoistAirVolume': ('ft³ lb⁻¹', 'm³ kg⁻¹'),
+    'MoistAirDensity': ('lb ft⁻³', 'kg m⁻³'),
+    'DegreeOfSaturation': ('1', '1'),
+    'VaporPressureDeficit': ('psi', 'Pa'),
+    'SatVapPres': ('psi', 'Pa'),
+    'SatHumRatio': ('lb_H₂O lb_Air⁻¹', 'kg_H₂O kg_Air⁻¹'),
+    'SatAirEnthalpy': ('Btu lb⁻¹', 'J kg⁻¹'),
+    'DryAirEnthalpy': ('Btu lb⁻¹', 'J kg⁻¹'),
+    'DryAirVolume': ('ft³ lb⁻¹', 'm³ kg⁻¹'),
+    'DryAirDensity': ('lb ft⁻³', 'kg m⁻³'),
+}
+"""dict: Units of the psychrometric values known to CalcPsychrometrics, in IP and SI.
+
+"""
+
+class PsychrometricsParquetWriter:
+    """
+    Writer of psychrometric values calculated batch by batch to a Parquet file, each batch being written
+    as a row group as soon as it is calculated, so that the memory used does not grow with the number of batches.
+
+    Args:
+        Path : Path of the Parquet file
+        Inputs : Names of the known values given to each batch, e.g. ('TDryBulb', 'TDewPoint', 'Pressure')
+        Outputs : Names of the values to calculate, see CalcPsychrometrics
+        Columns : Optional dict of other columns given to each batch, e.g. station or time, keyed by
+                  name, with their pyarrow data types as values
+        WriteInputs : Whether to write the inputs as well as the outputs
+        Compression : Compression of the file, see pyarrow.parquet.ParquetWriter
+
+    Notes:
+        The schema is fixed when the writer is created: the other columns, then the inputs if written,
+        then the outputs, named after the values. The unit of each value in the system of units in use
+        is stored in the metadata of its field, under the key "unit", and the system of units in the
+        metadata of the schema, under the key "psychrolib_units". Requires pyarrow.
+
+    Example
+        >>> with psychrolib.PsychrometricsParquetWriter('hourly.parquet', ('TDryBulb', 'TDewPoint', 'Pressure'),
+        ...                                             ('HumRatio', 'TWetBulb', 'RelHum'),
+        ...                                             Columns={'Station': pa.string()}) as Writer:
+        ...     for Station, TDryBulb, TDewPoint, Pressure in Stations:
+        ...         Writer.Write(Station=Station, TDryBulb=TDryBulb, TDewPoint=TDewPoint, Pressure=Pressure)
+
+    """
+    def __init__(self, Path: str, Inputs, Outputs, Columns: Optional[dict] = None, WriteInputs: bool = True,
+                 Compression: str = 'snappy'):
+        pa = ImportOptional_('pyarrow')
+        pq = ImportOptional_('pyarrow.parquet')
+        CheckNumpy_()
+
+        self.Inputs = tuple(Inputs)
+        self.Outputs = tuple(Outputs)
+        self.Columns = dict(Columns or {})
+        # Check that the outputs can be calculated before creating the file
+        GetPsychrometricsPlanCached_(frozenset(self.Inputs), self.Outputs)
+
+        Units = 0 if isIP() else 1
+        ValueType = pa.from_numpy_dtype(np.dtype(PSYCHROLIB_ARRAY_DTYPE))
+        Fields = [pa.field(Name, Type) for Name, Type in self.Columns.items()]
+        self.Values_ = (self.Inputs if WriteInputs else ()) + tuple(Name for Name in self.Outputs
+                                                                     if not (WriteInputs and Name in self.Inputs))
+        Fields += [pa.field(Name, ValueType, metadata={'unit': PSYCHROMETRIC_UNITS[Name][Units]})
+                   for Name in self.Values_]
+        self.Schema = pa.schema(Fields, metadata={'psychrolib_units': GetUnitSystem().name})
+        self.Writer_ = pq.ParquetWriter(Path, self.Schema, compression=Compression)
+
+    def Write(self, **Values) -> None:
+        """
+        Calculate the outputs of a batch and write them, with the inputs and other columns, as a row group.
+
+        Args:
+            Values : Arrays or scalars of the inputs and other columns of the batch, as keyword arguments.
+                     Scalars are repeated over the batch.
+
+        """
+        pa = ImportOptional_('pyarrow')
+
+        Missing = set(self.Inputs).union(self.Columns).difference(Values)
+        if Missing:
+            raise ValueError("Missing values: {}".format(', '.join(sorted(Missing))))
+        Inputs = {Name: ColumnAsArray_(Values[Name]) for Name in self.Inputs}
+        Results = dict(Inputs)
+        Results.update(CalcPsychrometrics(Inputs, self.Outputs))
+        Length = np.broadcast(*Results.values()).size
+
+        Arrays = []
+        for Name, Type in self.Columns.items():
+            if not isinstance(Values[Name], (pa.Array, pa.ChunkedArray)) and np.ndim(Values[Name]) == 0:
+                Arrays.append(pa.repeat(pa.scalar(Values[Name], Type), Length))
+            else:
+                Arrays.append(pa.array(Values[Name], type=Type))
+        for Name in self.Values_:
+            Arrays.append(pa.array(np.broadcast_to(AsArray_(Results[Name]), (Length,)).ravel(), from_pandas=True))
+        self.Writer_.write_table(pa.Table.from_arrays(Arrays, schema=self.Schema))
+
+    def Close(self) -> None:
+        """
+        Close the file, which is only valid once closed.
+
+        """
+        self.Writer_.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *Exception):
+        self.Close()
+
+
+#######################################################################################################
+# Psychrometric chart
+#######################################################################################################
+
+def GetPsychrometricChart(Pressure: float, TDryBulbRange: Optional[tuple] = None, HumRatioMax: Optional[float] = None,
+                          Resolution: int = 101, RelHumLevels=None, TWetBulbLevels=None, EnthalpyLevels=None,
+                          VolumeLevels=None) -> dict:
+    """
+    Return the curves of a psychrometric chart, calculated for all the levels of each family at once.
+
+    Args:
+        Pressure : Atmospheric pressure in Psi [IP] or Pa [SI]
+        TDryBulbRange : Range of dry-bulb temperature of the chart in °F [IP] or °C [SI],
+                        by default (14, 122) °F [IP] or (-10, 50) °C [SI]
+        HumRatioMax : Largest humidity ratio of the chart in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI],
+                      by default 0.03
+        Resolution : Number of points of each curve
+        RelHumLevels : Relative humidity of the lines of constant relative humidity, by default 0.1 to 1
+        TWetBulbLevels : Wet-bulb temperature of the lines of constant wet-bulb temperature in °F [IP] or °C [SI],
+                         by default every 10 °F [IP] or 5 °C [SI] over the range of dry-bulb temperature
+        EnthalpyLevels : Enthalpy of the lines of constant enthalpy in Btu lb⁻¹ [IP] or J kg⁻¹ [SI],
+                         by default every 5 Btu lb⁻¹ [IP] or 10 kJ kg⁻¹ [SI] over the chart
+        VolumeLevels : Specific volume of the lines of constant specific volume in ft³ lb⁻¹ [IP] or m³ kg⁻¹ [SI],
+                       by default every 0.5 ft³ lb⁻¹ [IP] or 0.02 m³ kg⁻¹ [SI] over the chart
+
+    Returns:
+        Dict of the curves, with keys:
+            - TDryBulb: grid of dry-bulb temperature of the curves in functions of dry-bulb temperature
+            - HumRatio: grid of humidity ratio of the curves in functions of humidity ratio
+            - Saturation: humidity ratio of saturated air on the TDryBulb grid
+            - RelHum, TWetBulb: dicts of the Levels and the HumRatio of the lines, one row per level,
+              on the TDryBulb grid
+            - MoistAirEnthalpy, MoistAirVolume: dicts of the Levels and the TDryBulb of the lines, one row per
+              level, on the HumRatio grid
+        Points outside the chart, i.e. outside the range of dry-bulb temperature or above HumRatioMax,
+        or above the saturation curve are NaN.
+
+    Notes:
+        The charts are kept in a cache of the 64 most recent, keyed by the unit system, the floating
+        point type of the array functions and the arguments. The dicts returned are new for each call,
+        and their arrays are read-only arrays shared with the cache. Requires numpy.
+
+    Example
+        >>> Chart = psychrolib.GetPsychrometricChart(101325)
+        >>> for Level, HumRatio in zip(Chart['RelHum']['Levels'], Chart['RelHum']['HumRatio']):
+        ...     pyplot.plot(Chart['TDryBulb'], HumRatio)
+
+    """
+    CheckNumpy_()
+    if Resolution < 2:
+        raise ValueError("The resolution of the chart must be at least 2 points")
+
+    def Levels(Values):
+        return None if Values is None else tuple(float(Value) for Value in np.ravel(Values))
+
+    Chart = GetPsychrometricChartCached_(GetUnitSystem(), PSYCHROLIB_ARRAY_DTYPE, float(Pressure),
+                                         None if TDryBulbRange is None else tuple(map(float, TDryBulbRange)),
+                                         None if HumRatioMax is None else float(HumRatioMax), int(Resolution),
+                                         Levels(RelHumLevels), Levels(TWetBulbLevels), Levels(EnthalpyLevels),
+                                         Levels(VolumeLevels))
+    # Copies of the dicts, so that changing them does not change the cached chart
+    return {Name: dict(Value) if isinstance(Value, dict) else Value for Name, Value in Chart.items()}
+
+def ChartLevels_(Lower: float, Upper: float, Step: float) -> tuple:
+    """
+    Helper function returning the multiples of a step within a range.
+
+    """
+    return tuple(Step * np.arange(math.ceil(Lower / Step), math.floor(Upper / Step) + 1))
+
+@lru_cache(maxsize=64)
+def GetPsychrometricChartCached_(Units: UnitSystem, DataType: str, Pressure: float, TDryBulbRange: Optional[tuple],
+                                 HumRatioMax: Optional[float], Resolution: int, RelHumLevels: Optional[tuple],
+                                 TWetBulbLevels: Optional[tuple], EnthalpyLevels: Optional[tuple],
+                                 VolumeLevels: Optional[tuple]) -> dict:
+    """
+    Helper function implementing GetPsychrometricChart. The unit system and data type are only used as keys
+    of the cache.
+
+    """
+    if TDryBulbRange is None:
+        TDryBulbRange = (14., 122.) if isIP() else (-10., 50.)
+    if HumRatioMax is None:
+        HumRatioMax = 0.03
+    TMin, TMax = TDryBulbRange
+    if not TMin < TMax:
+        raise ValueError("The range of dry-bulb temperature of the chart is empty")
+
+    TDryBulb = AsArray_(np.linspace(TMin, TMax, Resolution))
+    HumRatio = AsArray_(np.linspace(0, HumRatioMax, Resolution))
+    Saturation = GetSatHumRatioArray(TDryBulb, Pressure)
+    Saturation[Saturation > HumRatioMax] = np.nan
+
+    def AboveSaturation(T, W):
+        # Points outside the range of the chart, or above the saturation curve
+        Outside = (T < TMin) | (T > TMax) | np.isnan(T)
+        return Outside | (W > GetSatHumRatioArray(np.clip(np.where(np.isnan(T), TMin, T), TMin, TMax), Pressure))
+
+    # Lines of constant relative humidity and wet-bulb temperature, on the TDryBulb grid
+    if RelHumLevels is None:
+        RelHumLevels = ChartLevels_(0.1, 1, 0.1)
+    RelHumLevels = AsArray_(RelHumLevels)
+    RelHumLines = GetHumRatioFromRelHumArray(TDryBulb, RelHumLevels[:, np.newaxis], Pressure)
+    RelHumLines[RelHumLines > HumRatioMax] = np.nan
+
+    if TWetBulbLevels is None:
+        TWetBulbLevels = ChartLevels_(TMin, TMax, 10 if isIP() else 5)
+    TWetBulbLevels = AsArray_(TWetBulbLevels)[:, np.newaxis]
+    TWetBulbLines = GetHumRatioFromTWetBulbArray(np.maximum(TDryBulb, TWetBulbLevels), TWetBulbLevels, Pressure)
+    TWetBulbLines[(TDryBulb < TWetBulbLevels) | (TWetBulbLines < 0) | (TWetBulbLines > HumRatioMax)] = np.nan
+
+    # Lines of constant enthalpy and specific volume, on the HumRatio grid
+    if EnthalpyLevels is None:
+        EnthalpyLevels = ChartLevels_(GetMoistAirEnthalpy(TMin, 0), GetMoistAirEnthalpy(TMax, HumRatioMax),
+                                      5 if isIP() else 10000)
+    EnthalpyLevels = AsArray_(EnthalpyLevels)
+    EnthalpyLines = GetTDryBulbFromEnthalpyAndHumRatioArray(EnthalpyLevels[:, np.newaxis], HumRatio)
+    EnthalpyLines[AboveSaturation(EnthalpyLines, HumRatio)] = np.nan
+
+    if VolumeLevels is None:
+        VolumeLevels = ChartLevels_(GetMoistAirVolume(TMin, 0, Pressure), GetMoistAirVolume(TMax, HumRatioMax, Pressure),
+                                    0.5 if isIP() else 0.02)
+    VolumeLevels = AsArray_(VolumeLevels)
+    VolumeLines = GetTDryBulbFromMoistAirVolumeAndHumRatioArray(VolumeLevels[:, np.newaxis], HumRatio, Pressure)
+    VolumeLines[AboveSaturation(VolumeLines, HumRatio)] = np.nan
+
+    Chart = {
+        'TDryBulb': TDryBulb,
+        'HumRatio': HumRatio,
+        'Saturation': Saturation,
+        'RelHum': {'Levels': RelHumLevels, 'HumRatio': RelHumLines},
+        'TWetBulb': {'Levels': TWetBulbLevels[:, 0], 'HumRatio': TWetBulbLines},
+        'MoistAirEnthalpy': {'Levels': EnthalpyLevels, 'TDryBulb': EnthalpyLines},
+        'MoistAirVolume': {'Levels': VolumeLevels, 'TDryBulb': VolumeLines},
+    }
+    for Value in Chart.values():
+        for Array in Value.values() if isinstance(Value, dict) else (Value,):
+            Array.flags.writeable = False
+    return Chart
+
+
+#######################################################################################################
+# Regions of the psychrometric chart
+#######################################################################################################
+
+class PsychrometricRegion:
+    """
+    Region of the psychrometric chart, defined by limits of dry-bulb temperature, dew-point temperature,
+    relative humidity and humidity ratio, and optionally a polygon in (TDryBulb, HumRatio) space.
+
+    Args:
+        Name : Name of the region
+        TDryBulb : Optional (lower, upper) limits of dry-bulb temperature in °F [IP] or °C [SI]
+        TDewPoint : Optional (lower, upper) limits of dew-point temperature in °F [IP] or °C [SI]
+        RelHum : Optional (lower, upper) limits of relative humidity in range [0, 1]
+        HumRatio : Optional (lower, upper) limits of humidity ratio in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI]
+        Polygon : Optional vertices (TDryBulb, HumRatio) of a polygon which the points must be inside
+
+    Notes:
+        Either limit can be None for no limit. The points must satisfy all the limits, which are inclusive.
+
+    """
+    def __init__(self, Name: str, TDryBulb: Optional[tuple] = None, TDewPoint: Optional[tuple] = None,
+                 RelHum: Optional[tuple] = None, HumRatio: Optional[tuple] = None, Polygon=None):
+        def Limits(Value):
+            if Value is None:
+                return (-math.inf, math.inf)
+            Lower, Upper = Value
+            return (-math.inf if Lower is None else Lower, math.inf if Upper is None else Upper)
+
+        self.Name = Name
+        self.TDryBulb = Limits(TDryBulb)
+        self.TDewPoint = Limits(TDewPoint)
+        self.RelHum = Limits(RelHum)
+        self.HumRatio = Limits(HumRatio)
+        self.Polygon = None if Polygon is None else tuple((float(T), float(W)) for T, W in Polygon)
+        if self.Polygon is not None and len(self.Polygon) < 3:
+            raise ValueError("The polygon of a region must have at least 3 vertices")
+
+    def __repr__(self):
+        return 'PsychrometricRegion({!r})'.format(self.Name)
+
+ASHRAE_DATA_CENTER_CLASSES = (
+    # Name, dry-bulb temperature limits in °C, lower dew-point temperature limit in °C, lower relative
+    # humidity limit, upper dew-point temperature limit in °C, upper relative humidity limit
+    ('Recommended', (18, 27), -9, None, 15, 0.60),
+    ('A1', (15, 32), -12, 0.08, 17, 0.80),
+    ('A2', (10, 35), -12, 0.08, 21, 0.80),
+    ('A3', (5, 40), -12, 0.08, 24, 0.85),
+    ('A4', (5, 45), -12, 0.08, 24, 0.90),
+)
+"""tuple: Envelopes of the ASHRAE thermal guidelines for data processing environments (2021, 5th edition),
+          for the air at the inlet of IT equipment, in SI units.
+
+"""
+
+def GetASHRAEDataCenterRegions() -> list:
+    """
+    Return the envelopes of the ASHRAE thermal guidelines for data processing environments as regions
+    in the unit system in use, from the most to the least restrictive: Recommended, A1, A2, A3 and A4.
+
+    Notes:
+        The lower moisture limit of the allowable classes is the higher of the lower dew-point temperature
+        and relative humidity limits, so both are limits of the regions. See ASHRAE_DATA_CENTER_CLASSES.
+
+    """
+    def Temperature(TCelsius):
+        return TCelsius * 9. / 5. + 32. if isIP() and TCelsius is not None else TCelsius
+
+    return [PsychrometricRegion(Name, TDryBulb=tuple(Temperature(T) for T in TDryBulb),
+                                TDewPoint=(Temperature(TDewPointMin), Temperature(TDewPointMax)),
+                                RelHum=(RelHumMin, RelHumMax))
+            for Name, TDryBulb, TDewPointMin, RelHumMin, TDewPointMax, RelHumMax in ASHRAE_DATA_CENTER_CLASSES]
+
+class RegionClassifier:
+    """
+    Vectorized classifier of states of moist air into regions of the psychrometric chart, at a given pressure.
+
+    Args:
+        Regions : Sequence of PsychrometricRegion, in order of precedence
+        Pressure : Atmospheric pressure in Psi [IP] or Pa [SI]
+
+    Notes:
+        The limits of the regions are converted to (TDryBulb, HumRatio) space when the classifier is created:
+        the dew-point temperature limits become humidity ratio limits, and the relative humidity limits are
+        compared to the vapor pressure, which is calculated once for all the regions. The points are
+        classified in the region of highest precedence containing them, e.g. the first matching envelope of
+        GetASHRAEDataCenterRegions. Requires numpy.
+
+    Example
+        >>> Classifier = psychrolib.RegionClassifier(psychrolib.GetASHRAEDataCenterRegions(), 101325)
+        >>> HumRatio = psychrolib.GetHumRatioFromRelHumArray(TDryBulb, RelHum, 101325)
+        >>> Classifier.GetTimeInRegions(TDryBulb, HumRatio, TimeStep=1 / 60)
+
+    """
+    def __init__(self, Regions, Pressure: float):
+        CheckNumpy_()
+        self.Regions = list(Regions)
+        self.Pressure = Pressure
+
+        # Humidity ratio limits, the tightest of the humidity ratio and dew-point temperature limits
+        self.HumRatioLimits_ = []
+        for Region in self.Regions:
+            Lower, Upper = Region.HumRatio
+            if Region.TDewPoint[0] > -math.inf:
+                Lower = max(Lower, GetHumRatioFromTDewPoint(Region.TDewPoint[0], Pressure))
+            if Region.TDewPoint[1] < math.inf:
+                Upper = min(Upper, GetHumRatioFromTDewPoint(Region.TDewPoint[1], Pressure))
+            self.HumRatioLimits_.append((Lower, Upper))
+
+    def Contains_(self, Index: int, TDryBulb, HumRatio, VapPres, SatVapPres):
+        """
+        Helper method returning whether the points are in a region.
+
+        """
+        Region = self.Regions[Index]
+        Inside = (TDryBulb >= Region.TDryBulb[0]) & (TDryBulb <= Region.TDryBulb[1])
+        Lower, Upper = self.HumRatioLimits_[Index]
+        Inside &= (HumRatio >= Lower) & (HumRatio <= Upper)
+        if Region.RelHum != (-math.inf, math.inf):
+            Inside &= (VapPres >= Region.RelHum[0] * SatVapPres) & (VapPres <= Region.RelHum[1] * SatVapPres)
+        if Region.Polygon is not None:
+            Inside &= InPolygon_(Region.Polygon, TDryBulb, HumRatio)
+        return Inside
+
+    def GetMembership(self, TDryBulb, HumRatio):
+        """
+        Return whether the points are in each region.
+
+        Args:
+            TDryBulb : Array of dry-bulb temperature in °F [IP] or °C [SI]
+            HumRatio : Array of humidity ratio in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI]
+
+        Returns:
+            Boolean array with one more dimension than the points, first, for the regions
+
+        """
+        TDryBulb = AsArray_(TDryBulb)
+        HumRatio = AsArray_(HumRatio)
+        Shape = np.broadcast(TDryBulb, HumRatio).shape
+        VapPres = SatVapPres = None
+        if any(Region.RelHum != (-math.inf, math.inf) for Region in self.Regions):
+            VapPres = GetVapPresFromHumRatioArray(np.maximum(HumRatio, 0), self.Pressure)
+            # Points outside the range of validity are outside the regions through their limits
+            if isIP():
+                SatVapPres = GetSatVapPresArray(np.clip(TDryBulb, -148, 392))
+            else:
+                SatVapPres = GetSatVapPresArray(np.clip(TDryBulb, -100, 200))
+        Membership = np.empty((len(self.Regions),) + Shape, dtype=bool)
+        for Index in range(len(self.Regions)):
+            Membership[Index] = self.Contains_(Index, TDryBulb, HumRatio, VapPres, SatVapPres)
+        return Membership
+
+    def Classify(self, TDryBulb, HumRatio):
+        """
+        Return the index of the region of highest precedence containing each point, or -1 for points
+        in no region (including NaN points).
+
+        Args:
+            TDryBulb : Array of dry-bulb temperature in °F [IP] or °C [SI]
+            HumRatio : Array of humidity ratio in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI]
+
+        Returns:
+            Array of the indices of the regions, of integers
+
+        """
+        Membership = self.GetMembership(TDryBulb, HumRatio)
+        Index = np.argmax(Membership, axis=0) if len(self.Regions) else np.zeros(Membership.shape[1:], dtype=int)
+        return np.where(Membership.any(axis=0), Index, -1)
+
+    def GetTimeInRegions(self, TDryBulb, HumRatio, TimeStep: float = 1) -> dict:
+        """
+        Return the time spent in each region, each point being classified in the region of highest precedence
+        containing it.
+
+        Args:
+            TDryBulb : Array of dry-bulb temperature in °F [IP] or °C [SI]
+            HumRatio : Array of humidity ratio in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI]
+            TimeStep : Time represented by each point, scalar or array
+
+        Returns:
+            Dict of the time spent in each region keyed by name, and outside all the regions keyed by None
+
+        """
+        Index = self.Classify(TDryBulb, HumRatio)
+        Weights = np.broadcast_to(AsArray_(TimeStep), Index.shape)
+        Times = np.bincount(Index.ravel() + 1, weights=Weights.ravel(), minlength=len(self.Regions) + 1)
+        Result = {Region.Name: float(Times[Position + 1]) for Position, Region in enumerate(self.Regions)}
+        Result[None] = float(Times[0])
+        return Result
+
+def InPolygon_(Polygon: tuple, X, Y):
+    """
+    Helper function returning whether points are inside a polygon, by counting the crossings of its edges
+    by horizontal rays, for arrays.
+
+    """
+    Inside = np.zeros(np.broadcast(X, Y).shape, dtype=bool)
+    for (X1, Y1), (X2, Y2) in zip(Polygon, Polygon[1:] + Polygon[:1]):
+        if Y1 == Y2:
+            continue
+        Crossing = ((Y1 > Y) != (Y2 > Y)) & (X < X1 + (Y - Y1) * (X2 - X1) / (Y2 - Y1))
+        Inside ^= Crossing
+    return Inside
+
+
+#######################################################################################################
+# Nearest states of moist air
+#######################################################################################################
+
+STATE_INDEX_SCALES = {
+    UnitSystem.IP: (1.8, 0.001, 0.43),
+    UnitSystem.SI: (1., 0.001, 1000.)
+}
+"""dict: Default scales of dry-bulb temperature, humidity ratio and moist air enthalpy for the metric of
+         PsychrometricStateIndex, by unit system: 1 K, 1 g_H₂O kg_Air⁻¹ and 1 kJ kg_Air⁻¹.
+
+"""
+
+class PsychrometricStateIndex:
+    """
+    Index of states of moist air for k-nearest and radius queries in (TDryBulb, HumRatio, MoistAirEnthalpy)
+    space, as a hash of the states on a regular grid.
+
+    Args:
+        Scales : Optional scales of dry-bulb temperature in °F [IP] or °C [SI], humidity ratio in
+                 lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI] and moist air enthalpy in Btu lb⁻¹ [IP] or
+                 J kg⁻¹ [SI], STATE_INDEX_SCALES of the unit system in use by default
+        CellSize : Size of the cells of the grid, in scaled units
+
+    Notes:
+        The distance between states is the Euclidean distance of the properties divided by their scales, so by
+        default a difference of 1 K in dry-bulb temperature counts as much as a difference of 1 g kg⁻¹ in
+        humidity ratio or 1 kJ kg⁻¹ in enthalpy. The states are kept sorted by cell, and a query only looks at
+        the cells within its radius, so its cost depends on the number of states nearby rather than in the index.
+        The states inserted since the last sort are compared by brute force, and merged once they are numerous.
+        The cell size should be of the order of the typical query radius. Requires numpy.
+
+    Example
+        >>> Results = psychrolib.CalcPsychrometricsFromRelHumArray(TDryBulb, RelHum, 101325)
+        >>> Index = psychrolib.PsychrometricStateIndex()
+        >>> Index.Insert(TDryBulb, Results[0], Results[4])
+        >>> Ids, Distances = Index.QueryNearest(24, 0.009, K=10)
+
+    """
+    PENDING_MAX = 4096
+    """int: Number of states inserted since the last sort above which they are merged before a query."""
+
+    def __init__(self, Scales: Optional[tuple] = None, CellSize: float = 1.):
+        CheckNumpy_()
+        if PSYCHROLIB_UNITS is None:
+            raise ValueError('The system of units has not been defined.')
+        if Scales is None:
+            Scales = STATE_INDEX_SCALES[PSYCHROLIB_UNITS]
+        self.Scales = tuple(float(Scale) for Scale in Scales)
+        if len(self.Scales) != 3 or not all(Scale > 0 for Scale in self.Scales):
+            raise ValueError("The scales must be three positive numbers")
+        if not CellSize > 0:
+            raise ValueError("The cell size must be positive")
+        self.CellSize = float(CellSize)
+        self.Units_ = PSYCHROLIB_UNITS
+
+        # Scaled states, identifiers and keys of the cells of the sorted states
+        self.Points_ = np.empty((0, 3))
+        self.Ids_ = np.empty(0, dtype=np.int64)
+        self.Keys_ = np.empty(0, dtype=np.int64)
+        self.Pending_ = []
+        self.NextId_ = 0
+
+    def __len__(self) -> int:
+        return len(self.Ids_) + sum(len(Ids) for _, Ids in self.Pending_)
+
+    def Scale_(self, TDryBulb, HumRatio, MoistAirEnthalpy):
+        """
+        Helper method returning the states as an array of scaled points.
+
+        """
+        TDryBulb = np.asarray(TDryBulb, dtype=float)
+        HumRatio = np.asarray(HumRatio, dtype=float)
+        if MoistAirEnthalpy is None:
+            MoistAirEnthalpy = GetMoistAirEnthalpyArray(TDryBulb, HumRatio)
+        MoistAirEnthalpy = np.asarray(MoistAirEnthalpy, dtype=float)
+        TDryBulb, HumRatio, MoistAirEnthalpy = np.broadcast_arrays(TDryBulb, HumRatio, MoistAirEnthalpy)
+        return np.stack([TDryBulb.ravel(), HumRatio.ravel(), MoistAirEnthalpy.ravel()], axis=1) \
+            / np.array(self.Scales)
+
+    def Cells_(self, Points):
+        """
+        Helper method returning the integer coordinates of the cells of scaled points.
+
+        """
+        Cells = np.floor(Points / self.CellSize)
+        if np.any(np.abs(Cells) >= 2 ** 20):
+            raise ValueError("States are too far from the origin for the cell size of the index")
+        return Cells.astype(np.int64)
+
+    @staticmethod
+    def KeysFromCells_(Cells):
+        """
+        Helper method returning the keys of cells, packing their coordinates in 21 bits each.
+
+        """
+        Cells = Cells + 2 ** 20
+        return (Cells[..., 0] << 42) | (Cells[..., 1] << 21) | Cells[..., 2]
+
+    def Insert(self, TDryBulb, HumRatio, MoistAirEnthalpy=None, Ids=None) -> None:
+        """
+        Insert states of moist air in the index.
+
+        Args:
+            TDryBulb : Array of dry-bulb temperature in °F [IP] or °C [SI]
+            HumRatio : Array of humidity ratio in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI]
+            MoistAirEnthalpy : Optional array of moist air enthalpy in Btu lb⁻¹ [IP] or J kg⁻¹ [SI],
+                               calculated from the other properties by default
+            Ids : Optional array of integer identifiers of the states, consecutive integers following
+                  those of the previous insertions by default
+
+        Raises:
+            ValueError: If some states are not finite
+
+        """
+        Points = self.Scale_(TDryBulb, HumRatio, MoistAirEnthalpy)
+        if PSYCHROLIB_VALIDATE and not np.all(np.isfinite(Points)):
+            raise ValueError("States of the index must be finite")
+        if Ids is None:
+            Ids = np.arange(self.NextId_, self.NextId_ + len(Points), dtype=np.int64)
+        else:
+            Ids = np.broadcast_to(np.asarray(Ids, dtype=np.int64), (len(Points),)).copy()
+        if len(Ids):
+            self.NextId_ = max(self.NextId_, int(Ids.max()) + 1)
+        self.Cells_(Points)
+        self.Pending_.append((Points, Ids))
+        if sum(len(PendingIds) for _, PendingIds in self.Pending_) > max(self.PENDING_MAX, len(self.Ids_) // 8):
+            self.Merge_()
+
+    def Merge_(self) -> None:
+        """
+        Helper method merging the states inserted since the last sort into the sorted states.
+
+        """
+        if not self.Pending_:
+            return
+        Points = np.concatenate([self.Points_] + [PendingPoints for PendingPoints, _ in self.Pending_])
+        Ids = np.concatenate([self.Ids_] + [PendingIds for _, PendingIds in self.Pending_])
+        Keys = self.KeysFromCells_(self.Cells_(Points))
+        # The sorted states form a single run, which the stable sort merges in linear time
+        Order = np.argsort(Keys, kind='stable')
+        self.Points_, self.Ids_, self.Keys_ = Points[Order], Ids[Order], Keys[Order]
+        self.Pending_ = []
+
+    def Candidates_(self, Point, Radius: float):
+        """
+        Helper method returning the scaled points and identifiers of the states in the cells within a radius
+        of a scaled point.
+
+        """
+        Lower = np.floor((Point - Radius) / self.CellSize).astype(np.int64)
+        Upper = np.floor((Point + Radius) / self.CellSize).astype(np.int64)
+        Counts = Upper - Lower + 1
+        if int(Counts[0]) * int(Counts[1]) * int(Counts[2]) > len(self.Ids_):
+            Points, Ids = self.Points_, self.Ids_
+        else:
+            Cells = np.stack(np.meshgrid(*[np.arange(Lower[Axis], Upper[Axis] + 1) for Axis in range(3)],
+                                         indexing='ij'), axis=-1).reshape(-1, 3)
+            Cells = Cells[np.all(np.abs(Cells) < 2 ** 20, axis=1)]
+            Keys = self.KeysFromCells_(Cells)
+            Starts = np.searchsorted(self.Keys_, Keys, side='left')
+            Ends = np.searchsorted(self.Keys_, Keys, side='right')
+            Lengths = Ends - Starts
+            Starts, Lengths = Starts[Lengths > 0], Lengths[Lengths > 0]
+            # Indices of the states of all the ranges, without a loop over the cells
+            Offsets = np.cumsum(Lengths) - Lengths
+            Indices = np.arange(int(Lengths.sum())) + np.repeat(Starts - Offsets, Lengths)
+            Points, Ids = self.Points_[Indices], self.Ids_[Indices]
+        if self.Pending_:
+            Points = np.concatenate([Points] + [PendingPoints for PendingPoints, _ in self.Pending_])
+            Ids = np.concatenate([Ids] + [PendingIds for _, PendingIds in self.Pending_])
+        return Points, Ids
+
+    def QueryPoint_(self, TDryBulb, HumRatio, MoistAirEnthalpy):
+        """
+        Helper method returning a query state as a scaled point, merging the pending states if they are numerous.
+
+        """
+        if sum(len(Ids) for _, Ids in self.Pending_) > self.PENDING_MAX:
+            self.Merge_()
+        Point = self.Scale_(TDryBulb, HumRatio, MoistAirEnthalpy)
+        if len(Point) != 1:
+            raise ValueError("A query is for a single state")
+        if not np.all(np.isfinite(Point)):
+            raise ValueError("The query state must be finite")
+        return Point[0]
+
+    def QueryRadius(self, TDryBulb: float, HumRatio: float, Radius: float, MoistAirEnthalpy=None) -> tuple:
+        """
+        Return the states within a distance of a state of moist air.
+
+        Args:
+            TDryBulb : Dry-bulb temperature in °F [IP] or °C [SI]
+            HumRatio : Humidity ratio in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI]
+            Radius : Distance in scaled units
+            MoistAirEnthalpy : Optional moist air enthalpy in Btu lb⁻¹ [IP] or J kg⁻¹ [SI], calculated
+                               from the other properties by default
+
+        Returns:
+            Array of identifiers of the states and array of their distances, by increasing distance
+
+        """
+        if not Radius >= 0:
+            raise ValueError("The radius must be positive or zero")
+        Point = self.QueryPoint_(TDryBulb, HumRatio, MoistAirEnthalpy)
+        Points, Ids = self.Candidates_(Point, Radius)
+        Distances = np.sqrt(np.sum((Points - Point) ** 2, axis=1))
+        Inside = Distances <= Radius
+        Ids, Distances = Ids[Inside], Distances[Inside]
+        Order = np.argsort(Distances, kind='stable')
+        return Ids[Order], Distances[Order]
+
+    def QueryNearest(self, TDryBulb: float, HumRatio: float, K: int = 1, MoistAirEnthalpy=None) -> tuple:
+        """
+        Return the K nearest states of a state of moist air.
+
+        Args:
+            TDryBulb : Dry-bulb temperature in °F [IP] or °C [SI]
+            HumRatio : Humidity ratio in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI]
+            K : Number of states
+            MoistAirEnthalpy : Optional moist air enthalpy in Btu lb⁻¹ [IP] or J kg⁻¹ [SI], calculated
+                               from the other properties by default
+
+        Returns:
+            Array of identifiers of the states and array of their distances in scaled units, by increasing
+            distance, of fewer than K states if the index is smaller
+
+        Notes:
+            The radius of the search is doubled from the cell size until it contains K states, then the
+            states within the distance of the K-th state are searched, so that the result is exact.
+
+        """
+        if K < 1:
+            raise ValueError("The number of nearest states must be at least 1")
+        Point = self.QueryPoint_(TDryBulb, HumRatio, MoistAirEnthalpy)
+        Size = len(self)
+        K = min(K, Size)
+        if K == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        Radius = self.CellSize
+        while True:
+            Points, Ids = self.Candidates_(Point, Radius)
+            Distances = np.sqrt(np.sum((Points - Point) ** 2, axis=1))
+            Inside = Distances <= Radius
+            if np.count_nonzero(Inside) >= K or len(Ids) == Size:
+                break
+            Radius *= 2
+        Nearest = np.argpartition(Distances, K - 1)[:K]
+        if Distances[Nearest].max() > Radius:
+            # States outside the radius may be nearer than the K-th state
+            Points, Ids = self.Candidates_(Point, float(Distances[Nearest].max()))
+            Distances = np.sqrt(np.sum((Points - Point) ** 2, axis=1))
+            Nearest = np.argpartition(Distances, K - 1)[:K]
+        Nearest = Nearest[np.argsort(Distances[Nearest], kind='stable')]
+        return Ids[Nearest], Distances[Nearest]
+
+    def Save(self, Path) -> None:
+        """
+        Save the index to a numpy .npz file.
+
+        Args:
+            Path : Path of the file
+
+        """
+        self.Merge_()
+        np.savez(Path, Points=self.Points_, Ids=self.Ids_, Scales=np.array(self.Scales),
+                 CellSize=self.CellSize, Units=self.Units_.name, NextId=self.NextId_)
+
+    @classmethod
+    def Load(cls, Path) -> 'PsychrometricStateIndex':
+        """
+        Load an index saved by Save.
+
+        Args:
+            Path : Path of the file
+
+        Returns:
+            Index of states of moist air
+
+        Raises:
+            ValueError: If the unit system is not set, or the index was saved in another unit system
+                        than the one in use
+
+        """
+        CheckNumpy_()
+        if PSYCHROLIB_UNITS is None:
+            raise ValueError('The system of units has not been defined.')
+        with np.load(Path) as Data:
+            if str(Data['Units']) != PSYCHROLIB_UNITS.name:
+                raise ValueError("The index was saved in the {} unit system, not in the {} unit system in use".format(
+                    str(Data['Units']), PSYCHROLIB_UNITS.name))
+            Index = cls(Scales=tuple(Data['Scales']), CellSize=float(Data['CellSize']))
+            Index.Points_, Index.Ids_ = Data['Points'], Data['Ids']
+            Index.Keys_ = Index.KeysFromCells_(Index.Cells_(Index.Points_))
+            Index.NextId_ = int(Data['NextId'])
+        return Index
+
+
+#######################################################################################################
+# Design conditions
+#######################################################################################################
+
+DESIGN_CONDITIONS_BINS = {
+    UnitSystem.IP: {'TDryBulb': (-148., 392., 0.18), 'TWetBulb': (-148., 392., 0.18),
+                    'TDewPoint': (-148., 392., 0.18), 'MoistAirEnthalpy': (-65., 280., 0.05)},
+    UnitSystem.SI: {'TDryBulb': (-100., 200., 0.1), 'TWetBulb': (-100., 200., 0.1),
+                    'TDewPoint': (-100., 200., 0.1), 'MoistAirEnthalpy': (-150000., 650000., 100.)}
+}
+"""dict: Default (lower, upper, width) of the bins of the histograms of DesignConditionsAccumulator, by unit system.
+
+"""
+
+DESIGN_CONDITIONS_COINCIDENT = {
+    'TDryBulb': ('TWetBulb',),
+    'TWetBulb': ('TDryBulb',),
+    'TDewPoint': ('HumRatio', 'TDryBulb'),
+    'MoistAirEnthalpy': ('TDryBulb',)
+}
+"""dict: Properties whose mean coincident values are accumulated for each property with a histogram.
+
+"""
+
+class DesignConditionsAccumulator:
+    """
+    Single-pass accumulator of the statistics of design conditions of a climate: heating and cooling dry-bulb
+    temperatures, evaporation wet-bulb temperatures, dehumidification dew-point temperatures and enthalpies,
+    with their mean coincident values, from batches of psychrometric values.
+
+    Args:
+        Bins : Optional dict of (lower, upper, width) of the bins by property, overriding those of
+               DESIGN_CONDITIONS_BINS for the unit system in use
+
+    Notes:
+        The sketch of the distribution of each property is a histogram of fixed bins, with the sums of the
+        coincident properties of DESIGN_CONDITIONS_COINCIDENT in each bin. Its memory does not depend on the
+        number of values, the quantiles are exact to within a bin width (interpolating linearly in the bin),
+        and the histograms of partial accumulators, e.g. of different years, stations or processes, add up
+        exactly with Merge. Values outside the bins are counted at the bounds. The mean coincident values are
+        the means over the bin containing the design value, as the ASHRAE design conditions are means over the
+        hours at the design temperature. The rows of a batch with a non-finite value are ignored, and counted
+        in Missing. Requires numpy.
+
+    Example
+        >>> Accumulator = psychrolib.DesignConditionsAccumulator()
+        >>> for TDryBulb, TDewPoint, Pressure in Batches:
+        >>>     HumRatio, TWetBulb, _, _, MoistAirEnthalpy, _, _ = \\
+        >>>         psychrolib.CalcPsychrometricsFromTDewPointArray(TDryBulb, TDewPoint, Pressure)
+        >>>     Accumulator.Update(TDryBulb, TWetBulb, TDewPoint, HumRatio, MoistAirEnthalpy)
+        >>> Accumulator.GetDesignConditions()['Cooling'][0.4]
+
+    """
+    def __init__(self, Bins: Optional[dict] = None):
+        CheckNumpy_()
+        self.Units_ = PSYCHROLIB_UNITS
+        self.Bins = dict(DESIGN_CONDITIONS_BINS[PSYCHROLIB_UNITS])
+        if Bins is not None:
+            Unknown = set(Bins) - set(DESIGN_CONDITIONS_COINCIDENT)
+            if Unknown:
+                raise ValueError("Bins must be among {}, not {}".format(', '.join(DESIGN_CONDITIONS_COINCIDENT),
+                                                                       ', '.join(sorted(Unknown))))
+            self.Bins.update(Bins)
+        self.Count = 0
+        self.Missing = 0
+
+        # Counts and sums of the coincident properties in each bin, with a bin below and above the bins
+        self.Counts_ = {}
+        self.Sums_ = {}
+        for Name, (Lower, Upper, Width) in self.Bins.items():
+            if not (Width > 0 and Upper > Lower):
+                raise ValueError("The bins of {} must have a positive width and range".format(Name))
+            Size = int(math.ceil((Upper - Lower) / Width - 1e-9)) + 2
+            self.Counts_[Name] = np.zeros(Size, dtype=np.int64)
+            self.Sums_[Name] = {Coincident: np.zeros(Size) for Coincident in DESIGN_CONDITIONS_COINCIDENT[Name]}
+
+    def Update(self, TDryBulb, TWetBulb, TDewPoint, HumRatio, MoistAirEnthalpy) -> None:
+        """
+        Accumulate a batch of psychrometric values.
+
+        Args:
+            TDryBulb : Array of dry-bulb temperature in °F [IP] or °C [SI]
+            TWetBulb : Array of wet-bulb temperature in °F [IP] or °C [SI]
+            TDewPoint : Array of dew-point temperature in °F [IP] or °C [SI]
+            HumRatio : Array of humidity ratio in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI]
+            MoistAirEnthalpy : Array of moist air enthalpy in Btu lb⁻¹ [IP] or J kg⁻¹ [SI]
+
+        """
+        Values = dict(zip(('TDryBulb', 'TWetBulb', 'TDewPoint', 'HumRatio', 'MoistAirEnthalpy'),
+                          (np.ravel(Value) for Value in np.broadcast_arrays(
+                              *(np.asarray(Value, dtype=float) for Value in
+                                (TDryBulb, TWetBulb, TDewPoint, HumRatio, MoistAirEnthalpy))))))
+        Finite = np.ones(len(Values['TDryBulb']), dtype=bool)
+        for Value in Values.values():
+            Finite &= np.isfinite(Value)
+        self.Missing += int(len(Finite) - np.count_nonzero(Finite))
+        if not Finite.all():
+            Values = {Name: Value[Finite] for Name, Value in Values.items()}
+        self.Count += int(np.count_nonzero(Finite))
+
+        for Name, (Lower, Upper, Width) in self.Bins.items():
+            Size = len(self.Counts_[Name])
+            Index = np.clip(np.floor((Values[Name] - Lower) / Width) + 1, 0, Size - 1).astype(np.intp)
+            self.Counts_[Name] += np.bincount(Index, minlength=Size)
+            for Coincident, Sums in self.Sums_[Name].items():
+                Sums += np.bincount(Index, weights=Values[Coincident], minlength=Size)
+
+    def Merge(self, Other: 'DesignConditionsAccumulator') -> 'DesignConditionsAccumulator':
+        """
+        Add the statistics of another accumulator, e.g. from another process, to this accumulator.
+
+        Args:
+            Other : Accumulator with the same unit system and bins
+
+        Returns:
+            This accumulator
+
+        Raises:
+            ValueError: If the accumulators have different unit systems or bins
+
+        """
+        if Other.Units_ != self.Units_ or Other.Bins != self.Bins:
+            raise ValueError("Only accumulators with the same unit system and bins can be merged")
+        self.Count += Other.Count
+        self.Missing += Other.Missing
+        for Name in self.Bins:
+            self.Counts_[Name] += Other.Counts_[Name]
+            for Coincident, Sums in self.Sums_[Name].items():
+                Sums += Other.Sums_[Name][Coincident]
+        return self
+
+    def Locate_(self, Name: str, Quantile: float) -> tuple:
+        """
+        Helper method returning the value of a quantile of a property and the index of its bin.
+
+        """
+        if self.Count == 0:
+            raise ValueError("No values were accumulated")
+        if not 0 <= Quantile <= 1:
+            raise ValueError("The quantile must be in range [0, 1]")
+        Lower, Upper, Width = self.Bins[Name]
+        Counts = self.Counts_[Name]
+        Cumulative = np.cumsum(Counts)
+        Target = Quantile * self.Count
+        Index = min(int(np.searchsorted(Cumulative, Target, side='left')), len(Counts) - 1)
+        # Skip the empty bins at the start for the quantile 0
+        while Counts[Index] == 0:
+            Index += 1
+        if Index == 0:
+            return Lower, Index
+        if Index == len(Counts) - 1:
+            return Upper, Index
+        Fraction = (Target - (Cumulative[Index] - Counts[Index])) / Counts[Index]
+        return min(Lower + (Index - 1 + Fraction) * Width, Upper), Index
+
+    def GetQuantile(self, Name: str, Quantile: float) -> float:
+        """
+        Return a quantile of the distribution of a property.
+
+        Args:
+            Name : Name of the property, TDryBulb, TWetBulb, TDewPoint or MoistAirEnthalpy
+            Quantile : Quantile in range [0, 1]
+
+        Returns:
+            Value of the quantile in the units of the property
+
+        """
+        return float(self.Locate_(Name, Quantile)[0])
+
+    def GetCoincident(self, Name: str, Quantile: float) -> dict:
+        """
+        Return a quantile of the distribution of a property with the means of its coincident properties.
+
+        Args:
+            Name : Name of the property, TDryBulb, TWetBulb, TDewPoint or MoistAirEnthalpy
+            Quantile : Quantile in range [0, 1]
+
+        Returns:
+            Dict of the value of the property and the mean values of its coincident properties, by name
+
+        """
+        Value, Index = self.Locate_(Name, Quantile)
+        Result = {Name: float(Value)}
+        for Coincident, Sums in self.Sums_[Name].items():
+            Result[Coincident] = float(Sums[Index] / self.Counts_[Name][Index])
+        return Result
+
+    def GetDesignConditions(self, CoolingPercents: tuple = (0.4, 1, 2), HeatingPercents: tuple = (99.6, 99)) -> dict:
+        """
+        Return the design conditions at annual percentages of exceedance.
+
+        Args:
+            CoolingPercents : Percentages of time the cooling, evaporation, dehumidification and enthalpy
+                              design values are exceeded
+            HeatingPercents : Percentages of time the heating design dry-bulb temperatures are exceeded
+
+        Returns:
+            Dict of dicts of the design conditions by percentage, for 'Heating' (TDryBulb), 'Cooling'
+            (TDryBulb with mean coincident TWetBulb), 'Evaporation' (TWetBulb with mean coincident TDryBulb),
+            'Dehumidification' (TDewPoint with mean coincident HumRatio and TDryBulb) and 'Enthalpy'
+            (MoistAirEnthalpy with mean coincident TDryBulb)
+
+        """
+        Result = {'Heating': {Percent: {'TDryBulb': self.GetQuantile('TDryBulb', 1 - Percent / 100)}
+                              for Percent in HeatingPercents}}
+        for Condition, Name in (('Cooling', 'TDryBulb'), ('Evaporation', 'TWetBulb'),
+                                ('Dehumidification', 'TDewPoint'), ('Enthalpy', 'MoistAirEnthalpy')):
+            Result[Condition] = {Percent: self.GetCoincident(Name, 1 - Percent / 100) for Percent in CoolingPercents}
+        return Result
+
+
+#######################################################################################################
+# Bin analysis and degree-hours
+#######################################################################################################
+
+BIN_ANALYSIS_DEFAULTS = {
+    UnitSystem.IP: {'BinEdges': tuple(range(-40, 125, 5)), 'CoolingBases': (65.,), 'HeatingBases': (65.,)},
+    UnitSystem.SI: {'BinEdges': tuple(range(-40, 55, 5)), 'CoolingBases': (18.3,), 'HeatingBases': (18.3,)}
+}
+"""dict: Default dry-bulb temperature bin edges and degree-hour base temperatures of BinAnalysisAccumulator,
+         in °F [IP] or °C [SI], by unit system.
+
+"""
+
+class BinAnalysisAccumulator:
+    """
+    Incremental accumulator of dry-bulb temperature bin tables, with mean coincident wet-bulb temperature,
+    humidity ratio and enthalpy, and of cooling and heating degree-hours and enthalpy-hours, from batches
+    of psychrometric values.
+
+    Args:
+        BinEdges : Optional increasing edges of the dry-bulb temperature bins in °F [IP] or °C [SI]
+        CoolingBases : Optional base temperatures of the cooling degree-hours in °F [IP] or °C [SI]
+        HeatingBases : Optional base temperatures of the heating degree-hours in °F [IP] or °C [SI]
+        EnthalpyBases : Base enthalpies of the enthalpy-hours in Btu lb⁻¹ [IP] or J kg⁻¹ [SI]
+
+    Notes:
+        The defaults are those of BIN_ANALYSIS_DEFAULTS for the unit system in use. The bins are closed
+        below, with a bin below the first edge and one above the last. Only the sums and times of the bins
+        and the degree-hours are kept, so the memory does not depend on the length of the time series,
+        and accumulators of different periods or stations add up with Merge. The times are in the units of
+        the time steps, hours by default. Points with non-finite values are ignored and their time counted
+        in Missing. Requires numpy.
+
+    Example
+        >>> Accumulator = psychrolib.BinAnalysisAccumulator(EnthalpyBases=(60000,))
+        >>> for TDryBulb, TDewPoint, Pressure in Batches:
+        >>>     HumRatio, TWetBulb, _, _, MoistAirEnthalpy, _, _ = \\
+        >>>         psychrolib.CalcPsychrometricsFromTDewPointArray(TDryBulb, TDewPoint, Pressure)
+        >>>     Accumulator.Update(TDryBulb, TWetBulb, HumRatio, MoistAirEnthalpy)
+        >>> Accumulator.GetBinTable()
+
+    """
+    def __init__(self, BinEdges: Optional[tuple] = None, CoolingBases: Optional[tuple] = None,
+                 HeatingBases: Optional[tuple] = None, EnthalpyBases: tuple = ()):
+        CheckNumpy_()
+        Defaults = BIN_ANALYSIS_DEFAULTS[PSYCHROLIB_UNITS]
+        self.Units_ = PSYCHROLIB_UNITS
+        self.BinEdges = np.array(Defaults['BinEdges'] if BinEdges is None else BinEdges, dtype=float)
+        if self.BinEdges.ndim != 1 or len(self.BinEdges) == 0 or np.any(np.diff(self.BinEdges) <= 0):
+            raise ValueError("The bin edges must be increasing")
+        self.CoolingBases = tuple(float(Base) for Base in (Defaults['CoolingBases'] if CoolingBases is None
+                                                           else CoolingBases))
+        self.HeatingBases = tuple(float(Base) for Base in (Defaults['HeatingBases'] if HeatingBases is None
+                                                           else HeatingBases))
+        self.EnthalpyBases = tuple(float(Base) for Base in EnthalpyBases)
+        self.Missing = 0.
+
+        Size = len(self.BinEdges) + 1
+        self.Times_ = np.zeros(Size)
+        self.Sums_ = {Name: np.zeros(Size) for Name in ('TWetBulb', 'HumRatio', 'MoistAirEnthalpy')}
+        self.DegreeHours_ = {'Cooling': np.zeros(len(self.CoolingBases)),
+                             'Heating': np.zeros(len(self.HeatingBases)),
+                             'Enthalpy': np.zeros(len(self.EnthalpyBases))}
+
+    def Update(self, TDryBulb, TWetBulb, HumRatio, MoistAirEnthalpy=None, TimeStep=1) -> None:
+        """
+        Accumulate a batch of psychrometric values.
+
+        Args:
+            TDryBulb : Array of dry-bulb temperature in °F [IP] or °C [SI]
+            TWetBulb : Array of wet-bulb temperature in °F [IP] or °C [SI]
+            HumRatio : Array of humidity ratio in lb_H₂O lb_Air⁻¹ [IP] or kg_H₂O kg_Air⁻¹ [SI]
+            MoistAirEnthalpy : Optional array of moist air enthalpy in Btu lb⁻¹ [IP] or J kg⁻¹ [SI],
+                               calculated from the other properties by default
+            TimeStep : Time represented by each point, scalar or array
+
+        """
+        TDryBulb, TWetBulb, HumRatio, TimeStep = (np.ravel(Value) for Value in np.broadcast_arrays(
+            *(np.asarray(Value, dtype=float) for Value in (TDryBulb, TWetBulb, HumRatio, TimeStep))))
+        if MoistAirEnthalpy is None:
+            MoistAirEnthalpy = GetMoistAirEnthalpyArray(TDryBulb, HumRatio)
+        MoistAirEnthalpy = np.broadcast_to(np.asarray(MoistAirEnthalpy, dtype=float).ravel(), TDryBulb.shape)
+
+        Finite = np.isfinite(TDryBulb) & np.isfinite(TWetBulb) & np.isfinite(HumRatio) & np.isfinite(MoistAirEnthalpy)
+        if not Finite.all():
+            self.Missing += float(np.sum(TimeStep[~Finite]))
+            TDryBulb, TWetBulb, HumRatio, MoistAirEnthalpy, TimeStep = \
+                (Value[Finite] for Value in (TDryBulb, TWetBulb, HumRatio, MoistAirEnthalpy, TimeStep))
+
+        Size = len(self.Times_)
+        Index = np.searchsorted(self.BinEdges, TDryBulb, side='right')
+        self.Times_ += np.bincount(Index, weights=TimeStep, minlength=Size)
+        for Name, Value in (('TWetBulb', TWetBulb), ('HumRatio', HumRatio), ('MoistAirEnthalpy', MoistAirEnthalpy)):
+            self.Sums_[Name] += np.bincount(Index, weights=Value * TimeStep, minlength=Size)
+
+        for Position, Base in enumerate(self.CoolingBases):
+            self.DegreeHours_['Cooling'][Position] += np.dot(np.maximum(TDryBulb - Base, 0), TimeStep)
+        for Position, Base in enumerate(self.HeatingBases):
+            self.DegreeHours_['Heating'][Position] += np.dot(np.maximum(Base - TDryBulb, 0), TimeStep)
+        for Position, Base in enumerate(self.EnthalpyBases):
+            self.DegreeHours_['Enthalpy'][Position] += np.dot(np.maximum(MoistAirEnthalpy - Base, 0), TimeStep)
+
+    def Merge(self, Other: 'BinAnalysisAccumulator') -> 'BinAnalysisAccumulator':
+        """
+        Add the sums of another accumulator, e.g. of another period or station, to this accumulator.
+
+        Args:
+            Other : Accumulator with the same unit system, bins and bases
+
+        Returns:
+            This accumulator
+
+        Raises:
+            ValueError: If the accumulators have different unit systems, bins or bases
+
+        """
+        if Other.Units_ != self.Units_ or not np.array_equal(Other.BinEdges, self.BinEdges) \
+                or (Other.CoolingBases, Other.HeatingBases, Other.EnthalpyBases) \
+                != (self.CoolingBases, self.HeatingBases, self.EnthalpyBases):
+            raise ValueError("Only accumulators with the same unit system, bins and bases can be merged")
+        self.Missing += Other.Missing
+        self.Times_ += Other.Times_
+        for Name, Sums in self.Sums_.items():
+            Sums += Other.Sums_[Name]
+        for Name, DegreeHours in self.DegreeHours_.items():
+            DegreeHours += Other.DegreeHours_[Name]
+        return self
+
+    def GetBinTable(self) -> dict:
+        """
+        Return the bin table of dry-bulb temperature.
+
+        Returns:
+            Dict of arrays of the lower and upper limits of the bins in °F [IP] or °C [SI], with infinite limits
+            for the first and last bins, of the time in each bin, and of the mean coincident TWetBulb, HumRatio
+            and MoistAirEnthalpy, NaN for empty bins
+
+        """
+        Result = {'Lower': np.concatenate([[-np.inf], self.BinEdges]),
+                  'Upper': np.concatenate([self.BinEdges, [np.inf]]),
+                  'Time': self.Times_.copy()}
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for Name, Sums in self.Sums_.items():
+                Result[Name] = np.where(self.Times_ > 0, Sums / self.Times_, np.nan)
+        return Result
+
+    def GetDegreeHours(self) -> dict:
+        """
+        Return the cooling and heating degree-hours and the enthalpy-hours.
+
+        Returns:
+            Dict of dicts of the cooling and heating degree-hours in °F h [IP] or K h [SI] and of the
+            enthalpy-hours in Btu lb⁻¹ h [IP] or J kg⁻¹ h [SI], by base, for 'Cooling', 'Heating' and 'Enthalpy'
+
+        """
+        return {Name: {Base: float(Value) for Base, Value in zip(Bases, self.DegreeHours_[Name])}
+                for Name, Bases in (('Cooling', self.CoolingBases), ('Heating', self.HeatingBases),
+                                    ('Enthalpy', self.EnthalpyBases))}
+
+
+#######################################################################################################
+# Resampling of time series
+#######################################################################################################
+
+def ResamplePsychrometrics(TDryBulb, Pressure, Window: Optional[int] = None, Rolling: bool = False, Groups=None,
+                           HumRatio=None, RelHum=None, TDewPoint=None, TWetBulb=None) -> dict:
+    """
+    Return the psychrometric values of moist air averaged over windows of a time series, averaging the
+    humidity ratio and the moist air enthalpy and calculating the other properties from the means.
+
+    Args:
+        TDryBulb : Array of dry-bulb temperature in °F [IP] or °C [SI]
+        Pressure : Atmospheric pressure in Psi [IP] or Pa [SI], scalar or array
+        Window : Number of consecutive points of the windows
+        Rolling : Whether the windows are rolling, one ending at each point from the Window-th, instead of
+                  consecutive, with a last partial window
+        Groups : Array of labels of the windows of the points, e.g. the hour of time stamps, instead of Window
+        HumRatio, RelHum, TDewPoint or TWetBulb : Array of exactly one of humidity ratio in lb_H₂O lb_Air⁻¹ [IP]
+                                                  or kg_H₂O kg_Air⁻¹ [SI], relative humidity in range [0, 1],
+                                                  dew-point or wet-bulb temperature in °F [IP] or °C [SI]
+
+    Returns:
+        Dict of arrays by window of the mean HumRatio, MoistAirEnthalpy and Pressure, of TDryBulb, RelHum,
+        TDewPoint and TWetBulb calculated from them, of the number of valid points in Count, and of whether
+        the mean air is supersaturated in Supersaturated, with the windows in order of the sorted labels for Groups
+
+    Notes:
+        Relative humidity and wet-bulb temperature are not conserved when air is mixed, so their means are not
+        the state of the mean air; the humidity ratio and the enthalpy are. The sums of the windows are
+        calculated at once, with cumulative sums for rolling windows, and the derived properties are calculated
+        once for all the windows with the array functions. Points with a non-finite value are ignored,
+        and the windows without valid points are NaN. Mixing air at different temperatures can give a mean
+        humidity ratio above that of saturated air at the mean temperature, i.e. fog, in which case RelHum
+        is clipped to 1, TDewPoint and TWetBulb are the dry-bulb temperature, and Supersaturated is true.
+        Requires numpy.
+
+    Example
+        >>> Hourly = psychrolib.ResamplePsychrometrics(TDryBulb, 101325, Groups=Seconds // 3600, RelHum=RelHum)
+
+    """
+    CheckNumpy_()
+    Moisture = {Name: Value for Name, Value in (('HumRatio', HumRatio), ('RelHum', RelHum),
+                                                ('TDewPoint', TDewPoint), ('TWetBulb', TWetBulb))
+                if Value is not None}
+    if len(Moisture) != 1:
+        raise ValueError("Exactly one of HumRatio, RelHum, TDewPoint and TWetBulb must be given")
+    if (Window is None) == (Groups is None) or (Rolling and Groups is not None):
+        raise ValueError("Either Window or Groups must be given, and rolling windows require Window")
+    if Window is not None and Window < 1:
+        raise ValueError("The window must have at least one point")
+
+    (Name, Value), = Moisture.items()
+    TDryBulb, Value, Pressure = (np.ravel(Array) for Array in np.broadcast_arrays(
+        np.asarray(TDryBulb, dtype=float), np.asarray(Value, dtype=float), np.asarray(Pressure, dtype=float)))
+    # The invalid points are replaced by a valid state, and excluded from the sums
+    Valid = np.isfinite(TDryBulb) & np.isfinite(Value) & np.isfinite(Pressure)
+    TDryBulbValid, PressureValid = (68., 14.696) if isIP() else (20., 101325.)
+    Points = {'TDryBulb': np.where(Valid, TDryBulb, TDryBulbValid), 'Pressure': np.where(Valid, Pressure, PressureValid)}
+    Value = np.where(Valid, Value, 0.5 if Name == 'RelHum' else 0.)
+    if Name == 'HumRatio':
+        Points['HumRatio'] = Value
+    elif Name == 'RelHum':
+        Points['HumRatio'] = GetHumRatioFromRelHumArray(Points['TDryBulb'], Value, Points['Pressure'])
+    elif Name == 'TDewPoint':
+        Points['HumRatio'] = GetHumRatioFromTDewPointArray(Value, Points['Pressure'])
+    else:
+        Points['HumRatio'] = GetHumRatioFromTWetBulbArray(Points['TDryBulb'], Value, Points['Pressure'])
+    Points['MoistAirEnthalpy'] = GetMoistAirEnthalpyArray(Points['TDryBulb'], Points['HumRatio'])
+
+    Sums = {}
+    if Groups is not None:
+        _, Index = np.unique(np.ravel(Groups), return_inverse=True)
+        Index = Index.ravel()
+        if len(Index) != len(Valid):
+            raise ValueError("There must be one label of the windows by point")
+        Count = np.bincount(Index, weights=Valid)
+        for Property in ('HumRatio', 'MoistAirEnthalpy', 'Pressure'):
+            Sums[Property] = np.bincount(Index, weights=np.where(Valid, Points[Property], 0.), minlength=len(Count))
+    elif Rolling:
+        def Rolled(Array):
+            Cumulative = np.concatenate([[0.], np.cumsum(Array)])
+            return Cumulative[Window:] - Cumulative[:-Window]
+        Count = np.rint(Rolled(Valid.astype(float)))
+        for Property in ('HumRatio', 'MoistAirEnthalpy', 'Pressure'):
+            Sums[Property] = Rolled(np.where(Valid, Points[Property], 0.))
+    else:
+        Starts = np.arange(0, len(Valid), Window)
+        Count = np.add.reduceat(Valid.astype(float), Starts) if len(Starts) else np.empty(0)
+        for Property in ('HumRatio', 'MoistAirEnthalpy', 'Pressure'):
+            Sums[Property] = np.add.reduceat(np.where(Valid, Points[Property], 0.), Starts) \
+                if len(Starts) else np.empty(0)
+
+    Result = {}
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for Property, Sum in Sums.items():
+            Result[Property] = Sum / Count
+    Empty = Count == 0
+    Filled = {Property: np.where(Empty, Points[Property][0] if len(Valid) else 0., Mean)
+              for Property, Mean in Result.items()}
+    Result['TDryBulb'] = GetTDryBulbFromEnthalpyAndHumRatioArray(Filled['MoistAirEnthalpy'], Filled['HumRatio'])
+    Result['RelHum'] = GetRelHumFromHumRatioArray(Result['TDryBulb'], Filled['HumRatio'], Filled['Pressure'])
+    Result['TDewPoint'] = GetTDewPointFromHumRatioArray(Result['TDryBulb'], Filled['HumRatio'], Filled['Pressure'])
+    Result['TWetBulb'] = GetTWetBulbFromHumRatioArray(Result['TDryBulb'], Filled['HumRatio'], Filled['Pressure'])
+    Result['Supersaturated'] = ~Empty & (Result['RelHum'] > 1)
+    np.minimum(Result['RelHum'], 1, out=Result['RelHum'])
+    for Property in ('TDryBulb', 'RelHum', 'TDewPoint', 'TWetBulb'):
+        Result[Property] = np.where(Empty, np.nan, Result[Property])
+    Result['Count'] = Count.astype(np.int64)
+    return Result
+
+
+#######################################################################################################
+# Derivatives
+#######################################################################################################
+
+# The derivatives are propagated forward with the chain rule, as pairs of the value of a property and the array
+# of its derivatives with respect to each of the inputs, in the first dimension. The values are calculated with
+# the array functions, and the derivatives of the values found by solvers with the implicit function theorem.
+
+def Seed_(Args: tuple) -> list:
+    """
+    Helper function returning the inputs of a calculation of derivatives with the identity as derivatives.
+
+    """
+    Values = np.broadcast_arrays(*(np.asarray(Arg, dtype=float) for Arg in Args))
+    Shape = Values[0].shape if Values else ()
+    Duals = []
+    for Index, Value in enumerate(Values):
+        Gradient = np.zeros((len(Values),) + Shape)
+        Gradient[Index] = 1
+        Duals.append((np.array(Value), Gradient))
+    return Duals
+
+def Chain_(Value, *Terms) -> tuple:
+    """
+    Helper function returning a value with its derivatives, given the partial derivatives of the value
+    with respect to other values with derivatives.
+
+    """
+    Gradient = 0
+    for Partial, (_, DualGradient) in Terms:
+        Gradient = Gradient + Partial * DualGradient
+    return Value, Gradient
+
+def SatVapPresDual_(TDryBulb: tuple) -> tuple:
+    """
+    Helper function returning saturation vapor pressure with its derivatives.
+
+    """
+    Value = GetSatVapPresArray(TDryBulb[0])
+    return Chain_(Value, (Value * dLnPwsArray_(TDryBulb[0]), TDryBulb))
+
+def HumRatioFromVapPresDual_(VapPres: tuple, Pressure: tuple) -> tuple:
+    """
+    Helper function returning humidity ratio given vapor pressure and pressure, with its derivatives.
+
+    """
+    Value = GetHumRatioFromVapPresArray(VapPres[0], Pressure[0])
+    # Zero where the humidity ratio is bounded
+    Factor = np.where(Value > MIN_HUM_RATIO, 0.621945 / (Pressure[0] - VapPres[0]) ** 2, 0.)
+    return Chain_(Value, (Factor * Pressure[0], VapPres), (-Factor * VapPres[0], Pressure))
+
+def VapPresFromHumRatioDual_(HumRatio: tuple, Pressure: tuple) -> tuple:
+    """
+    Helper function returning vapor pressure given humidity ratio and pressure, with its derivatives.
+
+    """
+    Value = GetVapPresFromHumRatioArray(HumRatio[0], Pressure[0])
+    BoundedHumRatio = np.maximum(HumRatio[0], MIN_HUM_RATIO)
+    Partial = np.where(HumRatio[0] > MIN_HUM_RATIO, Pressure[0] * 0.621945 / (0.621945 + BoundedHumRatio) ** 2, 0.)
+    return Chain_(Value, (Partial, HumRatio), (BoundedHumRatio / (0.621945 + BoundedHumRatio), Pressure))
+
+def VapPresFromRelHumDual_(TDryBulb: tuple, RelHum: tuple) -> tuple:
+    """
+    Helper function returning vapor pressure given dry-bulb temperature and relative humidity, with its derivatives.
+
+    """
+    Value = GetVapPresFromRelHumArray(TDryBulb[0], RelHum[0])
+    SatVapPres = SatVapPresDual_(TDryBulb)
+    return Chain_(Value, (SatVapPres[0], RelHum), (RelHum[0], SatVapPres))
+
+def RelHumFromVapPresDual_(TDryBulb: tuple, VapPres: tuple) -> tuple:
+    """
+    Helper function returning relative humidity given dry-bulb temperature and vapor pressure, with its derivatives.
+
+    """
+    Value = GetRelHumFromVapPresArray(TDryBulb[0], VapPres[0])
+    SatVapPres = SatVapPresDual_(TDryBulb)
+    return Chain_(Value, (1 / SatVapPres[0], VapPres), (-Value / SatVapPres[0], SatVapPres))
+
+def TDewPointFromVapPresDual_(TDryBulb: tuple, VapPres: tuple) -> tuple:
+    """
+    Helper function returning dew-point temperature given dry-bulb temperature and vapor pressure,
+    with its derivatives.
+
+    """
+    Value = GetTDewPointFromVapPresArray(TDryBulb[0], VapPres[0])
+    # The dew-point temperature is bounded by the dry-bulb temperature for supersaturated air
+    Bounds = (-148, 392) if isIP() else (-100, 200)
+    Bounded = VapPres[0] > GetSatVapPresArray(np.clip(TDryBulb[0], *Bounds))
+    with np.errstate(divide='ignore'):
+        Partial = 1 / (VapPres[0] * dLnPwsArray_(Value))
+    return Chain_(Value, (np.where(Bounded, 0., Partial), VapPres), (np.where(Bounded, 1., 0.), TDryBulb))
+
+def HumRatioFromTWetBulbDual_(TDryBulb: tuple, TWetBulb: tuple, Pressure: tuple, Bounded: bool = True) -> tuple:
+    """
+    Helper function returning humidity ratio given dry-bulb temperature, wet-bulb temperature and pressure,
+    with its derivatives, zero where the humidity ratio is bounded unless Bounded is False.
+
+    """
+    Value = GetHumRatioFromTWetBulbArray(TDryBulb[0], TWetBulb[0], Pressure[0])
+    Wsstar = HumRatioFromVapPresDual_(SatVapPresDual_(TWetBulb), Pressure)
+
+    # Coefficients of HumRatio = ((A - B * TWetBulb) * Wsstar - C * (TDryBulb - TWetBulb))
+    #                            / (A + D * TDryBulb - E * TWetBulb)
+    if isIP():
+        Liquid, Ice, FreezingPoint = (1093, 0.556, 0.240, 0.444, 1), (1220, 0.04, 0.240, 0.444, 0.48), \
+                                     FREEZING_POINT_WATER_IP
+    else:
+        Liquid, Ice, FreezingPoint = (2501., 2.326, 1.006, 1.86, 4.186), (2830., 0.24, 1.006, 1.86, 2.1), \
+                                     FREEZING_POINT_WATER_SI
+    AboveFreezing = TWetBulb[0] >= FreezingPoint
+    A, B, C, D, E = (np.where(AboveFreezing, LiquidCoefficient, IceCoefficient)
+                     for LiquidCoefficient, IceCoefficient in zip(Liquid, Ice))
+    Denominator = A + D * TDryBulb[0] - E * TWetBulb[0]
+    HumRatio = ((A - B * TWetBulb[0]) * Wsstar[0] - C * (TDryBulb[0] - TWetBulb[0])) / Denominator
+    Factor = 1 / Denominator if not Bounded else np.where(HumRatio > MIN_HUM_RATIO, 1 / Denominator, 0.)
+    return Chain_(Value, (Factor * (-C - HumRatio * D), TDryBulb),
+                  (Factor * (-B * Wsstar[0] + C + HumRatio * E), TWetBulb),
+                  (Factor * (A - B * TWetBulb[0]), Wsstar))
+
+def TWetBulbFromHumRatioDual_(TDryBulb: tuple, HumRatio: tuple, Pressure: tuple) -> tuple:
+    """
+    Helper function returning wet-bulb temperature given dry-bulb temperature, humidity ratio and pressure,
+    with its derivatives, by the implicit function theorem on GetHumRatioFromTWetBulb.
+
+    """
+    Value = GetTWetBulbFromHumRatioArray(TDryBulb[0], HumRatio[0], Pressure[0])
+    _, (dTDryBulb, dTWetBulb, dPressure) = HumRatioFromTWetBulbDual_(*Seed_((TDryBulb[0], Value, Pressure[0])),
+                                                                      Bounded=False)
+    return Chain_(Value, (-dTDryBulb / dTWetBulb, TDryBulb), (1 / dTWetBulb, HumRatio),
+                  (-dPressure / dTWetBulb, Pressure))
+
+def MoistAirEnthalpyDual_(TDryBulb: tuple, HumRatio: tuple) -> tuple:
+    """
+    Helper function returning moist air enthalpy with its derivatives.
+
+    """
+    Value = GetMoistAirEnthalpyArray(TDryBulb[0], HumRatio[0])
+    BoundedHumRatio = np.maximum(HumRatio[0], MIN_HUM_RATIO)
+    if isIP():
+        dTDryBulb, dHumRatio = 0.240 + 0.444 * BoundedHumRatio, 1061 + 0.444 * TDryBulb[0]
+    else:
+        dTDryBulb, dHumRatio = (1.006 + 1.86 * BoundedHumRatio) * 1000, (2501. + 1.86 * TDryBulb[0]) * 1000
+    return Chain_(Value, (dTDryBulb, TDryBulb), (np.where(HumRatio[0] > MIN_HUM_RATIO, dHumRatio, 0.), HumRatio))
+
+def MoistAirVolumeDual_(TDryBulb: tuple, HumRatio: tuple, Pressure: tuple) -> tuple:
+    """
+    Helper function returning moist air specific volume with its derivatives.
+
+    """
+    Value = GetMoistAirVolumeArray(TDryBulb[0], HumRatio[0], Pressure[0])
+    T = GetTRankineFromTFahrenheit(TDryBulb[0]) if isIP() else GetTKelvinFromTCelsius(TDryBulb[0])
+    BoundedHumRatio = np.maximum(HumRatio[0], MIN_HUM_RATIO)
+    dHumRatio = np.where(HumRatio[0] > MIN_HUM_RATIO, Value * 1.607858 / (1 + 1.607858 * BoundedHumRatio), 0.)
+    return Chain_(Value, (Value / T, TDryBulb), (dHumRatio, HumRatio), (-Value / Pressure[0], Pressure))
+
+def DegreeOfSaturationDual_(TDryBulb: tuple, HumRatio: tuple, Pressure: tuple) -> tuple:
+    """
+    Helper function returning degree of saturation with its derivatives.
+
+    """
+    Value = GetDegreeOfSaturationArray(TDryBulb[0], HumRatio[0], Pressure[0])
+    SatHumRatio = HumRatioFromVapPresDual_(SatVapPresDual_(TDryBulb), Pressure)
+    return Chain_(Value, (np.where(HumRatio[0] > MIN_HUM_RATIO, 1 / SatHumRatio[0], 0.), HumRatio),
+                  (-Value / SatHumRatio[0], SatHumRatio))
+
+def HumRatioFromRelHumDual_(TDryBulb: tuple, RelHum: tuple, Pressure: tuple) -> tuple:
+    """
+    Helper function returning humidity ratio given relative humidity, with its derivatives.
+
+    """
+    return HumRatioFromVapPresDual_(VapPresFromRelHumDual_(TDryBulb, RelHum), Pressure)
+
+def OutputsDual_(TDryBulb: tuple, HumRatio: tuple, Pressure: tuple, Names: tuple) -> tuple:
+    """
+    Helper function returning the outputs of the CalcPsychrometrics functions with their derivatives,
+    given dry-bulb temperature, humidity ratio and pressure with their derivatives.
+
+    """
+    VapPres = VapPresFromHumRatioDual_(HumRatio, Pressure)
+    Properties = {
+        'HumRatio': lambda: HumRatio,
+        'TWetBulb': lambda: TWetBulbFromHumRatioDual_(TDryBulb, HumRatio, Pressure),
+        'TDewPoint': lambda: TDewPointFromVapPresDual_(TDryBulb, VapPres),
+        'RelHum': lambda: RelHumFromVapPresDual_(TDryBulb, VapPres),
+        'VapPres': lambda: VapPres,
+        'MoistAirEnthalpy': lambda: MoistAirEnthalpyDual_(TDryBulb, HumRatio),
+        'MoistAirVolume': lambda: MoistAirVolumeDual_(TDryBulb, HumRatio, Pressure),
+        'DegreeOfSaturation': lambda: DegreeOfSaturationDual_(TDryBulb, HumRatio, Pressure)
+    }
+    return tuple(Properties[Name]() for Name in Names)
+
+JACOBIAN_FUNCTIONS_ = {
+    'GetSatVapPres': (('TDryBulb',), SatVapPresDual_),
+    'GetVapPresFromTDewPoint': (('TDewPoint',), SatVapPresDual_),
+    'GetSatHumRatio': (('TDryBulb', 'Pressure'),
+                       lambda TDryBulb, Pressure: HumRatioFromVapPresDual_(SatVapPresDual_(TDryBulb), Pressure)),
+    'GetHumRatioFromVapPres': (('VapPres', 'Pressure'), HumRatioFromVapPresDual_),
+    'GetVapPresFromHumRatio': (('HumRatio', 'Pressure'), VapPresFromHumRatioDual_),
+    'GetVapPresFromRelHum': (('TDryBulb', 'RelHum'), VapPresFromRelHumDual_),
+    'GetRelHumFromVapPres': (('TDryBulb', 'VapPres'), RelHumFromVapPresDual_),
+    'GetTDewPointFromVapPres': (('TDryBulb', 'VapPres'), TDewPointFromVapPresDual_),
+    'GetTDewPointFromRelHum': (('TDryBulb', 'RelHum'),
+                               lambda TDryBulb, RelHum: TDewPointFromVapPresDual_(
+                                   TDryBulb, VapPresFromRelHumDual_(TDryBulb, RelHum))),
+    'GetHumRatioFromRelHum': (('TDryBulb', 'RelHum', 'Pressure'), HumRatioFromRelHumDual_),
+    'GetRelHumFromHumRatio': (('TDryBulb', 'HumRatio', 'Pressure'),
+                              lambda TDryBulb, HumRatio, Pressure: RelHumFromVapPresDual_(
+                                  TDryBulb, VapPresFromHumRatioDual_(HumRatio, Pressure))),
+    'GetHumRatioFromTDewPoint': (('TDewPoint', 'Pressure'),
+                                 lambda TDewPoint, Pressure: HumRatioFromVapPresDual_(
+                                     SatVapPresDual_(TDewPoint), Pressure)),
+    'GetTDewPointFromHumRatio': (('TDryBulb', 'HumRatio', 'Pressure'),
+                                 lambda TDryBulb, HumRatio, Pressure: TDewPointFromVapPresDual_(
+                                     TDryBulb, VapPresFromHumRatioDual_(HumRatio, Pressure))),
+    'GetHumRatioFromTWetBulb': (('TDryBulb', 'TWetBulb', 'Pressure'), HumRatioFromTWetBulbDual_),
+    'GetTWetBulbFromHumRatio': (('TDryBulb', 'HumRatio', 'Pressure'), TWetBulbFromHumRatioDual_),
+    'GetTWetBulbFromRelHum': (('TDryBulb', 'RelHum', 'Pressure'),
+                              lambda TDryBulb, RelHum, Pressure: TWetBulbFromHumRatioDual_(
+                                  TDryBulb, HumRatioFromRelHumDual_(TDryBulb, RelHum, Pressure), Pressure)),
+    'GetTWetBulbFromTDewPoint': (('TDryBulb', 'TDewPoint', 'Pressure'),
+                                 lambda TDryBulb, TDewPoint, Pressure: TWetBulbFromHumRatioDual_(
+                                     TDryBulb, HumRatioFromVapPresDual_(SatVapPresDual_(TDewPoint), Pressure),
+                                     Pressure)),
+    'GetMoistAirEnthalpy': (('TDryBulb', 'HumRatio'), MoistAirEnthalpyDual_),
+    'GetMoistAirVolume': (('TDryBulb', 'HumRatio', 'Pressure'), MoistAirVolumeDual_),
+    'GetDegreeOfSaturation': (('TDryBulb', 'HumRatio', 'Pressure'), DegreeOfSaturationDual_),
+    'CalcPsychrometricsFromTWetBulb': (('TDryBulb', 'TWetBulb', 'Pressure'),
+                                       lambda TDryBulb, TWetBulb, Pressure: OutputsDual_(
+                                           TDryBulb, HumRatioFromTWetBulbDual_(TDryBulb, TWetBulb, Pressure), Pressure,
+                                           ('HumRatio', 'TDewPoint', 'RelHum', 'VapPres', 'MoistAirEnthalpy',
+                                            'MoistAirVolume', 'DegreeOfSaturation'))),
+    'CalcPsychrometricsFromTDewPoint': (('TDryBulb', 'TDewPoint', 'Pressure'),
+                                        lambda TDryBulb, TDewPoint, Pressure: OutputsDual_(
+                                            TDryBulb, HumRatioFromVapPresDual_(SatVapPresDual_(TDewPoint), Pressure),
+                                            Pressure, ('HumRatio', 'TWetBulb', 'RelHum', 'VapPres',
+                                                       'MoistAirEnthalpy', 'MoistAirVolume', 'DegreeOfSaturation'))),
+    'CalcPsychrometricsFromRelHum': (('TDryBulb', 'RelHum', 'Pressure'),
+                                     lambda TDryBulb, RelHum, Pressure: OutputsDual_(
+                                         TDryBulb, HumRatioFromRelHumDual_(TDryBulb, RelHum, Pressure), Pressure,
+                                         ('HumRatio', 'TWetBulb', 'TDewPoint', 'VapPres', 'MoistAirEnthalpy',
+                                          'MoistAirVolume', 'DegreeOfSaturation')))
+}
+
+def GetJacobian(Function, *Args) -> tuple:
+    """
+    Return the values of a psychrometric function with their analytic derivatives with respect to its
+    inputs, for arrays.
+
+    Args:
+        Function : Function of psychrolib, e.g. GetTWetBulbFromHumRatio or CalcPsychrometricsFromRelHum,
+                   its array version, or its name
+        Args : Arguments of the function, scalars or arrays
+
+    Returns:
+        Array of the values and dict of the arrays of their derivatives by name of the argument; for the
+        CalcPsychrometrics functions, tuples of them in the order of the outputs of the function
+
+    Raises:
+        ValueError: If the derivatives of the function are not available
+
+    Notes:
+        The functions with derivatives are the keys of JACOBIAN_FUNCTIONS_. The derivatives of the saturation
+        vapor pressure are those of its logarithm, as in GetTDewPointFromVapPres, and the derivatives of the
+        temperatures found by the solvers are given by the implicit function theorem, e.g. for the wet-bulb
+        temperature dTWetBulb/dHumRatio = 1 / (∂HumRatio/∂TWetBulb) of GetHumRatioFromTWetBulb, so that they are
+        exact at the solution rather than differences of values within the tolerance of the solver. The values
+        are those of the array functions. The derivatives are zero where a humidity ratio is bounded at its
+        minimum, and one-sided at the triple point and at saturation. Requires numpy.
+
+    Example
+        >>> TWetBulb, Derivatives = psychrolib.GetJacobian(psychrolib.GetTWetBulbFromHumRatio, 25, 0.01, 101325)
+        >>> Derivatives['HumRatio']
+
+    """
+    CheckNumpy_()
+    Name = Function if isinstance(Function, str) else Function.__name__
+    if Name.endswith('Array'):
+        Name = Name[:-len('Array')]
+    if Name not in JACOBIAN_FUNCTIONS_:
+        raise ValueError("Derivatives of {} are not available".format(Name))
+    Names, Dual = JACOBIAN_FUNCTIONS_[Name]
+    if len(Args) != len(Names):
+        raise ValueError("{} takes {} arguments".format(Name, len(Names)))
+
+    def Split(Result):
+        Value, Gradient = Result
+        Gradient = np.broadcast_to(Gradient, (len(Names),) + np.shape(Value))
+        return Value, {ArgName: Gradient[Index] for Index, ArgName in enumerate(Names)}
+
+    Result = Dual(*Seed_(Args))
+    if Name.startswith('CalcPsychrometrics'):
+        Values, Derivatives = zip(*(Split(Output) for Output in Result))
+        return Values, Derivatives
+    return Split(Result)
+
+
+#######################################################################################################
+# Uncertainty
+#######################################################################################################
+
+def NormalQuantile_(Probability: float) -> float:
+    """
+    Helper function returning the quantile of the standard normal distribution, by bisection of math.erf.
+
+    """
+    Lower, Upper = -40., 40.
+    for _ in range(100):
+        Middle = (Lower + Upper) / 2
+        if 0.5 * (1 + math.erf(Middle / math.sqrt(2))) < Probability:
+            Lower = Middle
+        else:
+            Upper = Middle
+    return (Lower + Upper) / 2
+
+def GetPsychrometricUncertainty(TDryBulb, RelHum, Pressure, Uncertainties: tuple, Correlation=None,
+                                Outputs: tuple = ('TDewPoint', 'TWetBulb', 'MoistAirEnthalpy'),
+                                Percentiles: tuple = (2.5, 50, 97.5), Method: str = 'montecarlo',
+                                Samples: int = 10000, ChunkSize: int = 1048576, Seed=None) -> dict:
+    """
+    Return the uncertainty of the values of CalcPsychrometricsFromRelHum given the uncertainties of
+    dry-bulb temperature, relative humidity and pressure, for arrays of readings.
+
+    Args:
+        TDryBulb : Array of measured dry-bulb temperature in °F [IP] or °C [SI]
+        RelHum : Array of measured relative humidity in range [0, 1]
+        Pressure : Array of measured atmospheric pressure in Psi [IP] or Pa [SI]
+        Uncertainties : Standard uncertainties of dry-bulb temperature, relative humidity and pressure in
+                        the units of the readings, scalars or arrays
+        Correlation : Optional 3 x 3 matrix of correlation of the errors of the inputs, uncorrelated by default
+        Outputs : Names of the values of CalcPsychrometricsFromRelHum
+        Percentiles : Percentiles of the distributions of the values, in range [0, 100]
+        Method : 'montecarlo' to sample the inputs, or 'linear' for the first-order propagation of the
+                 uncertainties with the derivatives of GetJacobian, assuming normal distributions of the values
+        Samples : Number of samples by reading for Method='montecarlo'
+        ChunkSize : Maximum number of samples calculated at once for Method='montecarlo'
+        Seed : Optional seed, or numpy RandomState or Generator, of the random samples
+
+    Returns:
+        Dict by output of dicts of the array of the percentiles, in the first dimension, in 'Percentiles',
+        and of the array of the standard uncertainty in 'StdDev'
+
+    Notes:
+        The errors of the inputs are normal, with the correlation given, and the relative humidity of the samples
+        is bounded to [0, 1]. The samples of as many readings as fit in ChunkSize are calculated at once with
+        CalcPsychrometricsFromRelHumArray, with NaN for the samples outside the range of validity, which are
+        ignored. The linear method is much faster but ignores the curvature of the saturation curve, which
+        matters for large uncertainties of humidity near saturation. Requires numpy.
+
+    Example
+        >>> Bands = psychrolib.GetPsychrometricUncertainty(TDryBulb, RelHum, 101325, (0.2, 0.02, 100))
+        >>> Bands['TDewPoint']['Percentiles']
+
+    """
+    CheckNumpy_()
+    Names = CALC_PSYCHROMETRICS_OUTPUTS['RelHum']
+    if any(Output not in Names for Output in Outputs):
+        raise ValueError("Outputs must be among {}".format(', '.join(Names)))
+    if Method not in ('montecarlo', 'linear'):
+        raise ValueError("Method must be 'montecarlo' or 'linear'")
+    if any(not 0 <= Percentile <= 100 for Percentile in Percentiles):
+        raise ValueError("Percentiles must be in range [0, 100]")
+    if len(Uncertainties) != 3:
+        raise ValueError("Uncertainties must be those of dry-bulb temperature, relative humidity and pressure")
+    if Samples < 2:
+        raise ValueError("The standard uncertainty requires at least 2 samples")
+    Correlation = np.eye(3) if Correlation is None else np.asarray(Correlation, dtype=float)
+    if Correlation.shape != (3, 3) or not np.allclose(Correlation, Correlation.T) \
+            or not np.allclose(np.diag(Correlation), 1):
+        raise ValueError("Correlation must be a symmetric 3 x 3 matrix with unit diagonal")
+    try:
+        Cholesky = np.linalg.cholesky(Correlation)
+    except np.linalg.LinAlgError:
+        raise ValueError("Correlation must be positive definite")
+
+    Inputs = np.broadcast_arrays(*(np.asarray(Value, dtype=float) for Value in
+                                   (TDryBulb, RelHum, Pressure) + tuple(Uncertainties)))
+    Shape = Inputs[0].shape
+    TDryBulb, RelHum, Pressure, *Uncertainties = (Value.ravel() for Value in Inputs)
+    Uncertainties = np.stack(Uncertainties)
+    Result = {}
+
+    if Method == 'linear':
+        Values, Derivatives = GetJacobian('CalcPsychrometricsFromRelHum', TDryBulb, RelHum, Pressure)
+        Covariance = Correlation[:, :, None] * Uncertainties[:, None, :] * Uncertainties[None, :, :]
+        Quantiles = np.array([NormalQuantile_(Percentile / 100) for Percentile in Percentiles])
+        for Output in Outputs:
+            Index = Names.index(Output)
+            Gradient = np.stack([Derivatives[Index][Name] for Name in ('TDryBulb', 'RelHum', 'Pressure')])
+            StdDev = np.sqrt(np.einsum('in,ijn,jn->n', Gradient, Covariance, Gradient))
+            Result[Output] = {'Percentiles': (Values[Index] + Quantiles[:, None] * StdDev).reshape((-1,) + Shape),
+                              'StdDev': StdDev.reshape(Shape)}
+        return Result
+
+    Generator = Seed if hasattr(Seed, 'standard_normal') else np.random.RandomState(Seed)
+    for Output in Outputs:
+        Result[Output] = {'Percentiles': np.empty((len(Percentiles), len(TDryBulb))),
+                          'StdDev': np.empty(len(TDryBulb))}
+    Readings = max(1, ChunkSize // Samples)
+    for Start in range(0, len(TDryBulb), Readings):
+        Stop = min(Start + Readings, len(TDryBulb))
+        # Correlated normal errors, of shape (3, Samples, Readings)
+        Errors = np.einsum('ij,jsn->isn', Cholesky, Generator.standard_normal((3, Samples, Stop - Start)))
+        Errors *= Uncertainties[:, None, Start:Stop]
+        SampleTDryBulb = TDryBulb[Start:Stop] + Errors[0]
+        SampleRelHum = np.clip(RelHum[Start:Stop] + Errors[1], 0, 1)
+        SamplePressure = Pressure[Start:Stop] + Errors[2]
+        Values = CalcPsychrometricsFromRelHumArray(SampleTDryBulb, SampleRelHum, SamplePressure, Errors='nan')
+        for Output in Outputs:
+            Value = Values[Names.index(Output)]
+            Result[Output]['Percentiles'][:, Start:Stop] = np.nanpercentile(Value, Percentiles, axis=0)
+            Result[Output]['StdDev'][Start:Stop] = np.nanstd(Value, axis=0, ddof=1)
+    for Output in Outputs:
+        Result[Output]['Percentiles'] = Result[Output]['Percentiles'].reshape((-1,) + Shape)
+        Result[Output]['StdDev'] = Result[Output]['StdDev'].reshape(Shape)
+    return Result
+
+
+#######################################################################################################
+# Parameter sweeps
+#######################################################################################################
+
+def SweepChunk_(Name: str, Settings: tuple, Shape: tuple, Sources: tuple, Start: int, Stop: int) -> tuple:
+    """
+    Helper function returning the values of an array function at a range of the points of a sweep, in the
+    order of the flattened grid, also in the processes of a pool, with the settings of the library given by
+    Settings, a tuple of the unit system, validation, data type of the array functions and tolerance.
+
+    """
+    global PSYCHROLIB_VALIDATE
+    global PSYCHROLIB_ARRAY_DTYPE
+    global PSYCHROLIB_TOLERANCE
+
+    Units, PSYCHROLIB_VALIDATE, PSYCHROLIB_ARRAY_DTYPE, Tolerance = Settings
+    if PSYCHROLIB_UNITS != Units:
+        SetUnitSystem(Units)
+    PSYCHROLIB_TOLERANCE = Tolerance
+    Index = np.unravel_index(np.arange(Start, Stop), Shape) if Shape else ()
+    Args = [Values[Index[Position]] if Position is not None else Values for Position, Values in Sources]
+    Result = ArrayFunction_(Name)(*Args)
+    return tuple(np.ravel(np.asarray(Value, dtype=float)) for Value in
+                 (Result if isinstance(Result, tuple) else (Result,)))
+
+class PsychrometricSweep:
+    """
+    Lazy evaluation of a psychrometric function on the cartesian product of axes of values.
+
+    Args:
+        Function : Function of psychrolib with an array version, e.g. CalcPsychrometricsFromRelHum, or its name
+        Axes : Dict of the arrays of values of the axes, by name, in the order of the dimensions of the results
+        Arguments : Arguments of the function, by name, each the name of an axis, a tuple (Function, name of an
+                    axis) of a function calculated once for each value of the axis, or a constant; arguments
+                    without value are the axes of the same name
+
+    Notes:
+        The function is only calculated on the product of the axes used by its arguments, in chunks of the
+        flattened grid with its array version, so that the grid is never materialized, and functions of a single
+        axis, e.g. GetStandardAtmPressure of the altitude, are calculated once per value of the axis. The results
+        are constant along the axes which the arguments do not use, e.g. an airflow axis, and are broadcast along
+        them. The chunks can be calculated in a pool of processes, which use the unit system in use. Requires numpy.
+
+    Example
+        >>> Sweep = psychrolib.PsychrometricSweep(psychrolib.CalcPsychrometricsFromRelHum,
+        >>>     {'Altitude': Altitude, 'TDryBulb': TDryBulb, 'RelHum': RelHum, 'Airflow': Airflow},
+        >>>     Pressure=(psychrolib.GetStandardAtmPressure, 'Altitude'))
+        >>> Cube = Sweep.Evaluate()
+        >>> Cube['TWetBulb'].shape
+        (len(Altitude), len(TDryBulb), len(RelHum), len(Airflow))
+
+    """
+    def __init__(self, Function, Axes: dict, **Arguments):
+        CheckNumpy_()
+        self.Name = Function if isinstance(Function, str) else Function.__name__
+        if self.Name.endswith('Array'):
+            self.Name = self.Name[:-len('Array')]
+        ArrayFunction_(self.Name)
+        Parameters = [Parameter.name for Parameter in inspect.signature(globals()[self.Name]).parameters.values()]
+        if self.Name.startswith('CalcPsychrometrics'):
+            self.Outputs = CALC_PSYCHROMETRICS_OUTPUTS[Parameters[1]]
+        else:
+            self.Outputs = (self.Name[len('Get'):].split('From')[0],)
+        self.Axes = {Name: np.asarray(Values, dtype=float).ravel() for Name, Values in Axes.items()}
+        self.Shape = tuple(len(Values) for Values in self.Axes.values())
+        Unknown = set(Arguments) - set(Parameters)
+        if Unknown:
+            raise ValueError("{} has no argument {}".format(self.Name, ', '.join(sorted(Unknown))))
+
+        # Values of the arguments by axis, with the derived axes calculated once
+        Arguments = {Parameter: Arguments.get(Parameter, Parameter) for Parameter in Parameters}
+        Sources = {}
+        for Parameter, Argument in Arguments.items():
+            if isinstance(Argument, str):
+                if Argument not in self.Axes:
+                    raise ValueError("No axis {} for the argument {} of {}".format(Argument, Parameter, self.Name))
+                Sources[Parameter] = (Argument, self.Axes[Argument])
+            elif isinstance(Argument, tuple) and len(Argument) == 2 and callable(Argument[0]):
+                AxisFunction, Axis = Argument
+                if Axis not in self.Axes:
+                    raise ValueError("No axis {} for the argument {} of {}".format(Axis, Parameter, self.Name))
+                Name = AxisFunction.__name__
+                if Name in globals() and not Name.endswith('Array') and Name + 'Array' in globals():
+                    AxisFunction = globals()[Name + 'Array']
+                Sources[Parameter] = (Axis, np.asarray(AxisFunction(self.Axes[Axis]), dtype=float))
+            else:
+                Sources[Parameter] = (None, Argument)
+        self.UsedAxes = tuple(Axis for Axis in self.Axes if any(Source[0] == Axis for Source in Sources.values()))
+        self.UsedShape_ = tuple(len(self.Axes[Axis]) for Axis in self.UsedAxes)
+        self.Sources_ = tuple((None if Axis is None else self.UsedAxes.index(Axis), Values)
+                              for Axis, Values in Sources.values())
+
+    @property
+    def Size(self) -> int:
+        """int: Number of points at which the function is calculated."""
+        return int(np.prod(self.UsedShape_, dtype=np.int64))
+
+    def Chunks(self, ChunkSize: int = 1048576, Processes: Optional[int] = None):
+        """
+        Generate the values of the function in chunks of the points of the axes used by the arguments.
+
+        Args:
+            ChunkSize : Maximum number of points of the chunks
+            Processes : Optional number of processes of a pool calculating the chunks, which use the
+                        unit system, validation, data type of the array functions and tolerance in use
+
+        Returns:
+            Generator of a tuple of the indices of the points along the used axes, UsedAxes, and of a dict of
+            the arrays of the values of the outputs by name, for each chunk
+
+        """
+        def Index(Start, Stop):
+            return np.unravel_index(np.arange(Start, Stop), self.UsedShape_) if self.UsedShape_ else ()
+
+        Ranges = [(Start, min(Start + ChunkSize, self.Size)) for Start in range(0, self.Size, ChunkSize)]
+        Settings = (PSYCHROLIB_UNITS, PSYCHROLIB_VALIDATE, PSYCHROLIB_ARRAY_DTYPE, PSYCHROLIB_TOLERANCE)
+        Arguments = (self.Name, Settings, self.UsedShape_, self.Sources_)
+        if Processes is None:
+            for Start, Stop in Ranges:
+                yield Index(Start, Stop), dict(zip(self.Outputs, SweepChunk_(*Arguments, Start, Stop)))
+        else:
+            with ProcessPoolExecutor(Processes) as Executor:
+                # At most two chunks per process are in flight, so that the results which are not consumed
+                # yet do not accumulate in memory
+                Pending = []
+                for Position, (Start, Stop) in enumerate(Ranges):
+                    Pending.append((Start, Stop, Executor.submit(SweepChunk_, *Arguments, Start, Stop)))
+                    while Pending and (len(Pending) >= 2 * Processes or Position + 1 == len(Ranges)):
+                        Start, Stop, Future = Pending.pop(0)
+                        yield Index(Start, Stop), dict(zip(self.Outputs, Future.result()))
+
+    def Broadcast_(self, Values, Axes: tuple):
+        """
+        Helper method broadcasting an array over some axes to these axes and the unused axes.
+
+        """
+        Shape = tuple(len(self.Axes[Axis]) if Axis in self.UsedAxes else 1 for Axis in Axes)
+        return np.broadcast_to(Values.reshape(Shape), tuple(len(self.Axes[Axis]) for Axis in Axes))
+
+    def Evaluate(self, ChunkSize: int = 1048576, Processes: Optional[int] = None) -> dict:
+        """
+        Return the values of the function on the cartesian product of the axes.
+
+        Args:
+            ChunkSize : Maximum number of points calculated at once
+            Processes : Optional number of processes of a pool calculating the chunks
+
+        Returns:
+            Dict of the axes in 'Axes' and of the N-dimensional arrays of the values of the outputs by name,
+            with a dimension by axis, read-only views along the unused axes
+
+        """
+        Cubes = {Output: np.empty(self.UsedShape_) for Output in self.Outputs}
+        Start = 0
+        for Index, Values in self.Chunks(ChunkSize, Processes):
+            Stop = Start + len(Index[0]) if Index else 1
+            for Output, Value in Values.items():
+                Cubes[Output].reshape(-1)[Start:Stop] = Value
+            Start = Stop
+        Result = {'Axes': dict(self.Axes)}
+        for Output, Cube in Cubes.items():
+            Result[Output] = self.Broadcast_(Cube, tuple(self.Axes))
+        return Result
+
+    def Reduce(self, Operation: str, Keep: tuple = (), ChunkSize: int = 1048576,
+               Processes: Optional[int] = None) -> dict:
+        """
+        Return a reduction of the values of the function over the axes, calculated chunk by chunk.
+
+        Args:
+            Operation : 'sum', 'mean', 'min' or 'max', ignoring NaN values
+            Keep : Names of the axes which are not reduced
+            ChunkSize : Maximum number of points calculated at once
+            Processes : Optional number of processes of a pool calculating the chunks
+
+        Returns:
+            Dict of the arrays of the reductions of the outputs by name, with a dimension by kept axis,
+            in the order of the axes
+
+        """
+        if Operation not in ('sum', 'mean', 'min', 'max'):
+            raise ValueError("Operation must be 'sum', 'mean', 'min' or 'max'")
+        if any(Axis not in self.Axes for Axis in Keep):
+            raise ValueError("Unknown axes in {}".format(Keep))
+        Keep = tuple(Axis for Axis in self.Axes if Axis in Keep)
+        KeptPositions = [self.UsedAxes.index(Axis) for Axis in Keep if Axis in self.UsedAxes]
+        KeptShape = tuple(self.UsedShape_[Position] for Position in KeptPositions)
+        Size = int(np.prod(KeptShape, dtype=np.int64))
+        Initial = {'sum': 0., 'mean': 0., 'min': np.inf, 'max': -np.inf}[Operation]
+        Totals = {Output: np.full(Size, Initial) for Output in self.Outputs}
+        Counts = {Output: np.zeros(Size) for Output in self.Outputs}
+
+        for Index, Values in self.Chunks(ChunkSize, Processes):
+            Kept = np.ravel_multi_index([Index[Position] for Position in KeptPositions], KeptShape) \
+                if KeptPositions else np.zeros(len(Index[0]) if Index else 1, dtype=np.intp)
+            for Output, Value in Values.items():
+                Finite = ~np.isnan(Value)
+                if Operation in ('sum', 'mean'):
+                    Totals[Output] += np.bincount(Kept, weights=np.where(Finite, Value, 0.), minlength=Size)
+                    Counts[Output] += np.bincount(Kept, weights=Finite, minlength=Size)
+                else:
+                    (np.fmin if Operation == 'min' else np.fmax).at(Totals[Output], Kept, Value)
+                    Counts[Output] += np.bincount(Kept, weights=Finite, minlength=Size)
+
+        # The reduced unused axes repeat the values
+        Repeats = int(np.prod([len(self.Axes[Axis]) for Axis in self.Axes
+                               if Axis not in self.UsedAxes and Axis not in Keep], dtype=np.int64))
+        Result = {}
+        for Output in self.Outputs:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                if Operation == 'sum':
+                    Value = Totals[Output] * Repeats
+                elif Operation == 'mean':
+                    Value = Totals[Output] / Counts[Output]
+                else:
+                    Value = np.where(Counts[Output] > 0, Totals[Output], np.nan)
+            Result[Output] = self.Broadcast_(Value, Keep)
+        return Result
@@ -6,6 +6,8 @@
 import numpy as np
 import pytest
 
+import psychrolib
+
 pytestmark = pytest.mark.usefixtures('SetUnitSystem_IP')
 
 # Test of helper functions
@@ -211,3 +213,46 @@ def test_AllPsychrometrics(psy):
     HumRatio, TWetBulb, TDewPoint, VapPres, MoistAirEnthalpy, MoistAirVolume, DegreeOfSaturation = \
         psy.CalcPsychrometricsFromRelHum(100, RelHum, 14.696)
     assert TWetBulb == pytest.approx(65, abs = 0.1)
+
+
+###############################################################################
+# Python only: array functions
+###############################################################################
+
+def test_ArrayFunctions():
+    TDryBulb = np.array([-4, 20, 32.01, 77, 140])
+    TWetBulb = np.array([-5, 18, 30, 60, 90])
+    Pressure = 14.175
+    HumRatio = psychrolib.GetHumRatioFromTWetBulbArray(TDryBulb, TWetBulb, Pressure)
+    TDewPoint = psychrolib.GetTDewPointFromHumRatioArray(TDryBulb, HumRatio, Pressure)
+    for i, T in enumerate(TDryBulb):
+        assert HumRatio[i] == pytest.approx(psychrolib.GetHumRatioFromTWetBulb(T, TWetBulb[i], Pressure), rel = 1e-12)
+        assert TDewPoint[i] == pytest.approx(psychrolib.GetTDewPointFromHumRatio(T, HumRatio[i], Pressure), abs = 0.001)
+    assert psychrolib.GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio, Pressure) == pytest.approx(TWetBulb, abs = 0.001)
+    assert psychrolib.GetMoistAirEnthalpyArray(86, [0.02]) == pytest.approx(psychrolib.GetMoistAirEnthalpy(86, 0.02))
+
+
+###############################################################################
+# Python only: calculations in float32
+###############################################################################
+
+def test_Float32():
+    TDryBulb, RelHum = np.meshgrid(np.linspace(-148, psychrolib.GetTDewPointFromVapPres(392, 14.696 / 2), 301),
+                                   np.linspace(0.02, 1, 50))
+    HumRatio = psychrolib.GetHumRatioFromRelHumArray(TDryBulb, RelHum, 14.696)
+    TWetBulb = psychrolib.GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio, 14.696)
+    SatVapPres = psychrolib.GetSatVapPresArray(TDryBulb)
+    Enthalpy = psychrolib.GetMoistAirEnthalpyArray(TDryBulb, HumRatio)
+
+    psychrolib.SetArrayDataType('float32')
+    try:
+        Errors = psychrolib.FLOAT32_MAX_ERRORS
+        assert psychrolib.GetSatVapPresArray(TDryBulb) == pytest.approx(SatVapPres, rel = Errors['GetSatVapPresArray'])
+        # Enthalpy error converted from J kg⁻¹ to Btu lb⁻¹
+        assert psychrolib.GetMoistAirEnthalpyArray(TDryBulb, HumRatio) \
+            == pytest.approx(Enthalpy, abs = Errors['GetMoistAirEnthalpyArray'] / 2326)
+        # Temperature errors converted from K to °F
+        assert psychrolib.GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio, 14.696) \
+            == pytest.approx(TWetBulb, abs = Errors['GetTWetBulbFromHumRatioArray'] * 1.8)
+    finally:
+        psychrolib.SetArrayDataType('float64')
@@ -3,9 +3,16 @@
 
 # Test of PsychroLib in SI units for Python, C, and Fortran.
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import numpy as np
 import pytest
 
+import psychrolib
+
 pytestmark = pytest.mark.usefixtures('SetUnitSystem_SI')
 
 # Test of helper functions
@@ -218,3 +225,1136 @@ def test_AllPsychrometrics(psy):
     HumRatio, TWetBulb, TDewPoint, VapPres, MoistAirEnthalpy, MoistAirVolume, DegreeOfSaturation = \
         psy.CalcPsychrometricsFromRelHum(40, RelHum, 101325)
     assert TWetBulb == pytest.approx(20, abs = 0.1)
+
+
+###############################################################################
+# Python only: solver instrumentation
+###############################################################################
+
+def test_SolverStats():
+    assert psychrolib.GetSolverStats() is None
+    Records = []
+    psychrolib.EnableSolverStats(Records.append)
+    try:
+        TWetBulb = psychrolib.GetTWetBulbFromRelHum(7, 0.61, 100000)
+        assert TWetBulb == pytest.approx(3.92667433781955, rel = 0.001)
+        Stats = psychrolib.GetSolverStats()
+        assert Stats['GetTWetBulbFromHumRatio']['Calls'] == 1
+        assert Stats['GetTDewPointFromVapPres']['Calls'] == 1
+        for Name in ('GetTDewPointFromVapPres', 'GetTWetBulbFromHumRatio'):
+            assert sum(Stats[Name]['IterationHistogram'].values()) == 1
+            assert Stats[Name]['Iterations'] == list(Stats[Name]['IterationHistogram'])[0]
+            assert Stats[Name]['ConvergenceFailures'] == 0
+            assert Stats[Name]['Time'] > 0
+        assert [Record['Function'] for Record in Records] == ['GetTDewPointFromVapPres', 'GetTWetBulbFromHumRatio']
+
+        # Clamped humidity ratio
+        psychrolib.ResetSolverStats()
+        psychrolib.GetTWetBulbFromHumRatio(-5, 1e-09, 95461)
+        assert psychrolib.GetSolverStats()['GetTWetBulbFromHumRatio']['BoundsClamps'] == 1
+    finally:
+        psychrolib.DisableSolverStats()
+    assert psychrolib.GetSolverStats() is None
+
+def test_SolverStats_ConvergenceFailure(monkeypatch):
+    monkeypatch.setattr(psychrolib, 'MAX_ITER_COUNT', 1)
+    psychrolib.EnableSolverStats()
+    try:
+        with pytest.raises(ValueError):
+            psychrolib.GetTDewPointFromVapPres(150, psychrolib.GetSatVapPres(-50))
+        assert psychrolib.GetSolverStats()['GetTDewPointFromVapPres']['ConvergenceFailures'] == 1
+
+        # The iterations are counted the same way whether the solver converged or not
+        monkeypatch.setattr(psychrolib, 'MAX_ITER_COUNT', 100)
+        psychrolib.ResetSolverStats()
+        psychrolib.GetTWetBulbFromHumRatio(25, 0.01, 101325)
+        Iterations = psychrolib.GetSolverStats()['GetTWetBulbFromHumRatio']['Iterations']
+        monkeypatch.setattr(psychrolib, 'MAX_ITER_COUNT', Iterations)
+        with pytest.raises(ValueError):
+            psychrolib.GetTWetBulbFromHumRatio(25, 0.01, 101325)
+        monkeypatch.setattr(psychrolib, 'MAX_ITER_COUNT', Iterations + 1)
+        psychrolib.GetTWetBulbFromHumRatio(25, 0.01, 101325)
+        Stats = psychrolib.GetSolverStats()['GetTWetBulbFromHumRatio']
+        assert Stats['IterationHistogram'] == {Iterations: 3}
+        assert Stats['ConvergenceFailures'] == 1
+    finally:
+        psychrolib.DisableSolverStats()
+
+def test_MapSolverConvergence(tmp_path):
+    Path = str(tmp_path / 'map.npz')
+    Map = psychrolib.MapSolverConvergence([-20, 0, 25, 150], [0, 0.5, 1], [0, 2000], Path = Path)
+    assert Map['TWetBulbIterations'].shape == (4, 3, 2)
+    # Water boils below 150 C at these pressures
+    assert not Map['Valid'][3].any()
+    assert Map['Valid'][:3].all()
+    assert (Map['TDewPointIterations'][:3] > 0).all()
+    assert np.nanmax(Map['TDewPointResidual']) < 1e-6
+    assert psychrolib.GetSolverStats() is None
+
+    Summary = psychrolib.SummarizeSolverConvergence(np.load(Path))
+    assert Summary == psychrolib.SummarizeSolverConvergence(Map)
+    assert Summary['TWetBulb']['Points'] == 18
+    assert Summary['TWetBulb']['Failures'] == 0
+    assert Summary['TWetBulb']['MaxIterations'] == Map['TWetBulbIterations'].max()
+
+
+###############################################################################
+# Python only: array functions and moist air state
+###############################################################################
+
+def test_ArrayFunctions():
+    TDryBulb = np.array([-40, -5, 0.005, 25, 60])
+    RelHum = np.array([0.1, 0.9, 0.5, 0.61, 0.3])
+    Pressure = 95461
+    HumRatio = psychrolib.GetHumRatioFromRelHumArray(TDryBulb, RelHum, Pressure)
+    for i, T in enumerate(TDryBulb):
+        assert HumRatio[i] == pytest.approx(psychrolib.GetHumRatioFromRelHum(T, RelHum[i], Pressure), rel = 1e-12)
+    TWetBulb = psychrolib.GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio, Pressure)
+    TDewPoint = psychrolib.GetTDewPointFromHumRatioArray(TDryBulb, HumRatio, Pressure)
+    for i, T in enumerate(TDryBulb):
+        assert TWetBulb[i] == pytest.approx(psychrolib.GetTWetBulbFromHumRatio(T, HumRatio[i], Pressure), abs = 0.001)
+        assert TDewPoint[i] == pytest.approx(psychrolib.GetTDewPointFromHumRatio(T, HumRatio[i], Pressure), abs = 0.001)
+    with pytest.raises(ValueError):
+        psychrolib.GetHumRatioFromRelHumArray(TDryBulb, RelHum + 0.5, Pressure)
+
+def test_MoistAirState():
+    State = psychrolib.MoistAirState(101325, TDryBulb = 40, RelHum = 0.14)
+    psychrolib.EnableSolverStats()
+    try:
+        assert State.MoistAirEnthalpy == pytest.approx(psychrolib.GetMoistAirEnthalpy(40, State.HumRatio))
+        # Only the requested properties are calculated
+        assert psychrolib.GetSolverStats()['GetTWetBulbFromHumRatio']['Calls'] == 0
+        TWetBulb = State.TWetBulb
+        assert State.TWetBulb == TWetBulb
+        assert psychrolib.GetSolverStats()['GetTWetBulbFromHumRatio']['Calls'] == 1
+    finally:
+        psychrolib.DisableSolverStats()
+
+    HumRatio, TWetBulb, TDewPoint, VapPres, MoistAirEnthalpy, MoistAirVolume, DegreeOfSaturation = \
+        psychrolib.CalcPsychrometricsFromRelHum(40, 0.14, 101325)
+    assert (State.HumRatio, State.TWetBulb, State.TDewPoint, State.VapPres, State.MoistAirEnthalpy,
+            State.MoistAirVolume, State.DegreeOfSaturation) == pytest.approx(
+            (HumRatio, TWetBulb, TDewPoint, VapPres, MoistAirEnthalpy, MoistAirVolume, DegreeOfSaturation))
+    assert State.MoistAirDensity == pytest.approx(psychrolib.GetMoistAirDensity(40, HumRatio, 101325))
+    # The humidity ratio is bounded as in GetMoistAirDensity
+    State = psychrolib.MoistAirState(101325, TDryBulb = 40, HumRatio = 0)
+    assert State.MoistAirDensity == psychrolib.GetMoistAirDensity(40, 0, 101325)
+
+    # Dry-bulb temperature from enthalpy and dew point
+    State = psychrolib.MoistAirState(101325, MoistAirEnthalpy = MoistAirEnthalpy, TDewPoint = TDewPoint)
+    assert State.TDryBulb == pytest.approx(40, abs = 0.001)
+    assert State.RelHum == pytest.approx(0.14, abs = 0.0001)
+
+    with pytest.raises(ValueError):
+        psychrolib.MoistAirState(101325, TDryBulb = 40)
+    with pytest.raises(ValueError):
+        psychrolib.MoistAirState(101325, RelHum = 0.5, TWetBulb = 20)
+
+def test_MoistAirStateArray():
+    TDryBulb = np.array([-10, 25, 40])
+    TWetBulb = np.array([-11, 18, 20])
+    State = psychrolib.MoistAirStateArray(101325, TDryBulb = TDryBulb, TWetBulb = TWetBulb)
+    for i, T in enumerate(TDryBulb):
+        Scalar = psychrolib.MoistAirState(101325, TDryBulb = T, TWetBulb = TWetBulb[i])
+        assert State.HumRatio[i] == pytest.approx(Scalar.HumRatio)
+        assert State.TDewPoint[i] == pytest.approx(Scalar.TDewPoint, abs = 0.001)
+        assert State.MoistAirVolume[i] == pytest.approx(Scalar.MoistAirVolume)
+
+
+###############################################################################
+# Python only: calculation of selected psychrometric values
+###############################################################################
+
+def test_CalcPsychrometrics():
+    HumRatio, TWetBulb, TDewPoint, VapPres, MoistAirEnthalpy, MoistAirVolume, DegreeOfSaturation = \
+        psychrolib.CalcPsychrometricsFromRelHum(40, 0.14, 101325)
+    Values = psychrolib.CalcPsychrometrics({'TDryBulb': 40, 'RelHum': 0.14, 'Pressure': 101325},
+                                           ['TWetBulb', 'MoistAirEnthalpy', 'DegreeOfSaturation'])
+    assert Values == pytest.approx({'TWetBulb': TWetBulb, 'MoistAirEnthalpy': MoistAirEnthalpy,
+                                    'DegreeOfSaturation': DegreeOfSaturation})
+
+    # The dew point does not need the pressure, nor the wet bulb solver
+    Plan = psychrolib.GetPsychrometricsPlan(['TDryBulb', 'RelHum'], ['TDewPoint'])
+    assert [Function for _, Function, _, _ in Plan] == ['GetVapPresFromRelHum', 'GetTDewPointFromVapPres']
+    # Shared intermediate values are calculated once
+    Plan = psychrolib.GetPsychrometricsPlan(['TDryBulb', 'TDewPoint', 'Altitude'], ['RelHum', 'MoistAirVolume'])
+    assert [Function for _, Function, _, _ in Plan] == ['GetVapPresFromTDewPoint', 'GetRelHumFromVapPres',
+        'GetStandardAtmPressure', 'GetHumRatioFromVapPres', 'GetMoistAirVolume']
+
+    Values = psychrolib.CalcPsychrometrics({'TDryBulb': np.array([40, 40]), 'RelHum': np.array([0.14, 0.14]),
+                                            'Pressure': 101325}, ['TWetBulb'])
+    assert Values['TWetBulb'] == pytest.approx([TWetBulb, TWetBulb], abs = 0.001)
+
+    with pytest.raises(ValueError):
+        psychrolib.CalcPsychrometrics({'TDryBulb': 40, 'RelHum': 0.14}, ['TWetBulb'])
+    with pytest.raises(ValueError):
+        psychrolib.CalcPsychrometrics({'TDryBulb': 40, 'RH': 0.14}, ['TWetBulb'])
+
+
+###############################################################################
+# Python only: state of moist air from any two properties
+###############################################################################
+
+def test_GetMoistAirState():
+    HumRatio, TWetBulb, TDewPoint, VapPres, MoistAirEnthalpy, MoistAirVolume, DegreeOfSaturation = \
+        psychrolib.CalcPsychrometricsFromRelHum(30, 0.4, 95461)
+
+    State = psychrolib.GetMoistAirState(95461, MoistAirEnthalpy = MoistAirEnthalpy, RelHum = 0.4)
+    assert State.TDryBulb == pytest.approx(30, abs = 0.001)
+    State = psychrolib.GetMoistAirState(95461, TWetBulb = TWetBulb, RelHum = 0.4)
+    assert State.TDryBulb == pytest.approx(30, abs = 0.01)
+    State = psychrolib.GetMoistAirState(95461, MoistAirVolume = MoistAirVolume, RelHum = 0.4)
+    assert State.TDryBulb == pytest.approx(30, abs = 0.001)
+    assert State.HumRatio == pytest.approx(HumRatio, rel = 0.001)
+
+    # Arrays, with and without warm start
+    RelHum = np.array([0.1, 0.4, 0.9])
+    MoistAirEnthalpy = psychrolib.GetMoistAirEnthalpyArray([-10, 30, 45],
+        psychrolib.GetHumRatioFromRelHumArray([-10, 30, 45], RelHum, 95461))
+    State = psychrolib.GetMoistAirState(95461, MoistAirEnthalpy = MoistAirEnthalpy, RelHum = RelHum)
+    assert State.TDryBulb == pytest.approx([-10, 30, 45], abs = 0.001)
+    State = psychrolib.GetMoistAirState(95461, MoistAirEnthalpy = MoistAirEnthalpy, RelHum = RelHum,
+                                        TDryBulbGuess = [-10.2, 29.9, 80])
+    assert State.TDryBulb == pytest.approx([-10, 30, 45], abs = 0.001)
+
+    with pytest.raises(ValueError):
+        psychrolib.GetMoistAirState(95461, MoistAirVolume = 0.9, MoistAirDensity = 1.1)
+
+
+###############################################################################
+# Python only: warm start of the iterative solvers
+###############################################################################
+
+def test_WarmStart():
+    HumRatio = psychrolib.GetHumRatioFromTWetBulb(30, 25, 95461)
+    psychrolib.EnableSolverStats()
+    try:
+        # From a close guess the dew point is not needed and the bracket is tight
+        assert psychrolib.GetTWetBulbFromHumRatio(30, HumRatio, 95461, 25.02) == pytest.approx(25, abs = 0.001)
+        Stats = psychrolib.GetSolverStats()
+        assert Stats['GetTDewPointFromVapPres']['Calls'] == 0
+        assert Stats['GetTWetBulbFromHumRatio']['Iterations'] <= 6
+        # A poor guess falls back to the full bracket
+        assert psychrolib.GetTWetBulbFromHumRatio(30, HumRatio, 95461, -50) == pytest.approx(25, abs = 0.001)
+        # A guess above the dry-bulb temperature, where the humidity ratio is bounded at MIN_HUM_RATIO
+        # because the saturation pressure exceeds the pressure, falls back to the full bracket
+        assert psychrolib.GetTWetBulbFromHumRatio(87.75, 5.1e-7, 61000, TWetBulbGuess = 92.75) == \
+            pytest.approx(psychrolib.GetTWetBulbFromHumRatio(87.75, 5.1e-7, 61000), abs = 0.001)
+        assert psychrolib.GetTWetBulbFromHumRatioArray([87.75, 30], [5.1e-7, HumRatio], 61000,
+                                                       TWetBulbGuess = [92.75, 25])[0] == \
+            pytest.approx(psychrolib.GetTWetBulbFromHumRatio(87.75, 5.1e-7, 61000), abs = 0.001)
+
+        VapPres = psychrolib.GetVapPresFromTDewPoint(5.0)
+        psychrolib.ResetSolverStats()
+        assert psychrolib.GetTDewPointFromVapPres(15.0, VapPres, 5.01) == pytest.approx(5.0, abs = 0.001)
+        assert psychrolib.GetSolverStats()['GetTDewPointFromVapPres']['Iterations'] <= 2
+
+        # The array solver starts from the same tight bracket around the guesses
+        TDryBulb = np.linspace(20, 35, 50)
+        HumRatio = psychrolib.GetHumRatioFromRelHumArray(TDryBulb, 0.5, 95461)
+        TWetBulb = psychrolib.GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio, 95461)
+        psychrolib.ResetSolverStats()
+        assert psychrolib.GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio, 95461, TWetBulbGuess = TWetBulb) == \
+            pytest.approx(TWetBulb, abs = 0.001)
+        Stats = psychrolib.GetSolverStats()
+        assert Stats['GetTDewPointFromVapPresArray']['Calls'] == 0
+        assert Stats['GetTWetBulbFromHumRatioArray']['Iterations'] <= 2
+    finally:
+        psychrolib.DisableSolverStats()
+
+def test_Series():
+    Time = np.arange(500)
+    TDryBulb = 25 + 5 * np.sin(Time / 50)
+    HumRatio = psychrolib.GetHumRatioFromRelHumArray(TDryBulb, 0.5 + 0.2 * np.cos(Time / 70), 101325)
+    Expected = [psychrolib.GetTWetBulbFromHumRatio(T, W, 101325) for T, W in zip(TDryBulb, HumRatio)]
+    assert psychrolib.GetTWetBulbFromHumRatioSeries(TDryBulb, HumRatio, 101325) == pytest.approx(Expected, abs = 0.001)
+    # The guess is that of the first time step only
+    assert psychrolib.GetTWetBulbFromHumRatioSeries(TDryBulb, HumRatio, 101325, Expected[0]) == \
+        pytest.approx(Expected, abs = 0.001)
+
+    # Several series at once, with time along the first axis
+    TWetBulb = psychrolib.GetTWetBulbFromHumRatioSeries(np.stack([TDryBulb, TDryBulb], 1),
+                                                        np.stack([HumRatio, HumRatio], 1), 101325)
+    assert TWetBulb[:, 1] == pytest.approx(Expected, abs = 0.001)
+
+    VapPres = psychrolib.GetVapPresFromHumRatioArray(HumRatio, 101325)
+    Expected = [psychrolib.GetTDewPointFromVapPres(T, Pw) for T, Pw in zip(TDryBulb, VapPres)]
+    assert psychrolib.GetTDewPointFromVapPresSeries(TDryBulb, VapPres) == pytest.approx(Expected, abs = 0.001)
+
+    # Long series, solved in segments, with a NaN time step
+    TDryBulb = 20 + 10 * np.sin(np.arange(1000) / 50)
+    TDryBulb[500] = np.nan
+    TWetBulb = psychrolib.GetTWetBulbFromHumRatioSeries(TDryBulb, 0.006, 101325)
+    assert np.isnan(TWetBulb[500])
+    assert np.delete(TWetBulb, 500) == pytest.approx(
+        [psychrolib.GetTWetBulbFromHumRatio(T, 0.006, 101325) for T in np.delete(TDryBulb, 500)], abs = 0.001)
+
+    # Each time step is warm started from the previous one, so that only the first is a full solve
+    psychrolib.EnableSolverStats()
+    try:
+        psychrolib.GetTWetBulbFromHumRatioSeries(20 + 10 * np.sin(np.arange(1000) / 50), 0.006, 101325)
+        Histogram = psychrolib.GetSolverStats()['GetTWetBulbFromHumRatioArray']['IterationHistogram']
+        Cold = max(Histogram)
+        assert Histogram[Cold] == 1
+        assert all(Iterations <= Cold // 2 for Iterations in Histogram if Iterations != Cold)
+    finally:
+        psychrolib.DisableSolverStats()
+
+###############################################################################
+# Python only: calculations at a fixed pressure
+###############################################################################
+
+def test_PsychrometricSite():
+    Pressure = psychrolib.GetStandardAtmPressure(500)
+    with pytest.raises(ValueError):
+        psychrolib.PsychrometricSite()
+    Site = psychrolib.PsychrometricSite(Altitude=500)
+    assert Site.Pressure == pytest.approx(Pressure)
+    assert Site.TableError is None
+    assert Site.GetSatHumRatio(25) == psychrolib.GetSatHumRatio(25, Pressure)
+    assert Site.GetMoistAirVolume(25, 0.01) == pytest.approx(psychrolib.GetMoistAirVolume(25, 0.01, Pressure), rel = 1e-12)
+    assert Site.GetMoistAirDensity(25, 0.01) == pytest.approx(psychrolib.GetMoistAirDensity(25, 0.01, Pressure), rel = 1e-12)
+    assert Site.GetRelHumFromHumRatio(25, Site.GetHumRatioFromRelHum(25, 0.5)) == pytest.approx(0.5)
+    assert Site.GetTWetBulbFromHumRatio(25, 0.01) == psychrolib.GetTWetBulbFromHumRatio(25, 0.01, Pressure)
+
+    Site = psychrolib.PsychrometricSite(Pressure, TableStep = 0.1)
+    assert Site.TableError < 1e-4
+    TDryBulb = np.linspace(-60, 60, 1001)
+    SatHumRatio = psychrolib.GetSatHumRatioArray(TDryBulb, Pressure)
+    assert Site.GetSatHumRatioArray(TDryBulb) == pytest.approx(SatHumRatio, rel = Site.TableError)
+    assert [Site.GetSatHumRatio(T) for T in TDryBulb] == pytest.approx(SatHumRatio, rel = Site.TableError)
+    assert Site.GetSatAirEnthalpyArray(TDryBulb) == pytest.approx(psychrolib.GetSatAirEnthalpyArray(TDryBulb, Pressure), rel = Site.TableError, abs = 0.1)
+    # Outside the tables
+    assert Site.GetSatHumRatio(150) == psychrolib.GetSatHumRatio(150, Pressure)
+    assert Site.GetSatHumRatioArray([150, 25])[0] == psychrolib.GetSatHumRatio(150, Pressure)
+
+    # Wet bulb above freezing, where the equations have a single solution
+    TDryBulb = np.linspace(5, 45, 41)
+    HumRatio = psychrolib.GetHumRatioFromRelHumArray(TDryBulb, 0.6, Pressure)
+    Expected = psychrolib.GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio, Pressure)
+    assert Site.GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio) == pytest.approx(Expected, abs = 0.002)
+    assert [Site.GetTWetBulbFromHumRatio(T, W) for T, W in zip(TDryBulb, HumRatio)] == pytest.approx(Expected, abs = 0.002)
+    assert Site.GetTWetBulbFromHumRatio(25, 0.01, TWetBulbGuess = 17.3) == pytest.approx(17.352, abs = 0.002)
+    assert [Site.GetTDewPointFromHumRatio(T, W) for T, W in zip(TDryBulb, HumRatio)] == \
+        pytest.approx(psychrolib.GetTDewPointFromHumRatioArray(TDryBulb, HumRatio, Pressure), abs = 0.001)
+
+def test_PsychrometricSite_TWetBulbTable(tmp_path):
+    with pytest.raises(ValueError):
+        psychrolib.PsychrometricSite(101325, TWetBulbMaxError = 0.0001)
+    Site = psychrolib.PsychrometricSite(101325, TWetBulbMaxError = 0.005, CacheDir = str(tmp_path))
+    assert Site.TWetBulbTableError <= 0.005
+    assert Site.TWetBulbExactFraction < 0.05
+
+    # Dry air, where the wet-bulb temperature is close to freezing and the equations can have two solutions,
+    # and a line of constant relative humidity
+    Generator = np.random.RandomState(0)
+    TDryBulb = np.concatenate([Generator.uniform(-5, 30, 20000), np.linspace(-20, 45, 131), [10.5316]])
+    SatFraction = np.concatenate([Generator.uniform(0, 0.3, 20000), np.full(131, 0.4), [0]])
+    HumRatio = SatFraction * psychrolib.GetSatHumRatioArray(TDryBulb, 101325)
+    HumRatio[-1] = 9.94e-6
+    Expected = psychrolib.GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio, 101325)
+    assert np.max(np.abs(Site.GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio) - Expected)) <= Site.TWetBulbTableError
+    Scalar = np.array([Site.GetTWetBulbFromHumRatio(T, W) for T, W in zip(TDryBulb[-1000:], HumRatio[-1000:])])
+    assert np.max(np.abs(Scalar - Expected[-1000:])) <= Site.TWetBulbTableError
+    # Outside the table
+    assert Site.GetTWetBulbFromHumRatio(120, 0.01) == pytest.approx(psychrolib.GetTWetBulbFromHumRatio(120, 0.01, 101325), abs = 0.001)
+
+    # The table is loaded from the cache for the same pressure, table step and maximum error only
+    assert len(list(tmp_path.iterdir())) == 1
+    Cached = psychrolib.PsychrometricSite(101325, TWetBulbMaxError = 0.005, CacheDir = str(tmp_path))
+    assert np.array_equal(Cached.TWetBulbTable_, Site.TWetBulbTable_)
+    assert Cached.TWetBulbTableError == Site.TWetBulbTableError
+    psychrolib.PsychrometricSite(101000, TWetBulbMaxError = 0.02, CacheDir = str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 2
+    psychrolib.PsychrometricSite(101325, TableStep = 1, TWetBulbMaxError = 0.02, CacheDir = str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 3
+
+###############################################################################
+# Python only: output arrays and workspace of the array functions
+###############################################################################
+
+def test_ArrayWorkspace():
+    import tracemalloc
+
+    TCelsius = np.array([-10., 0., 25.])
+    TKelvin = psychrolib.GetTKelvinFromTCelsius(TCelsius, Out = TCelsius)
+    assert TKelvin is TCelsius
+    assert TCelsius == pytest.approx([263.15, 273.15, 298.15])
+    assert psychrolib.GetTCelsiusFromTKelvin(TCelsius, Out = TCelsius) == pytest.approx([-10, 0, 25])
+
+    TDryBulb = np.linspace(-30, 45, 20000)
+    RelHum = np.linspace(0.05, 1, 20000)
+    Expected = psychrolib.CalcPsychrometricsFromRelHumArray(TDryBulb, RelHum, 101325)
+    assert Expected[1][-1] == pytest.approx(psychrolib.GetTWetBulbFromRelHum(45, 1, 101325), abs = 0.001)
+    assert Expected[4][0] == pytest.approx(psychrolib.GetMoistAirEnthalpy(-30, Expected[0][0]))
+
+    Out = tuple(np.empty(TDryBulb.shape) for _ in range(7))
+    Workspace = psychrolib.ArrayWorkspace()
+    assert psychrolib.CalcPsychrometricsFromRelHumArray(TDryBulb, RelHum, 101325, Out, Workspace) == Out
+    for Array, ExpectedArray in zip(Out, Expected):
+        assert np.array_equal(Array, ExpectedArray)
+
+    # No new arrays after the first call
+    tracemalloc.start()
+    psychrolib.CalcPsychrometricsFromRelHumArray(TDryBulb, RelHum, 101325, Out, Workspace)
+    _, Peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert Peak < TDryBulb.nbytes / 10
+
+    HumRatio = np.empty(3)
+    assert psychrolib.GetHumRatioFromRelHumArray([20, 25, 30], 0.5, 101325, Out = HumRatio) is HumRatio
+    assert HumRatio[1] == pytest.approx(psychrolib.GetHumRatioFromRelHum(25, 0.5, 101325))
+    with pytest.raises(ValueError):
+        psychrolib.GetHumRatioFromRelHumArray([20, 25, 30], 0.5, 101325, Out = np.empty(2))
+    with pytest.raises(ValueError):
+        psychrolib.GetHumRatioFromRelHumArray([20, 25, 30], 1.5, 101325, Out = HumRatio)
+
+
+###############################################################################
+# Python only: calculations in float32
+###############################################################################
+
+def test_Float32():
+    assert psychrolib.GetArrayDataType() == 'float64'
+    with pytest.raises(ValueError):
+        psychrolib.SetArrayDataType('float16')
+
+    # Range of the documented errors
+    TDryBulb, RelHum = np.meshgrid(np.linspace(-100, psychrolib.GetTDewPointFromVapPres(200, 101325 / 2), 301),
+                                   np.linspace(0.02, 1, 50))
+    HumRatio = psychrolib.GetHumRatioFromRelHumArray(TDryBulb, RelHum, 101325)
+    VapPres = psychrolib.GetVapPresFromRelHumArray(TDryBulb, RelHum)
+    Condensable = VapPres >= psychrolib.GetSatVapPres(-100)
+    TWetBulb = psychrolib.GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio, 101325)
+    Calls = {
+        'GetSatVapPresArray': (TDryBulb,),
+        'GetSatHumRatioArray': (TDryBulb, 101325),
+        'GetVapPresFromRelHumArray': (TDryBulb, RelHum),
+        'GetHumRatioFromRelHumArray': (TDryBulb, RelHum, 101325),
+        'GetRelHumFromHumRatioArray': (TDryBulb, HumRatio, 101325),
+        'GetDegreeOfSaturationArray': (TDryBulb, HumRatio, 101325),
+        'GetMoistAirVolumeArray': (TDryBulb, HumRatio, 101325),
+        'GetMoistAirEnthalpyArray': (TDryBulb, HumRatio),
+        'GetHumRatioFromTWetBulbArray': (TDryBulb, TWetBulb, 101325),
+        'GetTDewPointFromVapPresArray': (TDryBulb[Condensable], VapPres[Condensable]),
+        'GetTWetBulbFromHumRatioArray': (TDryBulb, HumRatio, 101325),
+    }
+    Absolute = ('GetMoistAirEnthalpyArray', 'GetHumRatioFromTWetBulbArray',
+                'GetTDewPointFromVapPresArray', 'GetTWetBulbFromHumRatioArray')
+    Reference = {Name: getattr(psychrolib, Name)(*Args) for Name, Args in Calls.items()}
+
+    psychrolib.SetArrayDataType(np.float32)
+    try:
+        assert psychrolib.GetArrayDataType() == 'float32'
+        for Name, Args in Calls.items():
+            Value = getattr(psychrolib, Name)(*Args)
+            assert Value.dtype == np.float32
+            Error = np.abs(Value - Reference[Name])
+            if Name not in Absolute:
+                # Excluding humidity ratios bounded to the minimum
+                Error = (Error / np.abs(Reference[Name]))[HumRatio > 2 * psychrolib.MIN_HUM_RATIO]
+            assert np.max(Error) <= psychrolib.FLOAT32_MAX_ERRORS[Name], Name
+
+        # Outputs and workspaces in float32
+        Workspace = psychrolib.ArrayWorkspace()
+        Out = tuple(np.empty(TDryBulb.shape, dtype = np.float32) for _ in range(7))
+        assert psychrolib.CalcPsychrometricsFromRelHumArray(TDryBulb, RelHum, 101325, Out, Workspace) == Out
+        assert psychrolib.GetTDewPointFromVapPresSeries(TDryBulb[Condensable], VapPres[Condensable]).dtype \
+            == np.float32
+
+        # Saturated air at the bounds of the range of validity, as in float64
+        assert psychrolib.GetTDewPointFromRelHumArray([-100., 200.], [1.0, 1.0]) == pytest.approx([-100, 200], abs = 0.01)
+        with pytest.raises(ValueError):
+            psychrolib.GetTDewPointFromVapPresArray([-100.], [0.99 * psychrolib.GetSatVapPres(-100)])
+    finally:
+        psychrolib.SetArrayDataType('float64')
+
+
+###############################################################################
+# Python only: error policies of the array functions
+###############################################################################
+
+def test_ArrayErrors():
+    Status = psychrolib.GetArrayStatus(TDryBulb = [20, 250, np.nan, 25, 20], TWetBulb = [15, 15, 15, 15, 25],
+                                       Pressure = [101325, 101325, 101325, 0, 101325])
+    assert Status.tolist() == [psychrolib.ArrayStatus.VALID,
+                               psychrolib.ArrayStatus.TDRYBULB_OUT_OF_RANGE,
+                               psychrolib.ArrayStatus.NOT_FINITE,
+                               psychrolib.ArrayStatus.PRESSURE_NOT_POSITIVE,
+                               psychrolib.ArrayStatus.TWETBULB_ABOVE_TDRYBULB]
+    with pytest.raises(ValueError):
+        psychrolib.GetArrayStatus(Temperature = 20)
+
+    TDryBulb = np.array([20, 250, np.nan, 25, 30, -50])
+    RelHum = np.array([0.5, 0.5, 0.5, 1.5, 0.4, -0.1])
+    with pytest.raises(ValueError):
+        psychrolib.CalcPsychrometricsFromRelHumArray(TDryBulb, RelHum, 101325)
+    with pytest.raises(ValueError):
+        psychrolib.CalcPsychrometricsFromRelHumArray(TDryBulb, RelHum, 101325, Errors = 'ignore')
+
+    Valid = np.array([True, False, False, False, True, False])
+    Expected = psychrolib.CalcPsychrometricsFromRelHumArray(TDryBulb[Valid], RelHum[Valid], 101325)
+    Results = psychrolib.CalcPsychrometricsFromRelHumArray(TDryBulb, RelHum, 101325, Errors = 'nan')
+    assert len(Results) == 7
+    for Result, ExpectedResult in zip(Results, Expected):
+        assert np.all(np.isnan(Result[~Valid]))
+        assert np.array_equal(Result[Valid], ExpectedResult)
+
+    *Results, Status = psychrolib.CalcPsychrometricsFromRelHumArray(TDryBulb, RelHum, 101325, Errors = 'mask')
+    assert Status.tolist() == [0, psychrolib.ArrayStatus.TDRYBULB_OUT_OF_RANGE, psychrolib.ArrayStatus.NOT_FINITE,
+                               psychrolib.ArrayStatus.RELHUM_OUT_OF_RANGE, 0,
+                               psychrolib.ArrayStatus.RELHUM_OUT_OF_RANGE]
+    assert np.array_equal(Results[1][Valid], Expected[1])
+
+    # Valid inputs without solution in the range of validity of the solvers
+    *Results, Status = psychrolib.CalcPsychrometricsFromTWetBulbArray([20, -99], [15, -99.5], 1, Errors = 'mask')
+    assert Status.tolist() == [psychrolib.ArrayStatus.NO_SOLUTION] * 2
+    assert np.all(np.isnan(Results[1]))
+    *Results, Status = psychrolib.CalcPsychrometricsFromTDewPointArray([20, 300], [10, 10], 101325, Errors = 'mask')
+    assert Status.tolist() == [0, psychrolib.ArrayStatus.TDRYBULB_OUT_OF_RANGE]
+    assert Results[1][0] == pytest.approx(psychrolib.GetTWetBulbFromTDewPoint(20, 10, 101325), abs = 0.001)
+
+    assert np.isnan(psychrolib.GetTDewPointFromVapPresArray([20, 20], [1000, -5], Errors = 'nan')).tolist() \
+        == [False, True]
+    assert np.isnan(psychrolib.GetTWetBulbFromHumRatioArray([20, 20], [0.01, -0.01], 101325, Errors = 'nan')).tolist() \
+        == [False, True]
+
+
+###############################################################################
+# Python only: trusted inputs without validity checks
+###############################################################################
+
+def test_Validation():
+    assert psychrolib.GetValidation()
+    Expected = psychrolib.CalcPsychrometricsFromRelHum(25, 0.5, 101325)
+    ExpectedArray = psychrolib.CalcPsychrometricsFromRelHumArray([25, 30], [0.5, 0.6], 101325)
+    psychrolib.SetValidation(False)
+    try:
+        assert not psychrolib.GetValidation()
+        assert psychrolib.CalcPsychrometricsFromRelHum(25, 0.5, 101325) == Expected
+        for Array, ExpectedArray in zip(psychrolib.CalcPsychrometricsFromRelHumArray([25, 30], [0.5, 0.6], 101325),
+                                        ExpectedArray):
+            assert np.array_equal(Array, ExpectedArray)
+        # No checks, no errors
+        psychrolib.GetMoistAirEnthalpy(25, -0.001)
+        psychrolib.GetSatVapPresArray([250])
+        psychrolib.GetHumRatioFromTWetBulbArray([20], [25], 101325)
+    finally:
+        psychrolib.SetValidation(True)
+    with pytest.raises(ValueError):
+        psychrolib.GetMoistAirEnthalpy(25, -0.001)
+    with pytest.raises(ValueError):
+        psychrolib.GetTDewPointFromVapPres(20, psychrolib.GetSatVapPres(200) * 1.01)
+
+
+###############################################################################
+# Python only: pandas DataFrame accessor
+###############################################################################
+
+def test_ImportWithoutPandas():
+    # pandas is slow to import, and only imported when the accessor is registered
+    Script = 'import sys, psychrolib; assert \'pandas\' not in sys.modules'
+    subprocess.run([sys.executable, '-c', Script], check = True, cwd = str(Path(psychrolib.__file__).parent))
+
+def test_PsychrometricsAccessor():
+    pd = pytest.importorskip('pandas')
+    psychrolib.RegisterPandasAccessor()
+    psychrolib.RegisterPandasAccessor()
+
+    df = pd.DataFrame({'T': [20, 25, np.nan, 30], 'RH': [0.5, 0.6, 0.7, 0.8], 'P': [101325, 95000, 101325, 90000]},
+                      index = ['a', 'b', 'c', 'd'])
+    Results = df.psychro.FromRelHum(TDryBulb = 'T', RelHum = 'RH', Pressure = 'P')
+    assert list(Results.columns) == ['HumRatio', 'TWetBulb', 'TDewPoint', 'VapPres', 'MoistAirEnthalpy',
+                                     'MoistAirVolume', 'DegreeOfSaturation']
+    assert list(Results.index) == list(df.index)
+    for Row in 'abd':
+        Expected = psychrolib.CalcPsychrometricsFromRelHum(df.loc[Row, 'T'], df.loc[Row, 'RH'], df.loc[Row, 'P'])
+        assert Results.loc[Row].tolist() == pytest.approx(Expected, rel = 1e-6, abs = 0.001)
+    assert Results.loc['c'].isna().all()
+
+    Results = df.psychro.FromTDewPoint('T', 10, 101325, Outputs = ['RelHum'])
+    assert list(Results.columns) == ['RelHum']
+    assert Results.loc['a', 'RelHum'] == pytest.approx(psychrolib.GetRelHumFromTDewPoint(20, 10))
+    Results = df.psychro.Calc(['VapPres', 'Pressure'], TDewPoint = 10, Pressure = 101325)
+    assert Results['VapPres'].tolist() == pytest.approx([psychrolib.GetVapPresFromTDewPoint(10)] * 4)
+    assert Results['Pressure'].tolist() == [101325] * 4
+
+
+###############################################################################
+# Python only: Apache Arrow and Polars
+###############################################################################
+
+def test_CalcArrow():
+    pa = pytest.importorskip('pyarrow')
+
+    TDryBulb = pa.chunked_array([[20., 25.], [None, 30., 35.]])
+    RelHum = pa.chunked_array([[0.5], [0.6, 0.7, 0.8, 0.9]])
+    TWetBulb = psychrolib.CalcArrow('GetTWetBulbFromRelHum', TDryBulb, RelHum, 101325)
+    assert isinstance(TWetBulb, pa.ChunkedArray)
+    assert [len(Chunk) for Chunk in TWetBulb.chunks] == [1, 1, 3]
+    assert TWetBulb.null_count == 1 and not TWetBulb[2].is_valid
+    for i in (0, 1, 3, 4):
+        assert TWetBulb[i].as_py() == pytest.approx(
+            psychrolib.GetTWetBulbFromRelHum(TDryBulb[i].as_py(), RelHum[i].as_py(), 101325), abs = 0.001)
+
+    TDewPoint = psychrolib.CalcArrow(psychrolib.GetTDewPointFromRelHumArray, pa.array([20., 25.]), np.array([0.5, 0.6]))
+    assert isinstance(TDewPoint, pa.Array)
+    assert TDewPoint.to_pylist() == pytest.approx([psychrolib.GetTDewPointFromRelHum(20, 0.5),
+                                                   psychrolib.GetTDewPointFromRelHum(25, 0.6)], abs = 0.001)
+    with pytest.raises(ValueError):
+        psychrolib.CalcArrow('GetTWetBulbFromEnthalpy', pa.array([20.]))
+    with pytest.raises(ValueError):
+        psychrolib.CalcArrow('GetMoistAirEnthalpy', pa.chunked_array([[20.]]), pa.chunked_array([[0.01, 0.02]]))
+
+def test_PolarsExpr():
+    pl = pytest.importorskip('polars')
+
+    Frame = pl.DataFrame({'T': [20., 25., None], 'RH': [0.5, 0.6, 0.7], 'W': [0.01, 0.02, 0.01]})
+    Results = Frame.lazy().with_columns(
+        TWetBulb = psychrolib.PolarsExpr('GetTWetBulbFromRelHum', 'T', 'RH', 101325),
+        TDewPoint = psychrolib.PolarsExpr('GetTDewPointFromRelHum', 'T', pl.col('RH')),
+        Enthalpy = psychrolib.PolarsExpr('GetMoistAirEnthalpy', 'T', 'W')).collect()
+    assert Results['TWetBulb'].to_list()[:2] == pytest.approx([psychrolib.GetTWetBulbFromRelHum(20, 0.5, 101325),
+                                                               psychrolib.GetTWetBulbFromRelHum(25, 0.6, 101325)],
+                                                              abs = 0.001)
+    assert Results['TDewPoint'][1] == pytest.approx(psychrolib.GetTDewPointFromRelHum(25, 0.6), abs = 0.001)
+    assert Results['Enthalpy'][0] == pytest.approx(psychrolib.GetMoistAirEnthalpy(20, 0.01))
+    assert Results['TWetBulb'][2] is None and Results['Enthalpy'][2] is None
+
+
+###############################################################################
+# Python only: Parquet output
+###############################################################################
+
+def test_PsychrometricsParquetWriter(tmp_path):
+    pa = pytest.importorskip('pyarrow')
+    pq = pytest.importorskip('pyarrow.parquet')
+
+    Path = str(tmp_path / 'psychrometrics.parquet')
+    TDryBulb = np.linspace(10, 30, 5)
+    TDewPoint = np.linspace(0, 10, 5)
+    with psychrolib.PsychrometricsParquetWriter(Path, ('TDryBulb', 'TDewPoint', 'Pressure'),
+                                                ('HumRatio', 'TWetBulb', 'RelHum'),
+                                                Columns = {'Station': pa.string()}) as Writer:
+        for Station in ('A', 'B', 'C'):
+            Writer.Write(Station = Station, TDryBulb = TDryBulb, TDewPoint = TDewPoint, Pressure = 101325)
+        with pytest.raises(ValueError):
+            Writer.Write(TDryBulb = TDryBulb, TDewPoint = TDewPoint, Pressure = 101325)
+
+    File = pq.ParquetFile(Path)
+    assert File.metadata.num_row_groups == 3
+    Schema = File.schema_arrow
+    assert Schema.names == ['Station', 'TDryBulb', 'TDewPoint', 'Pressure', 'HumRatio', 'TWetBulb', 'RelHum']
+    assert Schema.metadata[b'psychrolib_units'] == b'SI'
+    assert Schema.field('TWetBulb').metadata[b'unit'] == '°C'.encode()
+    assert Schema.field('HumRatio').metadata[b'unit'] == 'kg_H₂O kg_Air⁻¹'.encode()
+
+    Table = pq.read_table(Path)
+    assert Table['Station'].to_pylist() == ['A'] * 5 + ['B'] * 5 + ['C'] * 5
+    assert Table['Pressure'].to_pylist() == [101325] * 15
+    for i in range(5):
+        Expected = psychrolib.CalcPsychrometricsFromTDewPoint(TDryBulb[i], TDewPoint[i], 101325)
+        assert Table['HumRatio'][10 + i].as_py() == pytest.approx(Expected[0])
+        assert Table['TWetBulb'][10 + i].as_py() == pytest.approx(Expected[1], abs = 0.001)
+        assert Table['RelHum'][10 + i].as_py() == pytest.approx(Expected[2])
+
+    with pytest.raises(ValueError):
+        psychrolib.PsychrometricsParquetWriter(str(tmp_path / 'invalid.parquet'), ('TDryBulb',), ('HumRatio',))
+
+
+###############################################################################
+# Python only: out-of-core calculations on memory-mapped files
+###############################################################################
+
+def test_CalcPsychrometricsMemmap(tmp_path, monkeypatch):
+    TDryBulb = np.linspace(-20, 45, 1000)
+    RelHum = np.linspace(0.05, 1, 1000)
+    TDryBulb.tofile(str(tmp_path / 'tdb.f64'))
+    Inputs = {'TDryBulb': str(tmp_path / 'tdb.f64'), 'RelHum': RelHum, 'Pressure': 101325}
+    Outputs = {'TWetBulb': str(tmp_path / 'twb.f64'), 'HumRatio': str(tmp_path / 'w.f64')}
+    Expected = psychrolib.CalcPsychrometrics({'TDryBulb': TDryBulb, 'RelHum': RelHum, 'Pressure': 101325},
+                                             ('TWetBulb', 'HumRatio'))
+
+    # Interrupted after three chunks, then resumed
+    Calc = psychrolib.CalcPsychrometrics
+    Calls = []
+    def InterruptedCalc(Inputs, Outputs):
+        Calls.append(len(Inputs['RelHum']))
+        if len(Calls) > 3:
+            raise KeyboardInterrupt
+        return Calc(Inputs, Outputs)
+    monkeypatch.setattr(psychrolib, 'CalcPsychrometrics', InterruptedCalc)
+    with pytest.raises(KeyboardInterrupt):
+        psychrolib.CalcPsychrometricsMemmap(Inputs, Outputs, ChunkSize = 128)
+    monkeypatch.setattr(psychrolib, 'CalcPsychrometrics', Calc)
+    assert open(str(tmp_path / 'twb.f64.progress')).read().split()[:3] == ['384', '1000', 'TWetBulb,HumRatio']
+    # Other outputs cannot resume
+    with pytest.raises(ValueError):
+        psychrolib.CalcPsychrometricsMemmap(Inputs, {'TWetBulb': Outputs['TWetBulb']}, ChunkSize = 128)
+
+    assert psychrolib.CalcPsychrometricsMemmap(Inputs, Outputs, ChunkSize = 128) == 1000 - 384
+    assert psychrolib.CalcPsychrometricsMemmap(Inputs, Outputs, ChunkSize = 128) == 0
+    # The bisection of the chunks may stop at different iterations than that of the whole array
+    assert np.fromfile(str(tmp_path / 'twb.f64')) == pytest.approx(Expected['TWetBulb'], abs = 0.001)
+    assert np.array_equal(np.fromfile(str(tmp_path / 'w.f64')), Expected['HumRatio'])
+
+    # A missing output is calculated again from the start
+    (tmp_path / 'w.f64').unlink()
+    assert psychrolib.CalcPsychrometricsMemmap(Inputs, Outputs, ChunkSize = 128) == 1000
+    assert np.array_equal(np.fromfile(str(tmp_path / 'w.f64')), Expected['HumRatio'])
+
+    # Other inputs are calculated again from the start
+    assert psychrolib.CalcPsychrometricsMemmap(dict(Inputs, Pressure = 95461), Outputs, ChunkSize = 128) == 1000
+    assert psychrolib.CalcPsychrometricsMemmap(Inputs, Outputs, ChunkSize = 128) == 1000
+    assert psychrolib.CalcPsychrometricsMemmap(dict(Inputs, RelHum = RelHum / 2), Outputs, ChunkSize = 128) == 1000
+    assert np.array_equal(np.fromfile(str(tmp_path / 'w.f64')), psychrolib.GetHumRatioFromRelHumArray(
+        TDryBulb, RelHum / 2, 101325))
+    Stat = os.stat(str(tmp_path / 'tdb.f64'))
+    os.utime(str(tmp_path / 'tdb.f64'), ns = (Stat.st_atime_ns, Stat.st_mtime_ns + 10**9))
+    assert psychrolib.CalcPsychrometricsMemmap(dict(Inputs, RelHum = RelHum / 2), Outputs, ChunkSize = 128) == 1000
+    assert psychrolib.CalcPsychrometricsMemmap(dict(Inputs, RelHum = RelHum / 2), Outputs, ChunkSize = 128) == 0
+
+    with open(str(tmp_path / 'tdb.f64'), 'ab') as File:
+        File.write(b'\0')
+    with pytest.raises(ValueError):
+        psychrolib.CalcPsychrometricsMemmap(Inputs, {'HumRatio': str(tmp_path / 'other.f64')})
+    with pytest.raises(ValueError):
+        psychrolib.CalcPsychrometricsMemmap({'TDryBulb': TDryBulb, 'RelHum': RelHum[:10], 'Pressure': 101325},
+                                            {'HumRatio': str(tmp_path / 'other.f64')})
+
+
+###############################################################################
+# Python only: psychrometric chart
+###############################################################################
+
+def test_GetPsychrometricChart():
+    Chart = psychrolib.GetPsychrometricChart(101325, TDryBulbRange = (0, 40), HumRatioMax = 0.025, Resolution = 41)
+    Cached = psychrolib.GetPsychrometricChart(101325, (0, 40), 0.025, 41)
+    assert Cached['Saturation'] is Chart['Saturation'] and Cached['RelHum']['HumRatio'] is Chart['RelHum']['HumRatio']
+    assert psychrolib.GetPsychrometricChart(95000, (0, 40), 0.025, 41)['Saturation'] is not Chart['Saturation']
+    with pytest.raises(ValueError):
+        Chart['Saturation'][0] = 0
+    # Changing the dicts returned does not change the cached chart
+    Cached['RelHum']['HumRatio'] = None
+    del Cached['TWetBulb']
+    assert psychrolib.GetPsychrometricChart(101325, (0, 40), 0.025, 41)['RelHum']['HumRatio'] is Chart['RelHum']['HumRatio']
+
+    TDryBulb = Chart['TDryBulb']
+    assert TDryBulb[[0, 10, 40]].tolist() == [0, 10, 40]
+    assert Chart['Saturation'][10] == pytest.approx(psychrolib.GetSatHumRatio(10, 101325))
+    RelHum = Chart['RelHum']
+    assert RelHum['Levels'].tolist() == pytest.approx([0.1 * i for i in range(1, 11)])
+    assert RelHum['HumRatio'][4, 30] == pytest.approx(psychrolib.GetHumRatioFromRelHum(30, 0.5, 101325))
+
+    TWetBulb = Chart['TWetBulb']
+    assert TWetBulb['Levels'].tolist() == [0, 5, 10, 15, 20, 25, 30, 35, 40]
+    assert TWetBulb['HumRatio'][3, 25] == pytest.approx(psychrolib.GetHumRatioFromTWetBulb(25, 15, 101325))
+    assert np.isnan(TWetBulb['HumRatio'][3, 14])
+    # Above the largest humidity ratio of the chart
+    assert np.isnan(Chart['Saturation'][30]) and np.isnan(RelHum['HumRatio'][-1, 30])
+    assert np.isnan(TWetBulb['HumRatio'][-1, -1])
+    for Lines in (Chart['Saturation'], RelHum['HumRatio'], TWetBulb['HumRatio']):
+        assert np.nanmax(Lines) <= 0.025
+
+    HumRatio = Chart['HumRatio']
+    Enthalpy = Chart['MoistAirEnthalpy']
+    assert Enthalpy['Levels'][0] == 10000
+    i = Enthalpy['Levels'].tolist().index(50000)
+    assert Enthalpy['TDryBulb'][i, 8] == pytest.approx(psychrolib.GetTDryBulbFromEnthalpyAndHumRatio(50000, HumRatio[8]))
+    # Above saturation
+    assert np.isnan(Enthalpy['TDryBulb'][0, -1])
+
+    Volume = Chart['MoistAirVolume']
+    assert Volume['TDryBulb'][2, 4] == pytest.approx(
+        psychrolib.GetTDryBulbFromMoistAirVolumeAndHumRatio(Volume['Levels'][2], HumRatio[4], 101325))
+    for T, W in zip(Volume['TDryBulb'].ravel(), np.broadcast_to(HumRatio, Volume['TDryBulb'].shape).ravel()):
+        assert np.isnan(T) or (0 <= T <= 40 and W <= psychrolib.GetSatHumRatio(T, 101325))
+
+    Chart = psychrolib.GetPsychrometricChart(101325, RelHumLevels = [0.5], TWetBulbLevels = [20])
+    assert Chart['RelHum']['HumRatio'].shape == (1, 101)
+    assert Chart['TWetBulb']['Levels'].tolist() == [20]
+
+
+###############################################################################
+# Python only: regions of the psychrometric chart
+###############################################################################
+
+def test_RegionClassifier():
+    Regions = psychrolib.GetASHRAEDataCenterRegions()
+    assert [Region.Name for Region in Regions] == ['Recommended', 'A1', 'A2', 'A3', 'A4']
+    Classifier = psychrolib.RegionClassifier(Regions, 101325)
+
+    Generator = np.random.RandomState(0)
+    TDryBulb = Generator.uniform(0, 50, 2000)
+    RelHum = Generator.uniform(0.02, 1, 2000)
+    HumRatio = psychrolib.GetHumRatioFromRelHumArray(TDryBulb, RelHum, 101325)
+    Index = Classifier.Classify(TDryBulb, HumRatio)
+    for T, RH, W, i in zip(TDryBulb, RelHum, HumRatio, Index):
+        TDewPoint = psychrolib.GetTDewPointFromHumRatio(T, W, 101325)
+        Expected = -1
+        for Position, (_, TLimits, TDewPointMin, RelHumMin, TDewPointMax, RelHumMax) \
+                in enumerate(psychrolib.ASHRAE_DATA_CENTER_CLASSES):
+            if TLimits[0] <= T <= TLimits[1] and TDewPointMin <= TDewPoint <= TDewPointMax \
+                    and (RelHumMin or 0) <= RH <= RelHumMax:
+                Expected = Position
+                break
+        # Points within the tolerance of the dew-point solver of a limit may be classified either way
+        if i != Expected:
+            assert min(abs(TDewPoint - Limit) for Class in psychrolib.ASHRAE_DATA_CENTER_CLASSES
+                       for Limit in (Class[2], Class[4])) < 0.01
+    assert np.all(Classifier.GetMembership(TDryBulb, HumRatio)[Index[Index >= 0], np.flatnonzero(Index >= 0)])
+
+    Times = Classifier.GetTimeInRegions(TDryBulb, HumRatio, TimeStep = 0.5)
+    assert Times['A1'] == 0.5 * np.sum(Index == 1)
+    assert sum(Times.values()) == 1000
+    assert Classifier.Classify([np.nan, 22], [0.008, np.nan]).tolist() == [-1, -1]
+
+    # Polygon in (TDryBulb, HumRatio) space
+    Triangle = psychrolib.PsychrometricRegion('Triangle', Polygon = [(20, 0), (30, 0), (20, 0.01)])
+    Classifier = psychrolib.RegionClassifier([Triangle], 101325)
+    assert Classifier.Classify([21, 28, 20.5, 29], [0.001, 0.001, 0.009, 0.009]).tolist() == [0, 0, 0, -1]
+    with pytest.raises(ValueError):
+        psychrolib.PsychrometricRegion('Line', Polygon = [(20, 0), (30, 0)])
+
+
+###############################################################################
+# Python only: nearest states of moist air
+###############################################################################
+
+def test_PsychrometricStateIndex(tmp_path, monkeypatch):
+    Generator = np.random.RandomState(0)
+    TDryBulb = Generator.uniform(-10, 40, 20000)
+    HumRatio = psychrolib.GetHumRatioFromRelHumArray(TDryBulb, Generator.uniform(0.05, 1, 20000), 101325)
+    Points = np.stack([TDryBulb, HumRatio / 0.001, psychrolib.GetMoistAirEnthalpyArray(TDryBulb, HumRatio) / 1000],
+                      axis = 1)
+
+    # Few pending states, so that both the sorted and the pending states are searched
+    monkeypatch.setattr(psychrolib.PsychrometricStateIndex, 'PENDING_MAX', 100)
+    Index = psychrolib.PsychrometricStateIndex()
+    for Start in range(0, 20000, 3000):
+        Index.Insert(TDryBulb[Start:Start + 3000], HumRatio[Start:Start + 3000])
+    Index.Insert(TDryBulb[:50], HumRatio[:50], Ids = np.arange(50) + 100000)
+    assert len(Index) == 20050 and Index.Pending_
+
+    def BruteForce(T, W):
+        Point = np.array([T, W / 0.001, psychrolib.GetMoistAirEnthalpy(T, W) / 1000])
+        return np.sqrt(np.sum((Points - Point) ** 2, axis = 1))
+
+    for T, W in [(24, 0.009), (-9, 0.0005), (39, 0.04), (60, 0.1)]:
+        Distances = BruteForce(T, W)
+        Ids, Nearest = Index.QueryNearest(T, W, K = 20)
+        assert Nearest == pytest.approx(np.sort(Distances)[:20])
+        assert np.all(np.diff(Nearest) >= 0)
+        Ids, Within = Index.QueryRadius(T, W, 2)
+        Expected = np.flatnonzero(Distances <= 2)
+        assert np.array_equal(np.sort(Ids[Ids < 100000]), Expected)
+        assert np.array_equal(np.sort(Ids[Ids >= 100000]) - 100000, Expected[Expected < 50])
+
+    # Serialization, which merges the pending states
+    Index.Save(tmp_path / 'index.npz')
+    Loaded = psychrolib.PsychrometricStateIndex.Load(tmp_path / 'index.npz')
+    assert len(Loaded) == 20050 and not Loaded.Pending_
+    Ids, Nearest = Loaded.QueryNearest(24, 0.009, K = 20)
+    assert np.array_equal(np.sort(Ids), np.sort(Index.QueryNearest(24, 0.009, K = 20)[0]))
+    Loaded.Insert(24, 0.009)
+    assert Loaded.QueryNearest(24, 0.009) == (np.array([100050]), np.array([0.]))
+
+    assert len(psychrolib.PsychrometricStateIndex().QueryNearest(24, 0.009, K = 5)[0]) == 0
+    with pytest.raises(ValueError):
+        Index.Insert(np.nan, 0.009)
+    psychrolib.SetUnitSystem(psychrolib.IP)
+    try:
+        with pytest.raises(ValueError):
+            psychrolib.PsychrometricStateIndex.Load(tmp_path / 'index.npz')
+    finally:
+        psychrolib.SetUnitSystem(psychrolib.SI)
+    monkeypatch.setattr(psychrolib, 'PSYCHROLIB_UNITS', None)
+    with pytest.raises(ValueError):
+        psychrolib.PsychrometricStateIndex.Load(tmp_path / 'index.npz')
+    with pytest.raises(ValueError):
+        psychrolib.PsychrometricStateIndex()
+
+
+###############################################################################
+# Python only: design conditions
+###############################################################################
+
+def test_DesignConditionsAccumulator():
+    Generator = np.random.RandomState(0)
+    Hours = 8760 * 4
+    TDryBulb = 12 + 10 * np.sin(np.arange(Hours) * 2 * np.pi / 8760) + Generator.normal(0, 4, Hours)
+    TDewPoint = TDryBulb - Generator.uniform(0, 12, Hours)
+    HumRatio, TWetBulb, _, _, MoistAirEnthalpy, _, _ = \
+        psychrolib.CalcPsychrometricsFromTDewPointArray(TDryBulb, TDewPoint, 101325)
+
+    # Partial accumulators by year, merged, with invalid hours ignored
+    Accumulators = []
+    for Year in range(4):
+        Accumulator = psychrolib.DesignConditionsAccumulator()
+        for Start in range(Year * 8760, (Year + 1) * 8760, 1000):
+            Slice = slice(Start, min(Start + 1000, (Year + 1) * 8760))
+            Accumulator.Update(TDryBulb[Slice], TWetBulb[Slice], TDewPoint[Slice], HumRatio[Slice],
+                               MoistAirEnthalpy[Slice])
+        Accumulators.append(Accumulator)
+    Accumulators[0].Update([np.nan, 20], 15, 10, 0.008, 40000)
+    Accumulator = Accumulators[0]
+    for Other in Accumulators[1:]:
+        Accumulator.Merge(Other)
+    assert Accumulator.Count == Hours + 1 and Accumulator.Missing == 1
+
+    Conditions = Accumulator.GetDesignConditions()
+    for Percent in (0.4, 1, 2):
+        Cooling = Conditions['Cooling'][Percent]
+        assert Cooling['TDryBulb'] == pytest.approx(np.quantile(TDryBulb, 1 - Percent / 100), abs = 0.1)
+        Coincident = np.floor(TDryBulb * 10) == np.floor(Cooling['TDryBulb'] * 10)
+        assert Cooling['TWetBulb'] == pytest.approx(np.mean(TWetBulb[Coincident]), abs = 1)
+        Dehumidification = Conditions['Dehumidification'][Percent]
+        assert Dehumidification['TDewPoint'] == pytest.approx(np.quantile(TDewPoint, 1 - Percent / 100), abs = 0.1)
+        assert Dehumidification['HumRatio'] == \
+            pytest.approx(psychrolib.GetHumRatioFromTDewPoint(Dehumidification['TDewPoint'], 101325), rel = 0.01)
+        assert Conditions['Enthalpy'][Percent]['MoistAirEnthalpy'] == \
+            pytest.approx(np.quantile(MoistAirEnthalpy, 1 - Percent / 100), abs = 100)
+        assert Conditions['Evaporation'][Percent]['TWetBulb'] == \
+            pytest.approx(np.quantile(TWetBulb, 1 - Percent / 100), abs = 0.1)
+    assert Conditions['Heating'][99.6]['TDryBulb'] == pytest.approx(np.quantile(TDryBulb, 0.004), abs = 0.1)
+    assert Accumulator.GetQuantile('TDryBulb', 0) == pytest.approx(TDryBulb.min(), abs = 0.1)
+    assert Accumulator.GetQuantile('TDryBulb', 1) == pytest.approx(TDryBulb.max(), abs = 0.1)
+
+    with pytest.raises(ValueError):
+        Accumulator.Merge(psychrolib.DesignConditionsAccumulator(Bins = {'TDryBulb': (-50, 50, 0.5)}))
+    with pytest.raises(ValueError):
+        psychrolib.DesignConditionsAccumulator().GetQuantile('TDryBulb', 0.5)
+    with pytest.raises(ValueError):
+        psychrolib.DesignConditionsAccumulator(Bins = {'HumRatio': (0, 0.03, 0.0001)})
+
+
+###############################################################################
+# Python only: bin analysis and degree-hours
+###############################################################################
+
+def test_BinAnalysisAccumulator():
+    Generator = np.random.RandomState(0)
+    Hours = 8760
+    TDryBulb = 12 + 10 * np.sin(np.arange(Hours) * 2 * np.pi / Hours) + Generator.normal(0, 4, Hours)
+    TDewPoint = TDryBulb - Generator.uniform(0, 12, Hours)
+    HumRatio, TWetBulb, _, _, MoistAirEnthalpy, _, _ = \
+        psychrolib.CalcPsychrometricsFromTDewPointArray(TDryBulb, TDewPoint, 101325)
+
+    Accumulator = psychrolib.BinAnalysisAccumulator(EnthalpyBases = (40000,))
+    Other = psychrolib.BinAnalysisAccumulator(EnthalpyBases = (40000,))
+    for Start in range(0, Hours, 1000):
+        Target = Accumulator if Start < Hours // 2 else Other
+        Target.Update(TDryBulb[Start:Start + 1000], TWetBulb[Start:Start + 1000], HumRatio[Start:Start + 1000])
+    Other.Update([np.nan, 30], 20, 0.01, TimeStep = [2, 0])
+    Accumulator.Merge(Other)
+    assert Accumulator.Missing == 2
+
+    Table = Accumulator.GetBinTable()
+    assert Table['Time'].sum() == Hours
+    for Lower, Upper, Time, WetBulb, Enthalpy in zip(Table['Lower'], Table['Upper'], Table['Time'],
+                                                     Table['TWetBulb'], Table['MoistAirEnthalpy']):
+        InBin = (TDryBulb >= Lower) & (TDryBulb < Upper)
+        assert Time == np.count_nonzero(InBin)
+        if Time:
+            assert WetBulb == pytest.approx(np.mean(TWetBulb[InBin]))
+            assert Enthalpy == pytest.approx(np.mean(MoistAirEnthalpy[InBin]))
+        else:
+            assert np.isnan(WetBulb)
+
+    DegreeHours = Accumulator.GetDegreeHours()
+    assert DegreeHours['Cooling'][18.3] == pytest.approx(np.sum(np.maximum(TDryBulb - 18.3, 0)))
+    assert DegreeHours['Heating'][18.3] == pytest.approx(np.sum(np.maximum(18.3 - TDryBulb, 0)))
+    assert DegreeHours['Enthalpy'][40000] == pytest.approx(np.sum(np.maximum(MoistAirEnthalpy - 40000, 0)))
+
+    with pytest.raises(ValueError):
+        Accumulator.Merge(psychrolib.BinAnalysisAccumulator())
+    with pytest.raises(ValueError):
+        psychrolib.BinAnalysisAccumulator(BinEdges = (10, 5))
+
+
+###############################################################################
+# Python only: resampling of time series
+###############################################################################
+
+def test_ResamplePsychrometrics():
+    Generator = np.random.RandomState(0)
+    TDryBulb = 20 + 5 * np.sin(np.arange(1000) / 50) + Generator.normal(0, 1, 1000)
+    RelHum = np.clip(0.5 + 0.2 * np.sin(np.arange(1000) / 30) + Generator.normal(0, 0.05, 1000), 0.05, 1)
+    RelHum[5] = np.nan
+    HumRatio = psychrolib.GetHumRatioFromRelHumArray(TDryBulb, RelHum, 101325)
+    MoistAirEnthalpy = psychrolib.GetMoistAirEnthalpyArray(TDryBulb, HumRatio)
+
+    Fixed = psychrolib.ResamplePsychrometrics(TDryBulb, 101325, Window = 60, RelHum = RelHum)
+    assert len(Fixed['TDryBulb']) == 17 and Fixed['Count'].tolist() == [59] + [60] * 15 + [40]
+    for Index, Start in enumerate(range(0, 1000, 60)):
+        Slice = slice(Start, Start + 60)
+        W = np.nanmean(HumRatio[Slice])
+        T = psychrolib.GetTDryBulbFromEnthalpyAndHumRatio(np.nanmean(MoistAirEnthalpy[Slice]), W)
+        assert Fixed['HumRatio'][Index] == pytest.approx(W)
+        assert Fixed['TDryBulb'][Index] == pytest.approx(T)
+        assert Fixed['RelHum'][Index] == pytest.approx(psychrolib.GetRelHumFromHumRatio(T, W, 101325))
+        assert Fixed['TDewPoint'][Index] == pytest.approx(psychrolib.GetTDewPointFromHumRatio(T, W, 101325), abs = 0.001)
+        assert Fixed['TWetBulb'][Index] == pytest.approx(psychrolib.GetTWetBulbFromHumRatio(T, W, 101325), abs = 0.001)
+
+    Rolling = psychrolib.ResamplePsychrometrics(TDryBulb, 101325, Window = 60, Rolling = True, HumRatio = HumRatio)
+    assert len(Rolling['TDryBulb']) == 941
+    assert Rolling['MoistAirEnthalpy'][100] == pytest.approx(np.mean(MoistAirEnthalpy[100:160]))
+    assert Rolling['MoistAirEnthalpy'][0] == pytest.approx(np.nanmean(MoistAirEnthalpy[:60]))
+
+    Grouped = psychrolib.ResamplePsychrometrics(TDryBulb, 101325, Groups = np.arange(1000) // 60,
+                                                TDewPoint = psychrolib.GetTDewPointFromRelHumArray(TDryBulb, RelHum))
+    assert Grouped['HumRatio'] == pytest.approx(Fixed['HumRatio'])
+
+    Empty = psychrolib.ResamplePsychrometrics([np.nan] * 3 + [20] * 3, 101325, Window = 3, HumRatio = 0.008)
+    assert np.isnan(Empty['TWetBulb'][0]) and Empty['TDryBulb'][1] == pytest.approx(20)
+    assert not Fixed['Supersaturated'].any() and not Empty['Supersaturated'].any()
+
+    # Mixing saturated air at different temperatures gives fog
+    Fog = psychrolib.ResamplePsychrometrics([0, 40, 20, 20], 101325, Window = 2, RelHum = [1, 1, 1, 1])
+    assert Fog['Supersaturated'].tolist() == [True, False]
+    assert Fog['RelHum'] == pytest.approx([1, 1])
+    assert Fog['TDewPoint'][0] == Fog['TWetBulb'][0] == Fog['TDryBulb'][0]
+    with pytest.raises(ValueError):
+        psychrolib.ResamplePsychrometrics(TDryBulb, 101325, Window = 60, RelHum = RelHum, HumRatio = HumRatio)
+    with pytest.raises(ValueError):
+        psychrolib.ResamplePsychrometrics(TDryBulb, 101325, RelHum = RelHum)
+
+
+###############################################################################
+# Python only: derivatives
+###############################################################################
+
+def test_GetJacobian(monkeypatch):
+    # Central differences are only accurate with a tight tolerance of the solvers
+    monkeypatch.setattr(psychrolib, 'PSYCHROLIB_TOLERANCE', 1e-10)
+    TDryBulb = np.array([-20., -5, 25, 40])
+    Pressure = np.array([101325., 90000, 101325, 80000])
+    HumRatio = np.array([0.0003, 0.002, 0.01, 0.03])
+    RelHum = psychrolib.GetRelHumFromHumRatioArray(TDryBulb, HumRatio, Pressure)
+    TDewPoint = psychrolib.GetTDewPointFromHumRatioArray(TDryBulb, HumRatio, Pressure)
+    TWetBulb = psychrolib.GetTWetBulbFromHumRatioArray(TDryBulb, HumRatio, Pressure)
+    VapPres = psychrolib.GetVapPresFromHumRatioArray(HumRatio, Pressure)
+    Inputs = {'TDryBulb': TDryBulb, 'Pressure': Pressure, 'HumRatio': HumRatio, 'RelHum': RelHum,
+              'TDewPoint': TDewPoint, 'TWetBulb': TWetBulb, 'VapPres': VapPres}
+    Steps = {'TDryBulb': 1e-4, 'Pressure': 1e-1, 'HumRatio': 1e-8, 'RelHum': 1e-6, 'TDewPoint': 1e-4,
+             'TWetBulb': 1e-4, 'VapPres': 1e-3}
+
+    for Name, (Names, _) in psychrolib.JACOBIAN_FUNCTIONS_.items():
+        Function = np.vectorize(getattr(psychrolib, Name))
+        Args = [Inputs[ArgName] for ArgName in Names]
+        Values, Derivatives = psychrolib.GetJacobian(getattr(psychrolib, Name), *Args)
+        Expected = Function(*Args)
+        if not Name.startswith('CalcPsychrometrics'):
+            Values, Derivatives, Expected = (Values,), (Derivatives,), (Expected,)
+        for Value, Output in zip(Values, Expected):
+            assert Value == pytest.approx(Output, rel = 1e-6)
+        for Index, ArgName in enumerate(Names):
+            Upper, Lower = list(Args), list(Args)
+            Upper[Index] = Args[Index] + Steps[ArgName]
+            Lower[Index] = Args[Index] - Steps[ArgName]
+            Upper, Lower = Function(*Upper), Function(*Lower)
+            if not Name.startswith('CalcPsychrometrics'):
+                Upper, Lower = (Upper,), (Lower,)
+            for Derivative, UpperValue, LowerValue in zip(Derivatives, Upper, Lower):
+                Difference = (UpperValue - LowerValue) / (2 * Steps[ArgName])
+                assert Derivative[ArgName] == pytest.approx(Difference, rel = 1e-4, abs = 1e-9), (Name, ArgName)
+
+    TWetBulb, Derivatives = psychrolib.GetJacobian('GetTWetBulbFromHumRatioArray', 25, 0.01, 101325)
+    assert TWetBulb.shape == () and set(Derivatives) == {'TDryBulb', 'HumRatio', 'Pressure'}
+    with pytest.raises(ValueError):
+        psychrolib.GetJacobian(psychrolib.GetStandardAtmPressure, 0)
+    with pytest.raises(ValueError):
+        psychrolib.GetJacobian(psychrolib.GetMoistAirEnthalpy, 25)
+
+
+###############################################################################
+# Python only: uncertainty
+###############################################################################
+
+def test_GetPsychrometricUncertainty():
+    TDryBulb = np.array([[0., 12], [25, 35]])
+    RelHum = np.array([[0.3, 0.5], [0.6, 0.8]])
+    Uncertainties = (0.2, 0.02, np.array([[100], [200]]))
+    Correlation = [[1, 0.5, 0], [0.5, 1, 0], [0, 0, 1]]
+    MonteCarlo = psychrolib.GetPsychrometricUncertainty(TDryBulb, RelHum, 101325, Uncertainties, Correlation,
+                                                        Samples = 20000, ChunkSize = 50000, Seed = 0)
+    Linear = psychrolib.GetPsychrometricUncertainty(TDryBulb, RelHum, 101325, Uncertainties, Correlation,
+                                                    Method = 'linear')
+    TDewPoint = psychrolib.GetTDewPointFromRelHumArray(TDryBulb, RelHum)
+    for Output in ('TDewPoint', 'TWetBulb', 'MoistAirEnthalpy'):
+        assert MonteCarlo[Output]['Percentiles'].shape == (3, 2, 2)
+        assert MonteCarlo[Output]['StdDev'] == pytest.approx(Linear[Output]['StdDev'], rel = 0.05)
+        assert MonteCarlo[Output]['Percentiles'][1] == pytest.approx(Linear[Output]['Percentiles'][1], rel = 0.01)
+        assert np.all(np.diff(MonteCarlo[Output]['Percentiles'], axis = 0) > 0)
+    assert Linear['TDewPoint']['Percentiles'][1] == pytest.approx(TDewPoint, abs = 0.001)
+    # 95 % of the normal distribution is within 1.96 standard deviations
+    assert Linear['TDewPoint']['Percentiles'][2] - Linear['TDewPoint']['Percentiles'][1] == \
+        pytest.approx(1.959964 * Linear['TDewPoint']['StdDev'])
+
+    Again = psychrolib.GetPsychrometricUncertainty(TDryBulb, RelHum, 101325, Uncertainties, Correlation,
+                                                   Samples = 20000, ChunkSize = 50000, Seed = 0)
+    assert np.array_equal(Again['TWetBulb']['Percentiles'], MonteCarlo['TWetBulb']['Percentiles'])
+    with pytest.raises(ValueError):
+        psychrolib.GetPsychrometricUncertainty(25, 0.5, 101325, (0.2, 0.02, 100), [[1, 2, 0], [2, 1, 0], [0, 0, 1]])
+    with pytest.raises(ValueError):
+        psychrolib.GetPsychrometricUncertainty(25, 0.5, 101325, (0.2, 0.02, 100), Outputs = ('TDryBulb',))
+    with pytest.raises(ValueError):
+        psychrolib.GetPsychrometricUncertainty(25, 0.5, 101325, (0.2, 0.02))
+    with pytest.raises(ValueError):
+        psychrolib.GetPsychrometricUncertainty(25, 0.5, 101325, (0.2, 0.02, 100), Samples = 1)
+
+
+###############################################################################
+# Python only: parameter sweeps
+###############################################################################
+
+def test_PsychrometricSweep():
+    Altitude = np.array([0., 1000, 2000])
+    TDryBulb = np.linspace(-10, 40, 11)
+    RelHum = np.linspace(0.1, 1, 4)
+    Airflow = np.array([1., 2])
+    Sweep = psychrolib.PsychrometricSweep(psychrolib.CalcPsychrometricsFromRelHum,
+                                          {'Altitude': Altitude, 'TDryBulb': TDryBulb, 'RelHum': RelHum,
+                                           'Airflow': Airflow},
+                                          Pressure = (psychrolib.GetStandardAtmPressure, 'Altitude'))
+    assert Sweep.UsedAxes == ('Altitude', 'TDryBulb', 'RelHum') and Sweep.Size == 132
+
+    Cube = Sweep.Evaluate(ChunkSize = 50)
+    Expected = psychrolib.CalcPsychrometricsFromRelHumArray(
+        TDryBulb[None, :, None], RelHum[None, None, :], psychrolib.GetStandardAtmPressureArray(Altitude)[:, None, None])
+    assert Cube['TWetBulb'].shape == (3, 11, 4, 2)
+    for Output, Value in zip(Sweep.Outputs, Expected):
+        assert Cube[Output][..., 0] == pytest.approx(Value, abs = 1e-3)
+        assert np.array_equal(Cube[Output][..., 0], Cube[Output][..., 1])
+    assert Sweep.Evaluate(ChunkSize = 40, Processes = 2)['HumRatio'] == pytest.approx(Cube['HumRatio'])
+    # More chunks than in flight, yielded in order
+    assert Sweep.Evaluate(ChunkSize = 5, Processes = 2)['HumRatio'] == pytest.approx(Cube['HumRatio'])
+
+    # The processes use the settings in use
+    psychrolib.SetValidation(False)
+    psychrolib.SetArrayDataType('float32')
+    try:
+        Supersaturated = psychrolib.PsychrometricSweep('GetHumRatioFromRelHum', {'TDryBulb': TDryBulb,
+                                                       'RelHum': [0.5, 1.5]}, Pressure = 101325)
+        assert np.array_equal(Supersaturated.Evaluate(Processes = 2)['HumRatio'],
+                              Supersaturated.Evaluate()['HumRatio'])
+    finally:
+        psychrolib.SetValidation(True)
+        psychrolib.SetArrayDataType('float64')
+
+    # Reductions, over kept used and unused axes
+    Maximum = Sweep.Reduce('max', Keep = ('Altitude', 'Airflow'), ChunkSize = 50)
+    assert Maximum['TDewPoint'] == pytest.approx(Cube['TDewPoint'].max(axis = (1, 2)))
+    Sum = Sweep.Reduce('sum', Keep = ('TDryBulb',), ChunkSize = 50)
+    assert Sum['MoistAirEnthalpy'] == pytest.approx(Cube['MoistAirEnthalpy'].sum(axis = (0, 2, 3)))
+    assert Sweep.Reduce('mean')['HumRatio'] == pytest.approx(Cube['HumRatio'].mean())
+
+    Sweep = psychrolib.PsychrometricSweep('GetTWetBulbFromRelHumArray', {'T': TDryBulb, 'RH': RelHum},
+                                          TDryBulb = 'T', RelHum = 'RH', Pressure = 101325)
+    assert Sweep.Outputs == ('TWetBulb',)
+    assert Sweep.Evaluate()['TWetBulb'] == pytest.approx(Cube['TWetBulb'][0, ..., 0], abs = 1e-3)
+    with pytest.raises(ValueError):
+        psychrolib.PsychrometricSweep('GetTWetBulbFromRelHum', {'TDryBulb': TDryBulb}, Pressure = 101325)
+    with pytest.raises(ValueError):
+        psychrolib.PsychrometricSweep('GetTWetBulbFromRelHum', {'TDryBulb': TDryBulb}, RelHum = 0.5, Pressure = 101325,
+                                      Altitude = 0)